@@ -0,0 +1,46 @@
+"""
+Chart cache: a cold run renders every chart, a rerun over unchanged
+histories reads them back from disk; a third run changes 10% of them.
+
+Run from the repository root:
+    python benchmarks/bench_chart_cache.py [repos] [png|svg]
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bench_charts import histories
+from src.seo_protocol.chart_cache import ChartCache
+from src.seo_protocol.charter import Charter
+
+
+def main():
+    repos = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    fmt = sys.argv[2] if len(sys.argv) > 2 else "png"
+    # bench_charts repeats series every 100 repos; make every history distinct
+    data = {repo: [{**row, "stars": row["stars"] + i} for row in history]
+            for i, (repo, history) in enumerate(histories(repos).items())}
+    changed = {repo: history + [{**history[-1], "ts": history[-1]["ts"] + 86400, "stars": history[-1]["stars"] + 1}]
+               if i % 10 == 0 else history
+               for i, (repo, history) in enumerate(data.items())}
+    Charter(fmt).generate_stars_trend_chart(data["owner/repo0"])  # import matplotlib up front
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{repos:,} repos x 90 points, {fmt}")
+        for label, batch in (("cold", data), ("warm", data), ("10% changed", changed)):
+            cache = ChartCache(tmp)  # a new run: index rebuilt from disk
+            charter = Charter(fmt, cache=cache)
+            start = time.perf_counter()
+            for history in batch.values():
+                charter.generate_stars_trend_chart(history)
+            elapsed = time.perf_counter() - start
+            stats = cache.stats()
+            print(f"  {label:<12} {repos / elapsed:9.1f} charts/s  hit rate {stats['hit_rate']:.0%}  "
+                  f"{stats['bytes_saved'] / 1e6:6.1f} MB saved")
+
+
+if __name__ == "__main__":
+    main()
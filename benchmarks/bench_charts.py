@@ -0,0 +1,83 @@
+"""
+Charts per second for 1,000 repositories (90 daily points each).
+
+Compares the previous pyplot approach (new figure + tight_layout per chart)
+with the reused Agg figure, the process pool and SVG sparklines.
+
+Run from the repository root:
+    python benchmarks/bench_charts.py [repos] [workers]
+"""
+import base64
+import os
+import sys
+import time
+from io import BytesIO
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.seo_protocol.charter import Charter
+
+
+def legacy_chart(historical_data: list[dict]) -> str:
+    """What generate_stars_trend_chart did before."""
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    dates = [d['date'] for d in historical_data]
+    stars = [d['stars'] for d in historical_data]
+    fig, ax = plt.subplots(figsize=(10, 5))
+    ax.plot(dates, stars, marker='o', linestyle='-', color='#1f77b4')
+    ax.set_title('Stars Growth Over Time')
+    ax.set_xlabel('Date')
+    ax.set_ylabel('Stars')
+    ax.grid(True, alpha=0.3)
+    plt.xticks(rotation=45)
+    plt.tight_layout()
+    buf = BytesIO()
+    fig.savefig(buf, format='png', dpi=100)
+    plt.close(fig)
+    return base64.b64encode(buf.getvalue()).decode('utf-8')
+
+
+def histories(repos: int, points: int = 90) -> dict[str, list[dict]]:
+    start = 1_700_000_000
+    out = {}
+    for r in range(repos):
+        stars = r % 50
+        rows = []
+        for d in range(points):
+            stars += (r + d) % 4
+            ts = start + d * 86400
+            rows.append({"ts": ts, "date": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(ts)),
+                         "stars": stars})
+        out[f"owner/repo{r}"] = rows
+    return out
+
+
+def main():
+    repos = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count()
+    data = histories(repos)
+    legacy_sample = dict(list(data.items())[:min(repos, 100)])
+    Charter().generate_stars_trend_chart(data["owner/repo0"])  # import matplotlib up front
+    legacy_chart(data["owner/repo0"])
+
+    cases = {
+        "pyplot, new figure each (before)": lambda: [legacy_chart(h) for h in legacy_sample.values()],
+        "Agg, reused figure": lambda: Charter().render_many(data, max_workers=1),
+        f"Agg, process pool ({workers} workers)": lambda: Charter().render_many(data, max_workers=workers),
+        "SVG sparkline": lambda: Charter("svg").render_many(data),
+    }
+    print(f"{repos:,} repos x 90 points, {os.cpu_count()} CPU(s)")
+    for label, run in cases.items():
+        start = time.perf_counter()
+        charts = run()
+        elapsed = time.perf_counter() - start
+        count = len(charts)
+        print(f"  {label:<36} {count / elapsed:8.1f} charts/s  ({elapsed * repos / count:6.1f} s per {repos:,})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Keyword suggestions and score cohorts from a corpus of 100,000 repositories.
+
+Builds a KeywordCorpus of synthetic repositories (~30 terms each, drawn
+Zipf-like from one of 2,000 themes, themes themselves Zipf-distributed,
+plus a few terms every theme shares), then times incremental
+updates, per-repository suggestions and score cohorts (at a quarter, half
+and all of the corpus), and compares neighbour search with a brute-force
+scan that scores every document in the corpus.
+
+Run from the repository root:
+    python benchmarks/bench_corpus.py [repositories]
+"""
+import random
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.seo_protocol.corpus import KeywordCorpus
+
+VOCABULARY = 20_000
+THEMES = 2_000
+
+
+def documents(count: int, seed: int = 5) -> dict[str, dict[str, int]]:
+    rng = random.Random(seed)
+    # Each theme draws most of its terms from its own slice of the vocabulary
+    themes = [[f"t{rng.randrange(VOCABULARY)}" for _ in range(60)] for _ in range(THEMES)]
+    theme_weights = [1 / (i + 1) ** 0.8 for i in range(THEMES)]
+    weights = [1 / (i + 1) for i in range(60)]
+    common = [f"c{i}" for i in range(200)]
+    docs = {}
+    for i in range(count):
+        theme = rng.choices(themes, theme_weights)[0]
+        terms = Counter(rng.choices(theme, weights, k=rng.randint(15, 35)))
+        terms.update(rng.choices(common, k=5))
+        docs[f"user{i}/repo{i}"] = dict(terms)
+    return docs
+
+
+def brute_force_similar(corpus: KeywordCorpus, repo: str, k: int) -> list[float]:
+    """Cosines of the ``k`` most similar documents, scoring every document."""
+    query = corpus._weights(corpus._docs[repo])
+    scores = {}
+    for other, doc in corpus._docs.items():
+        if other != repo:
+            weights = corpus._weights(doc)
+            scores[other] = sum(w * weights.get(t, 0.0) for t, w in query.items())
+    return sorted(scores.values(), reverse=True)[:k]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    docs = documents(count)
+    corpus = KeywordCorpus()
+
+    # Cohort queries as the corpus grows: the cost follows the postings
+    # touched, not the number of repositories
+    checkpoints = {count // 4, count // 2, count}
+    rng = random.Random(1)
+    built = 0.0
+    for i, (repo, terms) in enumerate(docs.items(), 1):
+        start = time.perf_counter()
+        corpus.add(repo, terms, rng.uniform(0, 100))
+        built += time.perf_counter() - start
+        if i in checkpoints:
+            sample = random.Random(i).sample(list(corpus._docs), 200)
+            start = time.perf_counter()
+            for other in sample:
+                corpus.cohort(other)
+            elapsed = time.perf_counter() - start
+            print(f"  cohort (25 peers) at {i:>7,} repos {elapsed / len(sample) * 1000:8.2f} ms/repo")
+    print(f"{count:,} repositories, {corpus.stats()['terms']:,} terms; "
+          f"built incrementally in {built:.1f} s ({count / built:,.0f} adds/s)")
+
+    rng = random.Random(1)
+    sample = rng.sample(list(docs), 200)
+    start = time.perf_counter()
+    for repo in sample:
+        corpus.suggest(repo)
+    elapsed = time.perf_counter() - start
+    print(f"  suggest (25 neighbours)          {elapsed / len(sample) * 1000:8.2f} ms/repo")
+
+    start = time.perf_counter()
+    for i, repo in enumerate(sample):
+        corpus.add(repo, {**docs[repo], f"new{i}": 1}, 50.0)
+    elapsed = time.perf_counter() - start
+    print(f"  update one repository            {elapsed / len(sample) * 1000:8.2f} ms/repo")
+
+    few = sample[:5]
+    start = time.perf_counter()
+    exact = [brute_force_similar(corpus, repo, 10) for repo in few]
+    elapsed = time.perf_counter() - start
+    print(f"  brute-force similarity scan      {elapsed / len(few) * 1000:8.2f} ms/repo")
+    # Neighbours within a theme are near ties, so compare similarity rather than identity
+    found = sum(s for repo in few for _, s in corpus.similar(repo, 10))
+    best = sum(s for e in exact for s in e)
+    print(f"  mean cosine of top-10 neighbours vs. the exact scan: {found / best:.1%}")
+
+
+if __name__ == "__main__":
+    main()
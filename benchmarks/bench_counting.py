@@ -0,0 +1,47 @@
+"""
+Contributor counting: full pagination vs. per_page=1 + Link header (+ cache).
+
+Run from the repository root:
+    python benchmarks/bench_counting.py
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from github import Github
+from fake_github import FakeGitHub
+from src.seo_protocol.github_api import CountCache, GitHubAPI
+
+REPOS = {
+    "bench/small": {"contributors": 250, "commits": 5_000},
+    "bench/large": {"contributors": 12_000, "commits": 80_000},
+    "bench/huge": {"contributors": 30_000, "commits": 250_000},
+}
+
+
+def main():
+    with FakeGitHub(REPOS) as fake:
+        client = Github(base_url=fake.base_url, per_page=100, seconds_between_requests=None)
+        print(f"{'repo':<14}{'method':<22}{'count':>8}{'requests':>10}{'KiB':>10}{'ms':>10}")
+        for name in REPOS:
+            api = GitHubAPI("", name, client=client, counts=CountCache())
+
+            runs = [
+                ("paginate (baseline)", lambda: len(list(api.repo.get_contributors()))),
+                ("link header", lambda: api.count_items("contributors")),
+                ("link header, cached", lambda: api.count_items("contributors")),
+            ]
+            for label, count in runs:
+                fake.reset_counters()
+                start = time.perf_counter()
+                total = count()
+                elapsed = (time.perf_counter() - start) * 1000
+                print(f"{name:<14}{label:<22}{total:>8}{fake.requests:>10}"
+                      f"{fake.bytes_sent / 1024:>10.1f}{elapsed:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Fleet report throughput and peak memory for growing fleets: memory should
+stay flat because rows are streamed and only one HTML page is held.
+
+Run from the repository root:
+    python benchmarks/bench_fleet_report.py
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.seo_protocol.seo_report import SEOReport, fleet_row
+
+SIZES = (1_000, 10_000, 50_000)
+
+
+def rows(count: int):
+    for i in range(count):
+        data = {"repo": f"owner/repo{i}", "score": 30 + i % 70, "metrics": {"stars": 100 + i % 900},
+                "suggestions": ["ALERT: Visibility score is low", "Add topics", "Add a license"]}
+        history = [{"stars": 100 + i % 900 - 30 + d, "score": 30 + i % 70} for d in range(30)]
+        yield fleet_row(data, history)
+
+
+def main():
+    SEOReport().write_fleet(rows(1), os.devnull, "md")  # warm-up
+    with tempfile.TemporaryDirectory() as tmp:
+        for fmt in ("html", "md", "jsonl"):
+            for size in SIZES:
+                tracemalloc.start()
+                start = time.perf_counter()
+                paths = SEOReport().write_fleet(rows(size), os.path.join(tmp, f"fleet.{fmt}"), fmt)
+                elapsed = time.perf_counter() - start
+                peak_bytes = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                print(f"  {fmt:<5} {size:>7,} repos  {size / elapsed:9.0f} repos/s  "
+                      f"peak {peak_bytes / 1024:7.0f} KiB  {len(paths)} file(s)")
+
+
+if __name__ == "__main__":
+    main()
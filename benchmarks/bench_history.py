@@ -0,0 +1,122 @@
+"""
+Storage cost and query time of the metrics history: one year of daily
+snapshots for 1,000 repositories.
+
+Compares the packed varint blob used by Monitor with one INTEGER column per
+metric and with a JSON text column (same (repo, ts) key for all three), then
+times Monitor.get_historical_data over the full year.
+
+Run from the repository root:
+    python benchmarks/bench_history.py [repos] [days]
+"""
+import json
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.seo_protocol.metrics_codec import DEFAULT_LAYOUT, pack
+from src.seo_protocol.monitor import Monitor
+
+FIELDS = [name for name, _ in DEFAULT_LAYOUT]
+DAY = 86400
+
+
+def simulate(repos: int, days: int):
+    """Yield (day, [(repo, metrics, score), ...]) with slowly growing counters."""
+    rng = random.Random(7)
+    state = {}
+    for r in range(repos):
+        stars = int(rng.paretovariate(1.2) * 20)
+        state[f"owner{r % 97}/repo{r}"] = {
+            "stars": stars, "forks": stars // 8, "watchers": stars,
+            "contributors": 1 + stars // 50, "commits": rng.randint(10, 5000),
+            "issues": rng.randint(0, 60), "views_last_14d": stars * 3,
+            "clones_last_14d": stars // 2, "has_readme": rng.random() < 0.9,
+            "has_license": rng.random() < 0.7,
+        }
+    for day in range(days):
+        batch = []
+        for repo, m in state.items():
+            m["stars"] += rng.randint(0, 3)
+            m["watchers"] = m["stars"]
+            m["forks"] += rng.random() < 0.2
+            m["commits"] += rng.randint(0, 4)
+            m["issues"] = max(0, m["issues"] + rng.randint(-2, 2))
+            m["views_last_14d"] = max(0, m["views_last_14d"] + rng.randint(-50, 50))
+            m["clones_last_14d"] = max(0, m["clones_last_14d"] + rng.randint(-5, 5))
+            batch.append((repo, dict(m), round(rng.uniform(20, 90), 2)))
+        yield day, batch
+
+
+def file_size(path: str) -> int:
+    return sum(os.path.getsize(p) for p in (path, path + "-wal") if os.path.exists(p))
+
+
+def raw_table_sizes(tmp: str, repos: int, days: int, start: int) -> dict:
+    layouts = {
+        "packed blob": ("packed BLOB", lambda m: (pack(m, 1, DEFAULT_LAYOUT),)),
+        "column per metric": (", ".join(f"{f} INTEGER" for f in FIELDS),
+                              lambda m: tuple(int(m[f]) for f in FIELDS)),
+        "json text": ("doc TEXT", lambda m: (json.dumps(m),)),
+    }
+    sizes = {}
+    for label, (columns, encode) in layouts.items():
+        path = os.path.join(tmp, label.replace(" ", "_") + ".db")
+        conn = sqlite3.connect(path)
+        conn.execute(f"CREATE TABLE m (repo TEXT, ts INTEGER, score REAL, {columns}, "
+                     f"PRIMARY KEY (repo, ts)) WITHOUT ROWID")
+        width = len(encode({f: 0 for f in FIELDS}))
+        sql = f"INSERT INTO m VALUES (?, ?, ?{', ?' * width})"
+        for day, batch in simulate(repos, days):
+            conn.executemany(sql, [(repo, start + day * DAY, score, *encode(m)) for repo, m, score in batch])
+        conn.commit()
+        conn.execute("VACUUM")
+        conn.close()
+        sizes[label] = file_size(path) / (repos * days)
+    return sizes
+
+
+def main():
+    repos = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    days = int(sys.argv[2]) if len(sys.argv) > 2 else 365
+    start = int(time.time()) // DAY * DAY - days * DAY
+    print(f"{repos:,} repos x {days} days = {repos * days:,} snapshots")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print("\nraw table size (incl. key and score), bytes/snapshot")
+        for label, size in raw_table_sizes(tmp, repos, days, start).items():
+            print(f"  {label:<20} {size:8.1f}")
+        print(f"  packed blob alone    {len(pack(next(simulate(1, 1))[1][0][1], 1, DEFAULT_LAYOUT)):8d}")
+
+        path = os.path.join(tmp, "monitor.db")
+        monitor = Monitor(path, retention_days={"raw": days + 1})
+        load = time.perf_counter()
+        for day, batch in simulate(repos, days):
+            monitor.save_many(batch, ts=start + day * DAY)
+        load = time.perf_counter() - load
+        monitor.close()
+        print(f"\nMonitor database (raw + hourly/daily/weekly rollups): "
+              f"{file_size(path) / (repos * days):.1f} bytes/snapshot, loaded in {load:.1f} s")
+
+        monitor = Monitor(path, retention_days={"raw": days + 1})
+        names = [f"owner{r % 97}/repo{r}" for r in random.Random(1).sample(range(repos), 100)]
+        for label, resolution in (("raw, every snapshot", 1), ("default (~500 points)", None),
+                                  ("weekly rollup", 7 * DAY)):
+            begin = time.perf_counter()
+            points = sum(len(monitor.get_historical_data(n, days, resolution)) for n in names)
+            elapsed = (time.perf_counter() - begin) / len(names)
+            print(f"  1-year query, {label:<22} {elapsed * 1000:7.2f} ms/repo  "
+                  f"({points // len(names)} points, all metrics decoded)")
+        monitor.close()
+
+
+if __name__ == "__main__":
+    import logging
+    logging.disable(logging.INFO)
+    main()
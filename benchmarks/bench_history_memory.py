@@ -0,0 +1,80 @@
+"""
+Peak memory of reading a long history: get_historical_data (list of dicts)
+vs. iter_history (streamed tuples) vs. get_history_columns (NumPy arrays).
+
+Run from the repository root:
+    python benchmarks/bench_history_memory.py
+"""
+import logging
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.seo_protocol.monitor import Monitor
+
+STEP = 300                       # one snapshot every 5 minutes
+SIZES = (1_000, 10_000, 100_000)
+
+
+def populate(monitor: Monitor, repo: str, rows: int):
+    start = int(time.time()) - rows * STEP
+    metrics = {"stars": 100, "forks": 10, "watchers": 100, "contributors": 3, "commits": 500,
+               "issues": 4, "views_last_14d": 900, "clones_last_14d": 40,
+               "has_readme": True, "has_license": True}
+    with monitor.session():
+        for i in range(rows):
+            metrics["stars"] += i % 3 == 0
+            monitor.save_many([(repo, metrics, 50.0 + i % 7)], ts=start + i * STEP)
+
+
+def peak(read) -> tuple[float, float]:
+    tracemalloc.start()
+    begin = time.perf_counter()
+    read()
+    elapsed = time.perf_counter() - begin
+    peak_bytes = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak_bytes / 1024, elapsed * 1000
+
+
+def main():
+    import numpy  # noqa: F401  (imported up front so it is not counted in the first read)
+    with tempfile.TemporaryDirectory() as tmp:
+        monitor = Monitor(os.path.join(tmp, "history.db"), retention_days={"raw": None})
+        for rows in SIZES:
+            populate(monitor, f"owner/repo{rows}", rows)
+
+        def readers(repo, days):
+            def as_dicts():
+                return len(monitor.get_historical_data(repo, days, resolution=1))
+
+            def streamed():
+                best = 0
+                for row in monitor.iter_history(repo, days, resolution=1):
+                    best = max(best, row.stars)
+                return best
+
+            def columnar():
+                return monitor.get_history_columns(repo, days, resolution=1)["stars"].max()
+
+            return {"list of dicts": as_dicts, "iter_history": streamed,
+                    "get_history_columns": columnar}
+
+        print("peak memory and time, both measured under tracemalloc")
+        print(f"{'rows':>8}  {'reader':<20} {'peak KiB':>10} {'ms':>9}")
+        for rows in SIZES:
+            days = rows * STEP // 86400 + 1
+            for label, read in readers(f"owner/repo{rows}", days).items():
+                kib, ms = peak(read)
+                print(f"{rows:>8,}  {label:<20} {kib:>10,.0f} {ms:>9.1f}")
+        monitor.close()
+
+
+if __name__ == "__main__":
+    logging.disable(logging.INFO)
+    main()
@@ -0,0 +1,84 @@
+"""
+Keyword extraction over 10,000 repository descriptions.
+
+Compares the previous extract_keywords (stopword set rebuilt per call,
+isalnum tokens, set difference against the 11 built-in terms) with the
+KeywordExtractor on the bundled vocabulary and on 5,000 generated trend
+terms (at most 25 suggestions), where a naive matcher has to test every
+term against every text.
+
+Run from the repository root:
+    python benchmarks/bench_keywords.py [descriptions]
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.seo_protocol.keywords import (ENGLISH_STOPWORDS, KeywordExtractor, TrendIndex, load_trend_index,
+                                       phrase_tokens, simple_tokenize)
+
+WORDS = ("solidity smart contract toolkit for defi protocols audit layer2 rollup zero knowledge proof "
+         "wallet bridge ethereum client fast secure minimal library framework rust python typescript "
+         "indexer oracle governance token staking validator node sdk cli").split()
+
+
+def descriptions(count: int) -> list[tuple[str, list[str]]]:
+    rng = random.Random(7)
+    return [(" ".join(rng.choice(WORDS) for _ in range(rng.randint(6, 18))).capitalize(),
+             [rng.choice(WORDS) for _ in range(rng.randint(0, 5))])
+            for _ in range(count)]
+
+
+def vocabulary(size: int) -> list[str]:
+    rng = random.Random(11)
+    terms = dict.fromkeys(load_trend_index().ordered)
+    while len(terms) < size:
+        terms["-".join(rng.choice(WORDS) for _ in range(rng.randint(1, 3)))] = None
+    return list(terms)
+
+
+def legacy_extract(description: str, topics: list[str], trends: frozenset) -> tuple[list[str], set[str]]:
+    """What extract_keywords did before."""
+    text = description.lower() + " " + " ".join(t.lower() for t in topics)
+    stop_words = set(ENGLISH_STOPWORDS)           # rebuilt on every call
+    keywords = [w for w in simple_tokenize(text) if w.isalnum() and w not in stop_words]
+    return keywords, trends - set(keywords)
+
+
+def naive_phrases(description: str, topics: list[str], terms: list[tuple[str, tuple]]) -> set[str]:
+    """Phrase-aware matching without an automaton: every term against every text."""
+    words = [w for token in simple_tokenize(description.lower() + " " + " ".join(topics).lower())
+             for w in phrase_tokens(token)]
+    text = " " + " ".join(words) + " "
+    return {term for term, parts in terms if " " + " ".join(parts) + " " in text}
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    data = descriptions(count)
+    bundled = load_trend_index()
+    large_terms = vocabulary(5000)
+    start = time.perf_counter()
+    large = TrendIndex(large_terms)
+    built = time.perf_counter() - start
+    naive_terms = [(t, phrase_tokens(t)) for t in large_terms[:500]]
+
+    cases = {
+        "before: per-call stopwords, 11 terms": lambda: [legacy_extract(d, t, bundled.all_terms) for d, t in data],
+        "extractor, 11 terms": lambda: list(KeywordExtractor("simple", bundled).extract_many(data)),
+        "naive phrase scan, 500 terms": lambda: [naive_phrases(d, t, naive_terms) for d, t in data],
+        "extractor, 5,000 terms": lambda: list(KeywordExtractor("simple", large).extract_many(data)),
+    }
+    print(f"{count:,} descriptions; 5,000-term automaton built in {built * 1000:.0f} ms")
+    for label, run in cases.items():
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        print(f"  {label:<40} {count / elapsed:9.0f} descriptions/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Monitor write throughput: one connection per call (previous behaviour)
+vs. the persistent per-thread connection, with and without a session,
+and bulk ingestion with save_many.
+
+Run from the repository root:
+    python benchmarks/bench_monitor.py [snapshots]
+"""
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.seo_protocol.monitor import Monitor
+
+METRICS = {"stars": 120, "forks": 14}
+
+
+def legacy_save(db_path: str, repo: str, metrics: dict, score: float):
+    """What save_current_metrics did before: a fresh connection and commit per call."""
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("""
+            INSERT OR REPLACE INTO metrics (repo, date, stars, forks, score)
+            VALUES (?, ?, ?, ?, ?)
+        """, (repo, datetime.utcnow().isoformat(), metrics.get('stars'), metrics.get('forks'), score))
+        conn.commit()
+
+
+def run(label: str, snapshots: int, write):
+    start = time.perf_counter()
+    write(snapshots)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<34} {elapsed:8.2f} s  {snapshots / elapsed:10,.0f} writes/s")
+
+
+def main():
+    snapshots = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"snapshots: {snapshots:,}")
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_path = os.path.join(tmp, "legacy.db")
+        with sqlite3.connect(legacy_path) as conn:
+            conn.execute("""
+                CREATE TABLE metrics (
+                    repo TEXT NOT NULL,
+                    date TEXT NOT NULL,
+                    stars INTEGER,
+                    forks INTEGER,
+                    score REAL,
+                    PRIMARY KEY (repo, date)
+                )
+            """)
+
+        def legacy(n):
+            for i in range(n):
+                legacy_save(legacy_path, f"owner/repo{i}", METRICS, 50.0)
+        run("connection per call (before)", snapshots, legacy)
+
+        monitor = Monitor(os.path.join(tmp, "pooled.db"))
+
+        def per_call(n):
+            for i in range(n):
+                monitor.save_current_metrics(f"owner/repo{i}", METRICS, 50.0)
+        run("persistent connection, WAL", snapshots, per_call)
+
+        def in_session(n):
+            with monitor.session():
+                for i in range(n):
+                    monitor.save_current_metrics(f"owner/batch{i}", METRICS, 50.0)
+        run("persistent connection, session()", snapshots, in_session)
+
+        def bulk(n):
+            monitor.save_many((f"owner/bulk{i}", METRICS, 50.0) for i in range(n))
+        run("save_many (executemany, chunked)", snapshots, bulk)
+        monitor.close()
+
+
+if __name__ == "__main__":
+    main()
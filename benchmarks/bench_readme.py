@@ -0,0 +1,89 @@
+"""
+README statistics for 1,000 repositories.
+
+Compares a whole-document analysis (one regex pass per feature over the
+text in memory) with the line-by-line MarkdownScanner, and with a rerun
+where every README's blob SHA is unchanged and the statistics come from the
+monitor database. The scanner is slower per byte than a few whole-text
+regexes (it works per line and also tracks setext/HTML headings, tables
+and images) but never holds the document; the rerun skips both the
+download and the parse.
+
+Run from the repository root:
+    python benchmarks/bench_readme.py [repositories]
+"""
+import io
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.seo_protocol.monitor import Monitor
+from src.seo_protocol.readme import analyze_readme, keywords_key
+
+KEYWORDS = ["solidity", "defi", "web3", "zk", "layer2"]
+WORDS = ("solidity smart contract toolkit for defi protocols audit layer2 rollup zero knowledge proof "
+         "wallet bridge ethereum client fast secure minimal library framework the a of and to").split()
+
+
+def readme(rng: random.Random) -> str:
+    parts = [f"# Project {rng.randint(0, 10**6)}",
+             "[![Build](https://img.shields.io/badge/build-passing-green.svg)](https://ci.example.com)", ""]
+    for section in range(rng.randint(3, 10)):
+        parts += [f"## Section {section}", ""]
+        parts += [" ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 20))) + "."
+                  for _ in range(rng.randint(2, 8))]
+        parts += ["", "```python", "import solkit", "solkit.scan('contracts/')", "```", ""]
+        parts += [f"- [{w}](https://example.com/{w})" for w in rng.sample(WORDS, 4)]
+        parts.append("")
+    return "\n".join(parts)
+
+
+def naive_stats(text: str, keywords: list[str]) -> dict:
+    """Whole document in memory, one regex pass per feature."""
+    prose = re.sub(r"```.*?```", " ", text, flags=re.S)
+    words = re.findall(r"\w+", prose.lower())
+    return {
+        "headings": len(re.findall(r"^#{1,6}\s", prose, re.M)),
+        "code_blocks": len(re.findall(r"```.*?```", text, re.S)),
+        "badges": len(re.findall(r"shields\.io", text)),
+        "links": len(re.findall(r"\]\(", text)),
+        "list_items": len(re.findall(r"^\s*[-*+]\s", prose, re.M)),
+        "words": len(words),
+        "keyword_hits": {k: words.count(k) for k in keywords},
+    }
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    rng = random.Random(3)
+    docs = [(f"user/repo{i}", f"sha{i}", readme(rng)) for i in range(count)]
+    total = sum(len(text) for _, _, text in docs)
+    key = keywords_key(KEYWORDS)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        monitor = Monitor(os.path.join(tmp, "bench.db"))
+        for repo, sha, text in docs:
+            monitor.save_readme_stats(repo, sha, key, {"sha": sha, **analyze_readme(io.StringIO(text), KEYWORDS)})
+
+        cases = {
+            "whole text, regex pass per feature": lambda: [naive_stats(text, KEYWORDS) for _, _, text in docs],
+            "line-by-line scanner": lambda: [analyze_readme(io.StringIO(text), KEYWORDS) for _, _, text in docs],
+            "unchanged SHA, cached stats": lambda: [monitor.get_readme_stats(repo, sha, key) for repo, sha, _ in docs],
+        }
+        print(f"{count:,} READMEs, {total / 1024:.0f} KiB")
+        for label, run in cases.items():
+            start = time.perf_counter()
+            run()
+            elapsed = time.perf_counter() - start
+            print(f"  {label:<34} {count / elapsed:9.0f} READMEs/s")
+        monitor.close()
+
+
+if __name__ == "__main__":
+    main()
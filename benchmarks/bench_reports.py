@@ -0,0 +1,84 @@
+"""
+HTML reports per second and peak memory for 5,000 repositories, each
+with a ~40 KB base64 chart.
+
+Compares the previous renderer (new Environment + template compilation per
+report, whole document in memory) with the shared compiled template and
+with ``SEOReport.write`` streaming chunks to the file.
+
+Run from the repository root:
+    python benchmarks/bench_reports.py [repos]
+"""
+import base64
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.seo_protocol.seo_report import HTML_TEMPLATE, SEOReport
+
+CHART = base64.b64encode(os.urandom(30_000)).decode()
+
+
+def report_data(i: int) -> dict:
+    return {
+        "repo": f"owner/repo{i}",
+        "score": 40 + i % 60,
+        "metrics": {"stars": i, "forks": i // 3, "watchers": i, "contributors": 4, "commits": 900,
+                    "issues": 12, "has_readme": True, "has_license": i % 2 == 0},
+        "suggestions": ["ALERT: Visibility score is low", "Add a license", "Use trending keywords"],
+        "trends": {"stars": {"velocity_per_day": 1.5, "rolling_mean": float(i), "forecast": [i + 7.0],
+                             "anomalies": []}},
+        "metadata": {"http_cache": {"hits": i, "misses": 2}},
+    }
+
+
+def legacy_write(path: str, data: dict, report: SEOReport):
+    """What _publish did before: compile the template, render, write the string."""
+    import jinja2
+
+    env = jinja2.Environment(loader=jinja2.DictLoader({"report": HTML_TEMPLATE}))
+    html = env.get_template("report").render(**report._html_context(data, CHART, "image/png"))
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(html)
+
+
+def cached_write(path: str, data: dict, report: SEOReport):
+    html = report.generate(data, "html", CHART)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(html)
+
+
+def streamed_write(path: str, data: dict, report: SEOReport):
+    report.write(path, data, "html", CHART)
+
+
+def main():
+    repos = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    report = SEOReport()
+    cases = {
+        "new Environment per report (before)": legacy_write,
+        "cached template, generate()": cached_write,
+        "cached template, write() streamed": streamed_write,
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "report.html")
+        legacy_write(path, report_data(0), report)   # import jinja2 up front
+        print(f"{repos:,} HTML reports, {len(CHART) // 1024} KB chart each")
+        for label, write in cases.items():
+            tracemalloc.start()
+            start = time.perf_counter()
+            for i in range(repos):
+                write(path, report_data(i), report)
+            elapsed = time.perf_counter() - start
+            peak_bytes = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"  {label:<38} {repos / elapsed:8.0f} reports/s  peak {peak_bytes / 1024:7.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Scalar vs. vectorized visibility scoring over 1M rows.
+
+Each path is timed REPEAT times and the best run is reported, as timeit
+does; single runs on a busy machine swing by 20% or more either way.
+
+Run from the repository root:
+    python benchmarks/bench_scoring.py [rows]
+"""
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.seo_protocol.seo_analyzer import SEOAnalyzer
+
+COUNT_COLUMNS = ("stars", "forks", "watchers", "commits", "issues",
+                 "views_last_14d", "clones_last_14d", "contributors", "keyword_count")
+REPEAT = 3
+
+
+def make_table(rows: int) -> dict:
+    rng = np.random.default_rng(42)
+    table = {name: rng.integers(0, 2_000, rows) for name in COUNT_COLUMNS}
+    table["keyword_count"] = rng.integers(0, 20, rows)
+    table["has_readme"] = rng.random(rows) < 0.8
+    table["has_license"] = rng.random(rows) < 0.6
+    return table
+
+
+def best_of(fn):
+    timings = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    return result, min(timings)
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    table = make_table(rows)
+    with patch("src.seo_protocol.seo_analyzer.GitHubAPI"):
+        analyzer = SEOAnalyzer("bench-token", "bench/repo")
+
+    records = [{name: table[name][i].item() for name in table} for i in range(rows)]
+    scalar, scalar_s = best_of(
+        lambda: [analyzer.compute_visibility_score(r, range(r["keyword_count"])) for r in records])
+    vector, vector_s = best_of(lambda: SEOAnalyzer.compute_visibility_scores(table))
+
+    mismatches = int(np.count_nonzero(np.asarray(scalar) != vector))
+    print(f"rows: {rows:,}")
+    print(f"scalar     {scalar_s:8.3f} s  ({rows / scalar_s:12,.0f} rows/s)")
+    print(f"vectorized {vector_s:8.3f} s  ({rows / vector_s:12,.0f} rows/s)")
+    print(f"speedup    {scalar_s / vector_s:8.1f}x   mismatches: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
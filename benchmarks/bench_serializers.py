@@ -0,0 +1,68 @@
+"""
+Serialize / deserialize throughput and output size of 5,000 analysis
+results (with a keyword set, datetimes and a trends section) per format
+and backend.
+
+Run from the repository root:
+    python benchmarks/bench_serializers.py [results]
+"""
+import json
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.seo_protocol import serializers
+
+
+def result(i: int) -> dict:
+    return {
+        "repo": f"owner/repo{i}",
+        "score": 35 + (i * 7) % 60 + 0.25,
+        "metrics": {"stars": 100 + i, "forks": i // 3, "watchers": 100 + i, "contributors": 5,
+                    "commits": 1200 + i, "issues": 17, "views_last_14d": 900, "clones_last_14d": 40,
+                    "has_readme": True, "has_license": i % 2 == 0},
+        "keywords": ["solidity", "smart", "contracts", "defi", "audit"],
+        "suggested_keywords": {"web3", "blockchain", "ai", "llm"},
+        "suggestions": ["ALERT: Visibility score is low", "Add topics", "Use trending keywords"],
+        "trends": {m: {"velocity_per_day": 1.25, "rolling_mean": 100.5, "forecast": [101.0 + d for d in range(7)],
+                       "anomalies": []} for m in ("stars", "forks", "score")},
+        "analyzed_at": datetime(2025, 1, 1, tzinfo=timezone.utc) + timedelta(minutes=i),
+    }
+
+
+def stdlib_dumps(obj):
+    """What the JSON report did before (with a default hook, as sets made it fail)."""
+    return json.dumps(obj, indent=2, default=serializers.to_builtin).encode("utf-8")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    data = [result(i) for i in range(count)]
+    json_backend, msgpack_backend = serializers.get("json"), serializers.get("msgpack")
+    cases = {
+        "json (stdlib, indent=2, before)": (stdlib_dumps, json.loads),
+        "json (stdlib, compact)": (serializers._stdlib_json_dumps, json.loads),
+        f"json ({json_backend.backend}, indent=2)": (lambda o: json_backend.dumps(o, pretty=True), json_backend.loads),
+        f"json ({json_backend.backend}, compact)": (json_backend.dumps, json_backend.loads),
+        f"msgpack ({msgpack_backend.backend})": (msgpack_backend.dumps, msgpack_backend.loads),
+        "msgpack (pure Python)": (serializers.msgpack_dumps, serializers.msgpack_loads),
+    }
+    print(f"{count:,} analysis results")
+    print(f"  {'format':<32} {'dumps/s':>10} {'loads/s':>10} {'bytes/result':>13}")
+    for label, (dumps, loads) in cases.items():
+        start = time.perf_counter()
+        encoded = [dumps(d) for d in data]
+        dumped = time.perf_counter() - start
+        start = time.perf_counter()
+        for blob in encoded:
+            loads(blob)
+        loaded = time.perf_counter() - start
+        size = sum(len(blob) for blob in encoded) / count
+        print(f"  {label:<32} {count / dumped:10.0f} {count / loaded:10.0f} {size:13.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Cold-start time of the CLI and of a full single-repo run.
+
+Each measurement is a fresh interpreter; the full run analyzes one repo on
+a local fake GitHub server and writes a JSON report into a temp directory.
+
+Run from the repository root:
+    python benchmarks/bench_startup.py [runs]
+"""
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from fake_github import FakeGitHub
+
+FULL_RUN = """
+import sys
+from src.seo_protocol import SEOProtocol
+from src.seo_protocol.github_api import SharedGitHubClient
+from src.seo_protocol.seo_analyzer import SEOAnalyzer
+
+client = SharedGitHubClient("bench-token", base_url=sys.argv[1])
+analyzer = SEOAnalyzer("bench-token", "bench/repo", client=client.get())
+SEOProtocol("bench/repo", "bench-token", analyzer=analyzer, http_cache_path=None).run_pipeline("json")
+"""
+
+
+def cold_start(args: list[str], cwd: str, runs: int) -> list[float]:
+    env = {**os.environ, "PYTHONPATH": str(ROOT)}
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], cwd=cwd, env=env, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    with FakeGitHub({"bench/repo": {"contributors": 50, "commits": 500}}) as fake, \
+            tempfile.TemporaryDirectory() as tmp:
+        cases = {
+            "seo_protocol_cli.py --help": [str(ROOT / "seo_protocol_cli.py"), "--help"],
+            "full single-repo run (json)": ["-c", FULL_RUN, fake.base_url],
+        }
+        for label, args in cases.items():
+            timings = cold_start(args, tmp, runs)
+            print(f"{label:<30} median {statistics.median(timings):8.1f} ms"
+                  f"   min {min(timings):8.1f} ms   ({runs} runs)")
+
+
+if __name__ == "__main__":
+    main()
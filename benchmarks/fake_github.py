@@ -0,0 +1,115 @@
+"""
+Minimal local stand-in for the GitHub REST API used by the benchmarks.
+
+Serves /repos/{owner}/{repo}, paginated /contributors and /commits
+listings with real ``Link`` headers, topics, README and traffic, and
+counts every request it answers.
+"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+class FakeGitHub:
+
+    def __init__(self, repos: dict[str, dict]):
+        """``repos`` maps 'owner/name' to {'contributors': n, 'commits': n}."""
+        self.repos = repos
+        self.requests = 0
+        self.bytes_sent = 0
+        self._lock = threading.Lock()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.base_url = f"http://127.0.0.1:{self.server.server_port}"
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def reset_counters(self):
+        with self._lock:
+            self.requests = 0
+            self.bytes_sent = 0
+
+    def repo_json(self, full_name: str) -> dict:
+        owner, name = full_name.split("/")
+        return {
+            "id": abs(hash(full_name)) % 10**8,
+            "name": name,
+            "full_name": full_name,
+            "owner": {"login": owner},
+            "url": f"{self.base_url}/repos/{full_name}",
+            "description": "Benchmark repository",
+            "pushed_at": "2025-03-01T00:00:00Z",
+            "stargazers_count": 1000,
+            "forks_count": 100,
+            "watchers_count": 1000,
+            "open_issues_count": 10,
+            "license": None,
+        }
+
+    def listing_page(self, full_name: str, listing: str, query: dict) -> tuple[list, str | None]:
+        total = self.repos[full_name][listing]
+        per_page = int(query.get("per_page", ["30"])[0])
+        page = int(query.get("page", ["1"])[0])
+        start = (page - 1) * per_page
+        items = [{"login": f"user{i}", "id": i, "contributions": 1}
+                 for i in range(start, min(start + per_page, total))]
+
+        last = max(1, -(-total // per_page))
+        url = f"{self.base_url}/repos/{full_name}/{listing}?per_page={per_page}"
+        links = []
+        if page < last:
+            links.append(f'<{url}&page={page + 1}>; rel="next"')
+            links.append(f'<{url}&page={last}>; rel="last"')
+        return items, ", ".join(links) or None
+
+    def _handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                parts = url.path.strip("/").split("/")
+                link = None
+                if len(parts) >= 3 and parts[0] == "repos" and f"{parts[1]}/{parts[2]}" in fake.repos:
+                    full_name = f"{parts[1]}/{parts[2]}"
+                    if len(parts) == 3:
+                        body = fake.repo_json(full_name)
+                    elif len(parts) == 4 and parts[3] in ("contributors", "commits"):
+                        body, link = fake.listing_page(full_name, parts[3], parse_qs(url.query))
+                    elif parts[3:] == ["topics"]:
+                        body = {"names": ["blockchain", "solidity"]}
+                    elif parts[3:] == ["readme"]:
+                        body = {"type": "file", "name": "README.md", "path": "README.md",
+                                "sha": "0" * 40, "encoding": "base64", "content": "IyBSZWFkbWUK"}
+                    elif parts[3:4] == ["traffic"] and parts[4:] in (["views"], ["clones"]):
+                        body = {"count": 120, "uniques": 40, parts[4]: []}
+                    else:
+                        return self._send(404, {"message": "Not Found"})
+                    return self._send(200, body, link)
+                self._send(404, {"message": "Not Found"})
+
+            def _send(self, status, body, link=None):
+                payload = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                if link:
+                    self.send_header("Link", link)
+                self.end_headers()
+                self.wfile.write(payload)
+                with fake._lock:
+                    fake.requests += 1
+                    fake.bytes_sent += len(payload)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
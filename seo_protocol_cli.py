@@ -1,25 +1,71 @@
 
 import argparse
 import logging
-from seo_protocol import SEOProtocol
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 def parse_arguments():
     parser = argparse.ArgumentParser(description="GitHub SEO Protocol MVP")
-    parser.add_argument("--repo", required=True, help="Repo name (username/repo)")
-    parser.add_argument("--gh-token", required=True, help="GitHub token (read-only)")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--repo", help="Repo name (username/repo)")
+    target.add_argument("--repos-file", help="File with one repo name per line (batch mode)")
+    parser.add_argument("--gh-token", required=True, nargs="+",
+                        help="GitHub token(s) (read-only); several tokens are pooled")
     parser.add_argument("--google-json", default=None, help="Google service account JSON (optional)")
-    parser.add_argument("--output", default="md", choices=["md", "json", "html"], help="Report format")
+    parser.add_argument("--output", default="md", choices=["md", "json", "html", "msgpack"],
+                        help="Report format (msgpack: binary, for other programs)")
     parser.add_argument("--history-days", type=int, default=30, help="Days of historical data to analyze")
     parser.add_argument("--min-score", type=float, default=50.0, help="Min visibility score for alerts")
+    parser.add_argument("--fleet-report", default=None, choices=["html", "md", "jsonl"],
+                        help="Also write one dashboard of all repos (batch mode)")
+    parser.add_argument("--concurrency", type=int, default=8, help="Parallel workers in batch mode")
+    parser.add_argument("--http-cache", default="seo_http_cache.db",
+                        help="On-disk cache of GitHub responses ('' to disable)")
+    parser.add_argument("--http-cache-mb", type=int, default=64, help="Max size of the HTTP cache")
+    parser.add_argument("--chart", default="png", choices=["png", "svg"],
+                        help="Stars chart as a PNG image or an SVG sparkline")
+    parser.add_argument("--chart-cache", default="seo_chart_cache",
+                        help="Directory caching rendered charts ('' to disable)")
+    parser.add_argument("--chart-cache-mb", type=int, default=32, help="Max size of the chart cache")
+    parser.add_argument("--trends-file", default=None,
+                        help="File of trend terms to suggest, one per line (default: bundled list)")
+    parser.add_argument("--suggestions", default="corpus", choices=["corpus", "trends"],
+                        help="Rank suggested keywords by similar analyzed repos, or list missing trend terms")
+    parser.add_argument("--cohort-size", type=int, default=25,
+                        help="Similar repos a repo's score is compared with (score percentile)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Reuse the last analysis of repos whose inputs did not change")
     return parser.parse_args()
 
+def read_repo_names(path: str):
+    """Yield repo names from a file, skipping blank lines and # comments."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            name = line.split("#", 1)[0].strip()
+            if name:
+                yield name
+
 def main():
     args = parse_arguments()
+    # Imported after argument parsing so --help and usage errors stay instant
+    from src.seo_protocol import SEOProtocol
     try:
-        protocol = SEOProtocol(args.repo, args.gh_token, args.google_json)
-        protocol.run_pipeline(args.output, args.history_days, args.min_score)
+        protocol = SEOProtocol(args.repo, args.gh_token, args.google_json,
+                               http_cache_path=args.http_cache or None,
+                               http_cache_max_bytes=args.http_cache_mb * 1024 * 1024,
+                               incremental=args.incremental, chart_format=args.chart,
+                               chart_cache_dir=args.chart_cache or None,
+                               chart_cache_max_bytes=args.chart_cache_mb * 1024 * 1024,
+                               trends_path=args.trends_file, suggestions=args.suggestions,
+                               cohort_size=args.cohort_size)
+        if args.repos_file:
+            written = protocol.run_batch(read_repo_names(args.repos_file), args.output,
+                                         args.history_days, args.min_score, args.concurrency,
+                                         fleet_format=args.fleet_report)
+            failed = [name for name, path in written.items() if path is None]
+            logging.info(f"Batch finished: {len(written) - len(failed)} reports, {len(failed)} failed")
+        else:
+            protocol.run_pipeline(args.output, args.history_days, args.min_score)
     except Exception as e:
         logging.error(f"Critical error: {e}")
         print("Protocol failed - check logs.")
@@ -5,6 +5,7 @@ setup(
     name='seo-protocol',
     version='0.1.0',
     packages=['src.seo_protocol'],
+    package_data={'src.seo_protocol': ['data/*.txt']},
     install_requires=[
         'pygithub',
         'nltk',
@@ -13,7 +14,7 @@ setup(
         'sqlite3',
         'matplotlib',
         'jinja2',
-        'retrying'
+        'numpy'
     ],
     entry_points={
         'console_scripts': [
@@ -1,2 +1,4 @@
 # src/seo_protocol/__init__.py
 __version__ = "0.1.0-mvp"
+
+from .protocol import SEOProtocol
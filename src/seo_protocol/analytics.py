@@ -0,0 +1,214 @@
+# src/seo_protocol/analytics.py
+"""
+Time-series analytics over Monitor history: velocity, rolling averages,
+EWMA anomaly detection and Holt forecasts.
+
+Everything works on regular grids shaped ``(repos, steps)`` (or ``(steps,)``
+for a single repo), so a whole fleet is processed with array operations:
+loops only run over time steps, never over repositories.
+"""
+import logging
+from datetime import datetime, timezone
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DAY = 86400
+TREND_METRICS = ("stars", "forks", "score")
+
+
+def to_grid(ts: np.ndarray, values: np.ndarray, start: int, step: int, steps: int) -> np.ndarray:
+    """
+    Place an irregular series on ``steps`` slots of ``step`` seconds from
+    ``start``; the latest value wins within a slot and gaps are forward-filled.
+    """
+    grid = np.full(steps, np.nan)
+    slot = (np.asarray(ts) - start) // step
+    inside = (slot >= 0) & (slot < steps)
+    # ts is ascending, so later values overwrite earlier ones in a slot
+    grid[slot[inside]] = np.asarray(values, dtype=float)[inside]
+    return forward_fill(grid)
+
+
+def forward_fill(values: np.ndarray) -> np.ndarray:
+    """Replace NaNs by the last valid value along the time axis (leading NaNs stay)."""
+    values = np.asarray(values, dtype=float)
+    index = np.where(np.isnan(values), 0, np.arange(values.shape[-1]))
+    np.maximum.accumulate(index, axis=-1, out=index)
+    return np.take_along_axis(values, index, axis=-1)
+
+
+def rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing mean over ``window`` steps, ignoring NaNs (shorter windows at the start)."""
+    values = np.asarray(values, dtype=float)
+    valid = ~np.isnan(values)
+    pad = [(0, 0)] * (values.ndim - 1) + [(1, 0)]
+    sums = np.pad(np.cumsum(np.where(valid, values, 0.0), axis=-1), pad)
+    counts = np.pad(np.cumsum(valid, axis=-1), pad)
+    steps = values.shape[-1]
+    lo = np.maximum(np.arange(1, steps + 1) - window, 0)
+    hi = np.arange(1, steps + 1)
+    total = sums[..., hi] - sums[..., lo]
+    count = counts[..., hi] - counts[..., lo]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(count > 0, total / count, np.nan)
+
+
+def velocity(values: np.ndarray, window: int = 7, step_days: float = 1.0) -> np.ndarray:
+    """Average change per day over the last ``window`` steps (NaN without data)."""
+    deltas = np.diff(np.asarray(values, dtype=float), axis=-1)[..., -window:] / step_days
+    valid = ~np.isnan(deltas)
+    count = valid.sum(axis=-1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(count > 0, np.where(valid, deltas, 0.0).sum(axis=-1) / count, np.nan)
+
+
+def ewma_zscores(values: np.ndarray,
+                 alpha: float = 0.3,
+                 min_periods: int = 5,
+                 min_std: float = 1.0) -> np.ndarray:
+    """
+    Z-score of each step's change against the exponentially weighted mean
+    and variance of the changes before it.
+
+    NaN until ``min_periods`` changes were seen; ``min_std`` keeps a perfectly
+    steady series from turning its first small change into a huge score.
+    """
+    deltas = np.diff(np.asarray(values, dtype=float), axis=-1)
+    deltas = np.atleast_2d(deltas)
+    repos, steps = deltas.shape
+    mean = np.full(repos, np.nan)
+    var = np.zeros(repos)
+    seen = np.zeros(repos, dtype=int)
+    z = np.full((repos, steps + 1), np.nan)
+    for t in range(steps):
+        d = deltas[:, t]
+        valid = ~np.isnan(d)
+        ready = valid & (seen >= min_periods)
+        std = np.maximum(np.sqrt(var), min_std)
+        z[ready, t + 1] = (d[ready] - mean[ready]) / std[ready]
+
+        first = valid & np.isnan(mean)
+        mean[first] = d[first]
+        update = valid & ~first
+        diff = d[update] - mean[update]
+        mean[update] += alpha * diff
+        var[update] = (1 - alpha) * (var[update] + alpha * diff ** 2)
+        seen += valid
+    return z if np.ndim(values) > 1 else z[0]
+
+
+def holt_forecast(values: np.ndarray,
+                  horizon: int = 7,
+                  alpha: float = 0.5,
+                  beta: float = 0.3) -> np.ndarray:
+    """Holt's linear (double exponential) smoothing, ``horizon`` steps ahead."""
+    series = np.atleast_2d(np.asarray(values, dtype=float))
+    repos, steps = series.shape
+    level = np.full(repos, np.nan)
+    trend = np.zeros(repos)
+    has_trend = np.zeros(repos, dtype=bool)
+    for t in range(steps):
+        x = series[:, t]
+        valid = ~np.isnan(x)
+        first = valid & np.isnan(level)
+        level[first] = x[first]
+        # The second observation initialises the trend (b0 = x1 - x0)
+        second = valid & ~first & ~has_trend
+        trend[second] = x[second] - level[second]
+        level[second] = x[second]
+        has_trend |= second
+        update = valid & ~first & ~second
+        previous = level[update]
+        level[update] = alpha * x[update] + (1 - alpha) * (previous + trend[update])
+        trend[update] = beta * (level[update] - previous) + (1 - beta) * trend[update]
+        # Missing observations: carry the trend forward
+        gap = ~valid & ~np.isnan(level)
+        level[gap] += trend[gap]
+    forecast = level[:, None] + trend[:, None] * np.arange(1, horizon + 1)
+    return forecast if np.ndim(values) > 1 else forecast[0]
+
+
+def compute(columns: dict[str, np.ndarray],
+            window: int = 7,
+            horizon: int = 7,
+            step_days: float = 1.0,
+            alpha: float = 0.3,
+            z_threshold: float = 3.0) -> dict[str, dict[str, np.ndarray]]:
+    """
+    Run every analysis on gridded metrics (``{metric: (repos, steps)}``).
+
+    Returns ``{metric: {"velocity", "rolling_mean", "zscore", "anomalies",
+    "forecast"}}`` with arrays for the whole fleet.
+    """
+    results = {}
+    for metric, values in columns.items():
+        z = ewma_zscores(values, alpha=alpha)
+        with np.errstate(invalid="ignore"):
+            anomalies = np.abs(z) >= z_threshold
+        results[metric] = {
+            "velocity": velocity(values, window, step_days),
+            "rolling_mean": rolling_mean(values, window),
+            "zscore": z,
+            "anomalies": anomalies,
+            "forecast": holt_forecast(values, horizon),
+        }
+    return results
+
+
+def load_grid(monitor,
+              repos: list[str],
+              days_back: int = 30,
+              step: int = DAY,
+              metrics=TREND_METRICS,
+              now: int | None = None) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+    """Read the history of ``repos`` from ``monitor`` onto one shared grid."""
+    steps = max(int(days_back * DAY // step), 2)
+    end = int(now if now is not None else datetime.now(timezone.utc).timestamp())
+    start = end - end % step - (steps - 1) * step
+    grid = {metric: np.full((len(repos), steps), np.nan) for metric in metrics}
+    for i, repo in enumerate(repos):
+        columns = monitor.get_history_columns(repo, days_back, resolution=step, metrics=metrics)
+        for metric in metrics:
+            grid[metric][i] = to_grid(columns["ts"], columns[metric], start, step, steps)
+    return start + step * np.arange(steps), grid
+
+
+def _number(value) -> float | None:
+    return None if value is None or np.isnan(value) else round(float(value), 2)
+
+
+def trends_for(ts: np.ndarray, results: dict, index: int = 0, recent: int = 7) -> dict:
+    """
+    JSON-ready trends of the ``index``-th repo of ``compute`` results (over a
+    fleet grid), listing the anomalies of the last ``recent`` steps.
+    """
+    trends = {}
+    for metric, r in results.items():
+        rows = {key: value[index] for key, value in r.items()}
+        flagged = np.flatnonzero(rows["anomalies"][-recent:]) + max(len(ts) - recent, 0)
+        trends[metric] = {
+            "velocity_per_day": _number(rows["velocity"]),
+            "rolling_mean": _number(rows["rolling_mean"][-1]),
+            "forecast": [_number(v) for v in rows["forecast"]],
+            "anomalies": [
+                {"date": datetime.fromtimestamp(int(ts[t]), timezone.utc).date().isoformat(),
+                 "zscore": _number(rows["zscore"][t])}
+                for t in flagged
+            ],
+        }
+    return trends
+
+
+def fleet_trends(monitor, repos: list[str], days_back: int = 30, **options) -> dict[str, dict]:
+    """Trends of many repositories, computed in one vectorized pass."""
+    if not repos:
+        return {}
+    ts, grid = load_grid(monitor, repos, days_back)
+    results = compute(grid, **options)
+    return {repo: trends_for(ts, results, i, options.get("window", 7)) for i, repo in enumerate(repos)}
+
+
+def repo_trends(monitor, repo: str, days_back: int = 30, **options) -> dict:
+    """Trends of a single repository (see ``fleet_trends``)."""
+    return fleet_trends(monitor, [repo], days_back, **options)[repo]
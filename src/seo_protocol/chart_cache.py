@@ -0,0 +1,123 @@
+# src/seo_protocol/chart_cache.py
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+
+def chart_digest(series, params: dict) -> str:
+    """Content address of a chart: hash of its input series and chart parameters."""
+    h = hashlib.sha256(json.dumps(params, sort_keys=True).encode("utf-8"))
+    for point in series:
+        h.update(repr(point).encode("utf-8"))
+        h.update(b"\n")
+    return h.hexdigest()
+
+
+class ChartCache:
+    """
+    Content-addressed, size-bounded store of rendered charts on disk.
+
+    Each chart is one file named after its digest (``ab/abcdef….png``), so
+    an unchanged history is answered with a file read instead of a render.
+    The least recently used files are deleted once the directory holds more
+    than ``max_bytes``.
+    """
+
+    def __init__(self, directory: str = "seo_chart_cache", max_bytes: int = 32 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes_saved = 0
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()       # digest.ext → size, least recently used first
+        self._total_bytes = 0
+        os.makedirs(directory, exist_ok=True)
+        self._scan()
+
+    def _scan(self):
+        """Index existing files, oldest modification first."""
+        files = []
+        for sub in os.scandir(self.directory):
+            if sub.is_dir():
+                for entry in os.scandir(sub.path):
+                    if entry.name.endswith(".tmp"):
+                        continue
+                    stat = entry.stat()
+                    files.append((stat.st_mtime, entry.name, stat.st_size))
+        for _, name, size in sorted(files):
+            self._entries[name] = size
+            self._total_bytes += size
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name[:2], name)
+
+    def get(self, digest: str, ext: str) -> bytes | None:
+        """Return the stored chart (and mark it as recently used)."""
+        name = f"{digest}.{ext}"
+        with self._lock:
+            if name not in self._entries:
+                self.misses += 1
+                return None
+            try:
+                with open(self._path(name), "rb") as f:
+                    data = f.read()
+                os.utime(self._path(name))
+            except OSError:
+                # Removed behind our back: forget it
+                self._total_bytes -= self._entries.pop(name)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(name)
+            self.hits += 1
+            self.bytes_saved += len(data)
+            return data
+
+    def put(self, digest: str, ext: str, data: bytes):
+        """Store a chart, evicting least recently used ones beyond ``max_bytes``."""
+        if len(data) > self.max_bytes:
+            return
+        name = f"{digest}.{ext}"
+        path = self._path(name)
+        with self._lock:
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp = f"{path}.{threading.get_ident()}.tmp"
+                with open(tmp, "wb") as f:
+                    f.write(data)
+                os.replace(tmp, path)
+            except OSError as e:
+                logger.warning(f"Could not cache chart {name}: {e}")
+                return
+            self._total_bytes += len(data) - self._entries.pop(name, 0)
+            self._entries[name] = len(data)
+            self._evict()
+
+    def _evict(self):
+        while self._total_bytes > self.max_bytes:
+            name, size = self._entries.popitem(last=False)
+            try:
+                os.remove(self._path(name))
+            except OSError:
+                pass
+            self._total_bytes -= size
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        """Counters for the run summary."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "bytes_saved": self.bytes_saved,
+                "evictions": self.evictions,
+                "stored_bytes": self._total_bytes,
+            }
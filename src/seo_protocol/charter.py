@@ -1,43 +1,219 @@
 # src/seo_protocol/charter.py
 import logging
-import matplotlib.pyplot as plt
 import base64
+import multiprocessing
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import nullcontext
+from datetime import datetime, timezone
 from io import BytesIO
+from .chart_cache import ChartCache, chart_digest
 
 logger = logging.getLogger(__name__)
 
+CHART_FORMATS = ("png", "svg")
+
+MIME_TYPES = {"png": "image/png", "svg": "image/svg+xml"}
+
+# Everything besides the data that changes the image; bump "style" whenever
+# the drawing code changes so cached charts are not reused. Times are plotted
+# to the hour, so reruns within the same hour produce the same chart.
+CHART_PARAMS = {
+    "png": {"style": 1, "figsize": (10, 5), "dpi": 100, "time_step": 3600},
+    "svg": {"style": 1, "width": 240, "height": 48},
+}
+
+SPARK_BLOCKS = "▁▂▃▄▅▆▇█"
+
+
+def _points(historical_data: list[dict], step: int = 1) -> list[tuple[float, float]]:
+    """
+    ``(epoch seconds, stars)`` of each history row, with the time (``ts``,
+    or parsed from ``date``) floored to ``step`` seconds.
+    """
+    points = []
+    for row in historical_data:
+        ts = row.get('ts')
+        if ts is None:
+            ts = datetime.fromisoformat(row['date']).replace(tzinfo=timezone.utc).timestamp()
+        points.append((ts - ts % step, row['stars']))
+    return points
+
+
+def sparkline_svg(values: list[float], width: int = 240, height: int = 48,
+                  color: str = "#1f77b4") -> str:
+    """Minimal SVG polyline of ``values``; no matplotlib, no rasterisation."""
+    values = [v for v in values if v is not None]
+    if len(values) < 2:
+        return ""
+    lo, hi = min(values), max(values)
+    span = (hi - lo) or 1
+    pad = 3
+    step = (width - 2 * pad) / (len(values) - 1)
+    points = " ".join(
+        f"{pad + i * step:.1f},{height - pad - (v - lo) / span * (height - 2 * pad):.1f}"
+        for i, v in enumerate(values)
+    )
+    last_x, last_y = points.rsplit(" ", 1)[-1].split(",")
+    return (f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+            f'viewBox="0 0 {width} {height}">'
+            f'<polyline fill="none" stroke="{color}" stroke-width="1.5" points="{points}"/>'
+            f'<circle cx="{last_x}" cy="{last_y}" r="2.5" fill="{color}"/></svg>')
+
+
+def sparkline_text(values: list[float], width: int = 30) -> str:
+    """Unicode block sparkline of the last ``width`` values (for Markdown tables)."""
+    values = [v for v in values if v is not None][-width:]
+    if len(values) < 2:
+        return ""
+    lo, hi = min(values), max(values)
+    span = (hi - lo) or 1
+    return "".join(SPARK_BLOCKS[round((v - lo) / span * (len(SPARK_BLOCKS) - 1))] for v in values)
+
+
 class Charter:
-    """Simple chart generator that returns base64 encoded PNG images."""
+    """
+    Simple chart generator that returns base64 encoded PNG images
+    (or SVG sparklines with ``fmt="svg"``).
+
+    PNGs are drawn with matplotlib's object-oriented Agg API, without pyplot's
+    global state: every thread keeps one figure and redraws it for each
+    chart, so charts can be rendered concurrently and much faster than by
+    building a new figure each time.
+
+    With a ``ChartCache`` a chart whose series and parameters were already
+    rendered is read back from disk instead.
+    """
+
+    _local = threading.local()
+
+    def __init__(self, fmt: str = "png", cache: ChartCache | None = None):
+        if fmt not in CHART_FORMATS:
+            raise ValueError(f"Unknown chart format: {fmt}")
+        self.fmt = fmt
+        self.cache = cache
+
+    @property
+    def mime_type(self) -> str:
+        return MIME_TYPES[self.fmt]
 
     def generate_stars_trend_chart(self, historical_data: list[dict]) -> str | None:
         """
         Generate simple line chart of stars over time.
-        Returns base64 encoded PNG or None if data is insufficient.
+        Returns base64 encoded image or None if data is insufficient.
         """
         if len(historical_data) < 2:
             logger.info("Not enough historical data for chart")
             return None
 
         try:
-            dates = [d['date'] for d in historical_data]
-            stars = [d['stars'] for d in historical_data]
+            digest = None
+            if self.cache is not None:
+                digest = self._digest(historical_data)
+                image = self.cache.get(digest, self.fmt)
+                if image is not None:
+                    return base64.b64encode(image).decode('utf-8')
+            if self.fmt == "svg":
+                params = CHART_PARAMS["svg"]
+                image = sparkline_svg([d['stars'] for d in historical_data],
+                                      params["width"], params["height"]).encode("utf-8")
+            else:
+                image = self._render_png(historical_data)
+            if digest is not None:
+                self.cache.put(digest, self.fmt, image)
+            return base64.b64encode(image).decode('utf-8')
 
-            fig, ax = plt.subplots(figsize=(10, 5))
-            ax.plot(dates, stars, marker='o', linestyle='-', color='#1f77b4')
+        except Exception as e:
+            logger.error(f"Chart generation failed: {e}")
+            return None
+
+    def render_many(self,
+                    histories: dict[str, list[dict]],
+                    max_workers: int | None = None,
+                    pool: Executor | None = None) -> dict[str, str | None]:
+        """
+        Charts for many repositories (repo → history). PNGs are rendered in a
+        process pool of ``max_workers`` processes, each reusing its figure;
+        pass the ``pool`` of ``render_pool`` to share one across calls.
+        """
+        if self.fmt == "svg" or (max_workers == 1 and pool is None):
+            return {repo: self.generate_stars_trend_chart(h) for repo, h in histories.items()}
+
+        charts, missing = {}, []
+        for repo, history in histories.items():
+            if self.cache is not None and len(history) >= 2:
+                image = self.cache.get(self._digest(history), self.fmt)
+                if image is not None:
+                    charts[repo] = base64.b64encode(image).decode('utf-8')
+                    continue
+            missing.append(repo)
+        if missing:
+            with nullcontext(pool) if pool is not None else self.render_pool(max_workers) as executor:
+                rendered = executor.map(_render_png_chart, (histories[r] for r in missing), chunksize=16)
+                for repo, chart in zip(missing, rendered):
+                    charts[repo] = chart
+                    if chart is not None and self.cache is not None:
+                        self.cache.put(self._digest(histories[repo]), self.fmt, base64.b64decode(chart))
+        return {repo: charts[repo] for repo in histories}
+
+    def render_pool(self, max_workers: int | None = None):
+        """
+        Context manager yielding a process pool for ``render_many`` (None for
+        SVG, which renders in-process). Workers are spawned rather than
+        forked: the caller may have other threads running, e.g. a batch
+        analysis, whose locks a forked child would inherit.
+        """
+        if self.fmt == "svg":
+            return nullcontext()
+        return ProcessPoolExecutor(max_workers, mp_context=multiprocessing.get_context("spawn"))
+
+    def _digest(self, historical_data: list[dict]) -> str:
+        params = CHART_PARAMS[self.fmt]
+        if self.fmt == "svg":
+            series = [d['stars'] for d in historical_data]   # sparklines ignore time
+        else:
+            series = _points(historical_data, params["time_step"])
+        return chart_digest(series, {"fmt": self.fmt, **params})
+
+    @classmethod
+    def _figure(cls):
+        """This thread's figure, created on first use and redrawn afterwards."""
+        if getattr(cls._local, "figure", None) is None:
+            # deferred: costs hundreds of ms to import
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            from matplotlib.dates import AutoDateLocator, ConciseDateFormatter
+            from matplotlib.figure import Figure
+
+            params = CHART_PARAMS["png"]
+            figure = Figure(figsize=params["figsize"], dpi=params["dpi"])
+            FigureCanvasAgg(figure)
+            ax = figure.add_subplot()
+            line, = ax.plot([], [], marker='o', linestyle='-', color='#1f77b4')
             ax.set_title('Stars Growth Over Time')
             ax.set_xlabel('Date')
             ax.set_ylabel('Stars')
             ax.grid(True, alpha=0.3)
-            plt.xticks(rotation=45)
-            plt.tight_layout()
+            locator = AutoDateLocator()
+            ax.xaxis.set_major_locator(locator)
+            ax.xaxis.set_major_formatter(ConciseDateFormatter(locator))
+            # Fixed margins instead of a tight_layout pass per chart
+            figure.subplots_adjust(left=0.09, right=0.97, top=0.92, bottom=0.12)
+            cls._local.figure, cls._local.ax, cls._local.line = figure, ax, line
+        return cls._local.figure, cls._local.ax, cls._local.line
 
-            buf = BytesIO()
-            fig.savefig(buf, format='png', dpi=100)
-            buf.seek(0)
-            plt.close(fig)
+    def _render_png(self, historical_data: list[dict]) -> bytes:
+        figure, ax, line = self._figure()
+        points = _points(historical_data, CHART_PARAMS["png"]["time_step"])
+        line.set_data([ts / 86400.0 for ts, _ in points],  # matplotlib date units
+                      [stars for _, stars in points])
+        ax.relim()
+        ax.autoscale_view()
 
-            return base64.b64encode(buf.read()).decode('utf-8')
+        buf = BytesIO()
+        figure.canvas.print_png(buf)
+        return buf.getvalue()
 
-        except Exception as e:
-            logger.error(f"Chart generation failed: {e}")
-            return None
+
+def _render_png_chart(historical_data: list[dict]) -> str | None:
+    """Process-pool entry point (module level so it can be pickled)."""
+    return Charter("png").generate_stars_trend_chart(historical_data)
@@ -0,0 +1,259 @@
+# src/seo_protocol/corpus.py
+"""
+Keyword suggestions and peer comparisons from similar repositories.
+
+Every analyzed repository is a document of terms: its description and
+topic keywords plus the most frequent words of its README. ``KeywordCorpus``
+keeps them in an inverted index (term → repositories and term counts) that
+is updated one repository at a time. Documents are compared as sublinear
+TF-IDF vectors by cosine similarity. Suggestions for a repository are the
+terms its nearest neighbours share that it lacks, weighted by each
+neighbour's similarity and the term's weight there. Only terms used by at
+least ``min_support`` neighbours count, so a term is suggested because it
+co-occurs with the repository's own terms across the corpus, not because
+one neighbour happens to use it.
+
+The same neighbours form a repository's cohort: ``cohort`` reports where
+its visibility score ranks among theirs, which an absolute score cannot.
+
+Neighbour candidates are found through the postings of the repository's
+most distinctive terms only (at most ``query_terms``, skipping terms in more
+than ``max_df`` of all documents) and the best of them rescored over all
+terms, so a query touches a few thousand postings even in a corpus of
+100,000 repositories.
+"""
+import heapq
+import logging
+import math
+import threading
+from collections import Counter
+from collections.abc import Iterable, Mapping
+from operator import truediv
+
+logger = logging.getLogger(__name__)
+
+# Term counts are capped here; 1 + log(tf) barely grows beyond it
+MAX_COUNT = 255
+_SUBLINEAR = [0.0] + [1.0 + math.log(tf) for tf in range(1, MAX_COUNT + 1)]
+
+
+def score_percentile(score: float, scores: Iterable[float]) -> float:
+    """Percentage of ``scores`` below ``score``, ties counting half (0 without scores)."""
+    below = equal = total = 0
+    for other in scores:
+        total += 1
+        if other < score:
+            below += 1
+        elif other == score:
+            equal += 1
+    return round(100.0 * (below + 0.5 * equal) / total, 1) if total else 0.0
+
+
+def document_terms(keywords: Iterable[str], readme: Mapping | None = None) -> dict[str, int]:
+    """Term counts of one repository: its keywords plus its README terms (see ``readme.analyze_readme``)."""
+    terms = Counter(keywords)
+    if readme:
+        terms.update(readme.get("terms") or {})
+    return dict(terms)
+
+
+class KeywordCorpus:
+    """
+    Incremental TF-IDF index of repository terms (see the module docstring).
+
+    ``add`` inserts or replaces a repository (and its latest score),
+    ``similar`` returns its nearest neighbours, ``suggest`` the keywords they
+    use that it lacks and ``cohort`` how its score compares to theirs.
+    Document norms depend on the document frequencies, which drift as the
+    corpus grows; they are recomputed whenever it has doubled in size.
+    """
+
+    def __init__(self,
+                 neighbors: int = 25,
+                 query_terms: int = 12,
+                 max_df: float = 0.1,
+                 min_support: int = 2):
+        self.neighbors = neighbors
+        self.query_terms = query_terms
+        self.max_df = max_df
+        self.min_support = min_support
+        self.queries = 0
+        self._docs: dict[str, dict[str, int]] = {}
+        self._postings: dict[str, dict[str, int]] = {}    # term → repo → count
+        self._norms: dict[str, float] = {}
+        self._scores: dict[str, float] = {}
+        self._normalized_at = 0                          # corpus size when norms were computed
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_monitor(cls, monitor, **kwargs) -> "KeywordCorpus":
+        """The corpus stored in a ``Monitor`` database (see ``Monitor.save_corpus_document``)."""
+        corpus = cls(**kwargs)
+        with corpus._lock:
+            for repo, terms, score in monitor.iter_corpus_documents():
+                corpus._insert(repo, terms, score)
+            corpus._normalize()
+        logger.debug(f"Loaded keyword corpus of {len(corpus)} repositories")
+        return corpus
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def __contains__(self, repo: str) -> bool:
+        return repo in self._docs
+
+    def idf(self, term: str) -> float:
+        """Smoothed inverse document frequency, ``log((1 + N) / (1 + df)) + 1``."""
+        return math.log((1 + len(self._docs)) / (1 + len(self._postings.get(term, ())))) + 1.0
+
+    def add(self, repo: str, terms: Mapping[str, int], score: float | None = None):
+        """Insert ``repo`` with its term counts and score, replacing its previous document."""
+        with self._lock:
+            self._remove(repo)
+            self._insert(repo, terms, score)
+            if len(self._docs) >= 2 * self._normalized_at:
+                self._normalize()
+            else:
+                self._norms[repo] = self._norm(self._docs[repo])
+
+    def remove(self, repo: str):
+        with self._lock:
+            self._remove(repo)
+
+    def _insert(self, repo: str, terms: Mapping[str, int], score: float | None = None):
+        doc = {term: min(int(count), MAX_COUNT) for term, count in terms.items() if count > 0}
+        self._docs[repo] = doc
+        if score is not None:
+            self._scores[repo] = score
+        postings = self._postings
+        for term, count in doc.items():
+            if term in postings:
+                postings[term][repo] = count
+            else:
+                postings[term] = {repo: count}
+
+    def _remove(self, repo: str):
+        doc = self._docs.pop(repo, None)
+        if doc is None:
+            return
+        self._norms.pop(repo, None)
+        self._scores.pop(repo, None)
+        for term in doc:
+            repos = self._postings[term]
+            del repos[repo]
+            if not repos:
+                del self._postings[term]
+
+    def _norm(self, doc: Mapping[str, int]) -> float:
+        idf = self.idf
+        return math.sqrt(sum((_SUBLINEAR[count] * idf(term)) ** 2 for term, count in doc.items())) or 1.0
+
+    def _normalize(self):
+        self._norms = {repo: self._norm(doc) for repo, doc in self._docs.items()}
+        self._normalized_at = len(self._docs)
+
+    def _weights(self, doc: Mapping[str, int]) -> dict[str, float]:
+        """Unit-length TF-IDF vector of a document."""
+        idf = self.idf
+        weights = {term: _SUBLINEAR[count] * idf(term) for term, count in doc.items()}
+        norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+        return {term: w / norm for term, w in weights.items()}
+
+    def _similar(self, doc: Mapping[str, int], exclude: str | None, k: int) -> list[tuple[str, float]]:
+        postings, norms, sublinear = self._postings, self._norms, _SUBLINEAR
+        idfs = {term: self.idf(term) for term in doc}
+        weights = self._weights(doc)
+        limit = max(self.max_df * len(self._docs), 50)
+        distinctive = [t for t in weights if t in postings and len(postings[t]) <= limit]
+        query = heapq.nlargest(self.query_terms, distinctive, key=weights.__getitem__)
+
+        scores = {}
+        get = scores.get
+        for term in query:
+            factor = weights[term] * idfs[term]
+            for repo, count in postings[term].items():
+                scores[repo] = get(repo, 0.0) + factor * sublinear[count]
+        scores.pop(exclude, None)
+        scores = dict(zip(scores, map(truediv, scores.values(), map(norms.__getitem__, scores))))
+        # The partial scores only cover the query terms: rescore the best
+        # candidates over all their terms
+        exact = {}
+        for repo in heapq.nlargest(4 * k, scores, key=scores.__getitem__):
+            other = self._docs[repo]
+            exact[repo] = sum(w * sublinear[other[t]] * idfs[t]
+                              for t, w in weights.items() if t in other) / norms[repo]
+        best = heapq.nlargest(k, exact, key=exact.__getitem__)
+        return [(repo, round(exact[repo], 4)) for repo in best]
+
+    def similar(self, repo: str, k: int = 10) -> list[tuple[str, float]]:
+        """The ``k`` repositories most similar to ``repo`` as ``(repo, cosine)``, best first."""
+        with self._lock:
+            doc = self._docs.get(repo)
+            return self._similar(doc, repo, k) if doc else []
+
+    def suggest(self, repo: str, limit: int = 25, terms: Mapping[str, int] | None = None) -> list[str]:
+        """
+        Up to ``limit`` keywords for ``repo``, most relevant first: terms its
+        neighbours use and it does not. ``terms`` queries a document that is
+        not (or not yet) in the corpus. Returns [] without enough neighbours.
+        """
+        with self._lock:
+            doc = terms if terms is not None else self._docs.get(repo)
+            if not doc:
+                return []
+            self.queries += 1
+            neighbors = self._similar(doc, repo, self.neighbors)
+            if len(neighbors) < self.min_support:
+                return []
+
+            # Words most repositories use ("install", "license") are no keywords
+            common = max(self.max_df * len(self._docs), 50)
+            postings = self._postings
+            scores, support, idfs = {}, Counter(), {}
+            idf = self.idf
+            for neighbor, similarity in neighbors:
+                if similarity <= 0:
+                    continue
+                scale = similarity / self._norms[neighbor]
+                for term, count in self._docs[neighbor].items():
+                    if term not in doc and len(postings[term]) <= common:
+                        weight = idfs.get(term) or idfs.setdefault(term, idf(term))
+                        scores[term] = scores.get(term, 0.0) + scale * _SUBLINEAR[count] * weight
+                        support[term] += 1
+            candidates = [t for t in scores if support[t] >= self.min_support]
+            return heapq.nlargest(limit, candidates, key=scores.__getitem__)
+
+    def cohort(self, repo: str, k: int = 25, peers: int = 5) -> dict | None:
+        """
+        How ``repo``'s score compares to its ``k`` most similar scored
+        repositories: its percentile among them, rank (1 = best), their
+        median and the ``peers`` most similar ones. None without a score or
+        any similar repository.
+        """
+        with self._lock:
+            doc, score = self._docs.get(repo), self._scores.get(repo)
+            if not doc or score is None:
+                return None
+            self.queries += 1
+            scores = self._scores
+            # Ask for a few more: unscored neighbours are skipped
+            neighbors = [(other, similarity) for other, similarity in self._similar(doc, repo, 2 * k)
+                         if other in scores][:k]
+            if not neighbors:
+                return None
+            cohort_scores = sorted(scores[other] for other, _ in neighbors)
+            n = len(cohort_scores)
+            median = (cohort_scores[(n - 1) // 2] + cohort_scores[n // 2]) / 2
+            return {
+                "size": n,
+                "percentile": score_percentile(score, cohort_scores),
+                "rank": 1 + sum(other > score for other in cohort_scores),
+                "median": round(median, 2),
+                "peers": [{"repo": other, "similarity": similarity, "score": scores[other]}
+                          for other, similarity in neighbors[:peers]],
+            }
+
+    def stats(self) -> dict:
+        """Counters for the run summary."""
+        with self._lock:
+            return {"documents": len(self._docs), "terms": len(self._postings), "queries": self.queries}
@@ -1,18 +1,137 @@
 # src/seo_protocol/github_api.py
+import io
 import logging
-from github import Github, GithubException
-from retrying import retry
-import nltk
-from nltk.corpus import stopwords
-
-nltk.download('punkt', quiet=True)
-nltk.download('stopwords', quiet=True)
+import threading
+from collections import OrderedDict
+from urllib.parse import parse_qs, urlparse
+import requests
+from github import Github, GithubException, UnknownObjectException
+from .http_cache import CachingAdapter, ResponseCache
+from .rate_limit import RateLimitAdapter, RateLimitScheduler
+from .keywords import KeywordExtractor, TrendIndex, load_trend_index
+from .readme import analyze_readme, keywords_key
+from .token_pool import TokenPool
 
 logger = logging.getLogger(__name__)
 
-def is_rate_limit_error(exception):
-    """Retry predicate for GitHub rate limit errors"""
-    return isinstance(exception, GithubException) and exception.status == 403
+# Blockchain-relevant trending terms; edit data/trend_keywords.txt to update them
+TREND_KEYWORDS = load_trend_index().all_terms
+
+class CountCache:
+    """
+    Thread-safe LRU of paginated-list totals (contributors, commits).
+
+    Keys include the repository's ``pushed_at`` timestamp, so a count is
+    reused until the next push and then naturally replaced.
+    """
+
+    def __init__(self, max_entries: int = 10_000):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> int | None:
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, key: tuple, value: int):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+count_cache = CountCache()
+
+
+def total_from_link_header(headers: dict, data) -> int:
+    """
+    Total item count of a ``per_page=1`` listing.
+
+    The ``rel="last"`` link points at the last page, whose number equals the
+    item count; without a Link header everything fit on the first page.
+    """
+    link = headers.get("link") or headers.get("Link")
+    if link:
+        for entry in requests.utils.parse_header_links(link):
+            if entry.get("rel") == "last":
+                return int(parse_qs(urlparse(entry["url"]).query)["page"][0])
+    return len(data or [])
+
+
+class GitHubAdapter(CachingAdapter, RateLimitAdapter):
+    """
+    Transport used by ``SharedGitHubClient``: cache lookups first, then
+    rate-limit pacing, then the network. Every layer is optional.
+    """
+
+
+class SharedGitHubClient:
+    """
+    One authenticated GitHub client shared by many worker threads.
+
+    PyGithub connections keep per-request state and are not safe to use from
+    several threads at once, so every thread gets its own lightweight
+    ``Github`` wrapper. All of them send requests through the same pooled
+    ``requests.Session``, so sockets and authentication are shared.
+
+    With a ``ResponseCache`` every GET becomes a conditional request that is
+    answered from disk when GitHub replies 304 Not Modified. All threads are
+    paced by one ``RateLimitScheduler``, which also retries throttled requests.
+    Given several tokens, a ``TokenPool`` sends each request with the token
+    that has the most quota left.
+    """
+
+    def __init__(self,
+                 token: str | list[str],
+                 pool_size: int = 16,
+                 cache: ResponseCache | None = None,
+                 scheduler: RateLimitScheduler | TokenPool | None = None,
+                 base_url: str = "https://api.github.com"):
+        self.tokens = [token] if isinstance(token, str) else list(token)
+        self.token = self.tokens[0]
+        self.base_url = base_url
+        self.cache = cache
+        if scheduler is None:
+            scheduler = TokenPool(self.tokens) if len(self.tokens) > 1 else RateLimitScheduler()
+        self.scheduler = scheduler
+        self.session = requests.Session()
+        # Same trick as PyGithub: a non-None auth disables ~/.netrc lookups
+        self.session.auth = lambda request: request
+        adapter = GitHubAdapter(cache=cache, scheduler=self.scheduler,
+                                pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._local = threading.local()
+
+    def get(self) -> Github:
+        """Return the calling thread's client, creating it on first use."""
+        client = getattr(self._local, "client", None)
+        if client is None:
+            # Pacing is the scheduler's job, not a fixed per-client delay
+            client = Github(self.token, base_url=self.base_url, seconds_between_requests=None)
+            self._bind_session(client)
+            self._local.client = client
+        return client
+
+    def _bind_session(self, client: Github):
+        """Route every connection the client opens through the shared session."""
+        requester = client.requester
+        connection_class = requester._Requester__connectionClass
+        session = self.session
+
+        def make_connection(*args, **kwargs):
+            cnx = connection_class(*args, **kwargs)
+            cnx.session.close()
+            cnx.session = session
+            cnx.close = lambda: None  # the session outlives single connections
+            return cnx
+
+        requester._Requester__connectionClass = make_connection
 
 
 class GitHubAPI:
@@ -20,59 +139,143 @@ class GitHubAPI:
     Handles all read-only interactions with the GitHub API.
     """
 
-    def __init__(self, token: str, repo_name: str):
+    def __init__(self,
+                 token: str | list[str],
+                 repo_name: str,
+                 client: Github | None = None,
+                 lazy: bool = False,
+                 counts: CountCache | None = None,
+                 tokenizer: str = "auto",
+                 trends: TrendIndex | None = None):
         """
         Initialize GitHub client and fetch the repository.
-        
+
+        ``token`` may be a list of tokens used as one pooled quota.
+        Pass ``client`` to reuse an already authenticated client
+        (see ``SharedGitHubClient``); otherwise a private one is created.
+        With ``lazy=True`` the repository is not requested up front; use it
+        when the repo is already known to exist (e.g. resolved via GraphQL).
+        ``trends`` is the vocabulary keywords are suggested from (default:
+        the bundled one).
+
         Raises ValueError if repository cannot be accessed.
         """
-        self.g = Github(token)
+        self.g = client if client is not None else SharedGitHubClient(token).get()
+        self.counts = counts if counts is not None else count_cache
+        self.tokenizer = tokenizer
+        self.trends = trends if trends is not None else load_trend_index()
+        self.repo_name = repo_name
+        self._readme = None
         try:
-            self.repo = self.g.get_repo(repo_name)
+            self.repo = self.g.get_repo(repo_name, lazy=lazy)
         except GithubException as e:
             logger.error(f"Failed to access repository {repo_name}: {e}")
             raise ValueError(f"Invalid repository or token: {repo_name}")
 
-    @retry(stop_max_attempt_number=3, wait_fixed=2000, retry_on_exception=is_rate_limit_error)
-    def fetch_metrics(self) -> dict:
-        """Fetch key repository metrics (read-only)."""
+    def count_items(self, listing: str, pushed_at: str | None = None) -> int:
+        """
+        Count a repository listing (e.g. 'contributors', 'commits') in one request.
+
+        Asks for ``per_page=1`` and reads the total from the ``Link: rel="last"``
+        header instead of paging through every item. Results are cached until
+        the repository's next push; pass ``pushed_at`` when it is already known
+        to avoid loading a lazy repository.
+        """
+        if pushed_at is None:
+            pushed_at = str(self.repo.pushed_at)
+        key = (self.repo.full_name, listing, pushed_at)
+        total = self.counts.get(key)
+        if total is None:
+            headers, data = self.repo.requester.requestJsonAndCheck(
+                "GET", f"{self.repo.url}/{listing}", parameters={"per_page": 1}
+            )
+            total = total_from_link_header(headers, data)
+            self.counts.put(key, total)
+        return total
+
+    def fetch_metrics(self, known: dict | None = None, pushed_at: str | None = None) -> dict:
+        """
+        Fetch key repository metrics (read-only).
+
+        Metrics already present in ``known`` (e.g. from a GraphQL batch)
+        are reused and only the missing ones are requested over REST.
+        """
+        readers = {
+            'stars': lambda: self.repo.stargazers_count,
+            'forks': lambda: self.repo.forks_count,
+            'watchers': lambda: self.repo.watchers_count,
+            'contributors': lambda: self.count_items('contributors', pushed_at),
+            'commits': lambda: self.count_items('commits', pushed_at),
+            'issues': lambda: self.repo.open_issues_count,
+            'views_last_14d': lambda: self.repo.get_views_traffic().count,
+            'clones_last_14d': lambda: self.repo.get_clones_traffic().count,
+            'has_readme': lambda: self.readme() is not None,
+            'has_license': lambda: self.repo.license is not None,
+        }
+        known = known or {}
         try:
-            return {
-                'stars': self.repo.stargazers_count,
-                'forks': self.repo.forks_count,
-                'watchers': self.repo.watchers_count,
-                'contributors': len(list(self.repo.get_contributors())),
-                'commits': self.repo.get_commits().totalCount,
-                'issues': self.repo.open_issues_count,
-                'views_last_14d': self.repo.get_views().total_count,
-                'clones_last_14d': self.repo.get_clones().total_count,
-                'has_readme': bool(self.repo.get_readme() if hasattr(self.repo, 'get_readme') else False),
-                'has_license': self.repo.license is not None,
-            }
+            return {key: known[key] if key in known else read() for key, read in readers.items()}
         except GithubException as e:
             logger.warning(f"Could not fetch full metrics: {e}")
             return {}
 
-    def extract_keywords(self) -> tuple[list[str], set[str]]:
-        """Extract keywords from description and topics."""
+    def readme(self):
+        """The README (a ContentFile, read once per instance) or None if the repo has none."""
+        if self._readme is None:
+            try:
+                self._readme = self.repo.get_readme()
+            except UnknownObjectException:
+                self._readme = False
+        return self._readme or None
+
+    def readme_stats(self, keywords: list[str], sha: str | None = None, cache=None) -> dict | None:
+        """
+        Structure and keyword statistics of the README (see ``readme.analyze_readme``).
+
+        With a ``cache`` (a ``Monitor``) the statistics are stored per blob
+        SHA: when ``sha`` (e.g. from GraphQL) is unchanged, the README is
+        neither downloaded nor parsed again. Returns None without a README.
+        """
+        key = keywords_key(keywords)
         try:
-            description = (self.repo.description or "").lower()
-            topics = [t.lower() for t in self.repo.get_topics()]
-            text = description + " " + " ".join(topics)
+            if sha is None:
+                readme = self.readme()
+                if readme is None:
+                    return None
+                sha = readme.sha
+            if cache is not None:
+                cached = cache.get_readme_stats(self.repo_name, sha, key)
+                if cached is not None:
+                    return cached
+
+            readme = self.readme()
+            if readme is None:
+                return None
+            lines = io.StringIO(readme.decoded_content.decode("utf-8", errors="replace"))
+            stats = {"sha": sha, **analyze_readme(lines, keywords)}
+            if cache is not None:
+                cache.save_readme_stats(self.repo_name, sha, key, stats)
+            return stats
 
-            tokens = nltk.word_tokenize(text)
-            stop_words = set(stopwords.words('english'))
-            keywords = [w for w in tokens if w.isalnum() and w not in stop_words]
+        except GithubException as e:
+            logger.warning(f"Could not analyze README: {e}")
+            return None
 
-            # Blockchain-relevant trending terms (can be expanded/updated)
-            trends = {
-                "blockchain", "solidity", "ethereum", "defi", "nft",
-                "web3", "smart-contract", "layer2", "zk", "polygon", "solana"
-            }
-            suggested = trends - set(keywords)
+    def extract_keywords(self,
+                         description: str | None = None,
+                         topics: list[str] | None = None) -> tuple[list[str], list[str]]:
+        """
+        Extract keywords from description and topics.
 
-            return keywords, suggested
+        Both are read from the repository unless passed in explicitly.
+        """
+        try:
+            if description is None:
+                description = self.repo.description
+            if topics is None:
+                topics = self.repo.get_topics()
+            return KeywordExtractor(self.tokenizer, self.trends).extract(description, topics)
 
         except Exception as e:
             logger.error(f"Keyword extraction failed: {e}")
-            return [], set()
+            return [], []
@@ -0,0 +1,172 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+# Headers describing the current request rather than the cached body;
+# on a 304 the fresh values replace the stored ones.
+FRESH_HEADERS = ("date", "x-ratelimit-limit", "x-ratelimit-remaining",
+                 "x-ratelimit-reset", "x-ratelimit-used", "x-ratelimit-resource")
+
+
+class ResponseCache:
+    """
+    Persistent, size-bounded store of GET responses (SQLite).
+
+    Entries are keyed by URL (plus Accept header) and keep the ETag and
+    Last-Modified validators so requests can be revalidated with
+    If-None-Match / If-Modified-Since. The least recently used entries are
+    evicted once the stored bodies exceed ``max_bytes``.
+    """
+
+    def __init__(self, db_path: str = "seo_http_cache.db", max_bytes: int = 64 * 1024 * 1024):
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes_saved = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._init_db()
+        self._total_bytes = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def _init_db(self):
+        """Create table if it doesn't exist."""
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                headers TEXT NOT NULL,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                last_used REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_lru ON responses (last_used)")
+        self._conn.commit()
+
+    def get(self, key: str) -> dict | None:
+        """Return the stored entry for ``key`` (and mark it as recently used)."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, headers, body FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+        return {"etag": row[0], "last_modified": row[1], "headers": json.loads(row[2]), "body": row[3]}
+
+    def put(self, key: str, etag: str | None, last_modified: str | None, headers: dict, body: bytes):
+        """Store a response, evicting least recently used entries beyond ``max_bytes``."""
+        size = len(body)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self._conn.execute("""
+                INSERT OR REPLACE INTO responses (key, etag, last_modified, headers, body, size, last_used)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, (key, etag, last_modified, json.dumps(headers), body, size, time.time()))
+            self._total_bytes += size - (old[0] if old else 0)
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        while self._total_bytes > self.max_bytes:
+            key, size = self._conn.execute(
+                "SELECT key, size FROM responses ORDER BY last_used ASC LIMIT 1").fetchone()
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._total_bytes -= size
+            self.evictions += 1
+
+    def record(self, hit: bool, size: int = 0):
+        with self._lock:
+            if hit:
+                self.hits += 1
+                self.bytes_saved += size
+            else:
+                self.misses += 1
+
+    def stats(self) -> dict:
+        """Counters for the run summary."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "bytes_saved": self.bytes_saved,
+                "evictions": self.evictions,
+                "stored_bytes": self._total_bytes,
+            }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class CachingAdapter(HTTPAdapter):
+    """
+    Transport adapter that turns GETs into conditional requests.
+
+    A 304 Not Modified reply is answered from the ``ResponseCache``; GitHub
+    does not count those against the rate limit. Without a cache requests
+    pass straight through.
+    """
+
+    def __init__(self, cache: ResponseCache | None = None, **kwargs):
+        super().__init__(**kwargs)
+        self.cache = cache
+
+    def send(self, request: requests.PreparedRequest, stream: bool = False, **kwargs) -> requests.Response:
+        if self.cache is None or request.method != "GET" or stream:
+            return super().send(request, stream=stream, **kwargs)
+
+        key = f"{request.url}|{request.headers.get('Accept', '')}"
+        entry = self.cache.get(key)
+        if entry is not None:
+            if entry["etag"]:
+                request.headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                request.headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = super().send(request, stream=stream, **kwargs)
+
+        if response.status_code == 304 and entry is not None:
+            self.cache.record(hit=True, size=len(entry["body"]))
+            return self._from_cache(request, entry, response)
+
+        self.cache.record(hit=False)
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if response.status_code == 200 and (etag or last_modified):
+            self.cache.put(key, etag, last_modified, dict(response.headers), response.content)
+        return response
+
+    def _from_cache(self, request, entry: dict, fresh: requests.Response) -> requests.Response:
+        headers = CaseInsensitiveDict(entry["headers"])
+        for name in FRESH_HEADERS:
+            if name in fresh.headers:
+                headers[name] = fresh.headers[name]
+
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.headers = headers
+        response._content = entry["body"]
+        response.encoding = requests.utils.get_encoding_from_headers(headers)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.elapsed = fresh.elapsed
+        return response
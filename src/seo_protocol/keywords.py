@@ -0,0 +1,234 @@
+import hashlib
+import logging
+import os
+import re
+import threading
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
+
+logger = logging.getLogger(__name__)
+
+# NLTK's English stopword list, bundled so the 'simple' tokenizer never
+# needs a corpus download.
+ENGLISH_STOPWORDS = frozenset("""
+i me my myself we our ours ourselves you you're you've you'll you'd your yours
+yourself yourselves he him his himself she she's her hers herself it it's its
+itself they them their theirs themselves what which who whom this that that'll
+these those am is are was were be been being have has had having do does did
+doing a an the and but if or because as until while of at by for with about
+against between into through during before after above below to from up down
+in out on off over under again further then once here there when where why how
+all any both each few more most other some such no nor not only own same so
+than too very s t can will just don don't should should've now d ll m o re ve
+y ain aren aren't couldn couldn't didn didn't doesn doesn't hadn hadn't hasn
+hasn't haven haven't isn isn't ma mightn mightn't mustn mustn't needn needn't
+shan shan't shouldn shouldn't wasn wasn't weren weren't won won't wouldn
+wouldn't
+""".split())
+
+# Words (with inner hyphens/apostrophes/dots kept together, as word_tokenize
+# does for "smart-contract") or single punctuation marks.
+_TOKEN_RE = re.compile(r"[^\W_]+(?:[-'.][^\W_]+)*|[^\w\s]")
+
+# Separators inside a phrase: "smart-contract", "smart contract" and
+# "smart_contract" are the same term
+_PHRASE_SPLIT_RE = re.compile(r"[\s\-_]+")
+
+TOKENIZER_MODES = ("auto", "nltk", "simple")
+
+TREND_TERMS_PATH = os.path.join(os.path.dirname(__file__), "data", "trend_keywords.txt")
+
+_loaded = {}
+_load_lock = threading.Lock()
+
+
+def simple_tokenize(text: str) -> list[str]:
+    """Pure-Python tokenizer; close to ``nltk.word_tokenize`` for short texts."""
+    return _TOKEN_RE.findall(text)
+
+
+def _load_nltk(download: bool) -> tuple[Callable[[str], list[str]], frozenset[str]] | None:
+    """Import NLTK and its data; download missing data only if allowed."""
+    import nltk
+    from nltk.corpus import stopwords
+
+    def available(*paths: str) -> bool:
+        for path in paths:
+            try:
+                nltk.data.find(path)
+                return True
+            except LookupError:
+                pass
+        return False
+
+    # Newer NLTK releases read 'punkt_tab', older ones 'punkt'
+    needed = {"punkt_tab": ("tokenizers/punkt_tab", "tokenizers/punkt"),
+              "stopwords": ("corpora/stopwords",)}
+    for package, paths in needed.items():
+        if not available(*paths):
+            if not download or not nltk.download(package, quiet=True):
+                return None
+
+    return nltk.word_tokenize, frozenset(stopwords.words('english'))
+
+
+def load_tokenizer(mode: str = "auto") -> tuple[Callable[[str], list[str]], frozenset[str]]:
+    """
+    Return ``(tokenize, stopwords)`` for ``mode``, loading it once per process.
+
+      • 'simple' — bundled regex tokenizer and stopword list, no NLTK at all
+      • 'nltk'   — NLTK, downloading its data on first use if it is missing
+      • 'auto'   — NLTK if its data is already installed, otherwise 'simple'
+
+    Nothing is imported or downloaded until the first call.
+    """
+    if mode not in TOKENIZER_MODES:
+        raise ValueError(f"Unknown tokenizer mode: {mode}")
+
+    with _load_lock:
+        if mode not in _loaded:
+            loaded = None
+            if mode != "simple":
+                try:
+                    loaded = _load_nltk(download=mode == "nltk")
+                except ImportError:
+                    loaded = None
+                if loaded is None:
+                    logger.info(f"NLTK data unavailable ({mode} mode), using the bundled tokenizer")
+            _loaded[mode] = loaded or (simple_tokenize, ENGLISH_STOPWORDS)
+        return _loaded[mode]
+
+
+def phrase_tokens(term: str) -> tuple[str, ...]:
+    """Canonical word sequence of a term or token ("Smart-Contract" → ("smart", "contract"))."""
+    return tuple(part for part in _PHRASE_SPLIT_RE.split(term.lower()) if part)
+
+
+class TrendIndex:
+    """
+    Aho-Corasick automaton over the words of a trend vocabulary.
+
+    Terms may be single words or phrases; hyphens, underscores and spaces
+    inside them are equivalent. ``find`` scans a token stream once and
+    reports every term it contains, whatever the vocabulary size. Terms
+    keep their order, which is the order they are suggested in.
+    """
+
+    def __init__(self, terms: Iterable[str]):
+        self.terms = {}                     # canonical words → term as written, in order
+        for term in terms:
+            words = phrase_tokens(term)
+            if words:
+                self.terms.setdefault(words, term.strip().lower())
+        self.ordered = tuple(self.terms.values())
+        self.all_terms = frozenset(self.ordered)
+        self.digest = hashlib.sha256("\n".join(sorted(self.all_terms)).encode("utf-8")).hexdigest()
+        self._build()
+
+    @classmethod
+    def from_file(cls, path: str) -> "TrendIndex":
+        """One term per line; blank lines and ``#`` comments are skipped."""
+        with open(path, encoding="utf-8") as f:
+            return cls(line.split("#", 1)[0] for line in f)
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def _build(self):
+        # State 0 is the root; _goto[s] maps a word to the next state
+        self._goto = [{}]
+        self._out = [()]
+        for words, term in self.terms.items():
+            state = 0
+            for word in words:
+                if word not in self._goto[state]:
+                    self._goto.append({})
+                    self._out.append(())
+                    self._goto[state][word] = len(self._goto) - 1
+                state = self._goto[state][word]
+            self._out[state] += (term,)
+
+        # Breadth-first failure links; outputs of the failure state are merged in
+        self._fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for word, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and word not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(word, 0)
+                self._out[child] += self._out[self._fail[child]]
+
+    def find(self, words: Iterable[str]) -> set[str]:
+        """Terms occurring in ``words`` (lowercase, one word per item)."""
+        goto, fail, out = self._goto, self._fail, self._out
+        found = set()
+        state = 0
+        for word in words:
+            while state and word not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(word, 0)
+            if out[state]:
+                found.update(out[state])
+        return found
+
+
+def load_trend_index(path: str | None = None) -> TrendIndex:
+    """The ``TrendIndex`` of ``path`` (default: the bundled vocabulary), built once per process."""
+    path = os.path.abspath(path or TREND_TERMS_PATH)
+    with _load_lock:
+        key = ("trends", path)
+        if key not in _loaded:
+            _loaded[key] = TrendIndex.from_file(path)
+            logger.debug(f"Loaded {len(_loaded[key])} trend terms from {path}")
+        return _loaded[key]
+
+
+class KeywordExtractor:
+    """
+    Keywords of repository descriptions and topics, and the trend terms
+    they are missing.
+
+    The tokenizer, stopwords and trend automaton are loaded once; use
+    ``extract_many`` for batches. At most ``max_suggestions`` missing terms
+    are returned, the first ones of the vocabulary.
+    """
+
+    def __init__(self,
+                 tokenizer: str = "auto",
+                 trends: TrendIndex | None = None,
+                 max_suggestions: int = 25):
+        self.tokenize, self.stop_words = load_tokenizer(tokenizer)
+        self.trends = trends if trends is not None else load_trend_index()
+        self.max_suggestions = max_suggestions
+
+    def extract(self, description: str | None, topics: Iterable[str] | None) -> tuple[list[str], list[str]]:
+        """
+        ``(keywords, suggested)``: the description and topic words that are
+        not stopwords (hyphenated words such as "smart-contract" included),
+        and the trend terms that occur in neither, in vocabulary order.
+        """
+        text = (description or "").lower() + " " + " ".join(t.lower() for t in topics or ())
+        tokens = self.tokenize(text)
+        stop_words = self.stop_words
+        keywords = [w for w in tokens
+                    if w not in stop_words and (w.isalnum() or w.replace("-", "").isalnum())]
+        words = []
+        for token in tokens:
+            if "-" in token or "_" in token:
+                words.extend(phrase_tokens(token))
+            else:
+                words.append(token)
+        found = self.trends.find(words)
+        # Only walk as far into the vocabulary as needed for max_suggestions
+        missing = (term for term in self.trends.ordered if term not in found)
+        return keywords, list(islice(missing, self.max_suggestions))
+
+    def extract_many(self,
+                     items: Iterable[tuple[str | None, Iterable[str] | None]]) -> Iterator[tuple[list[str], list[str]]]:
+        """``extract`` for each ``(description, topics)`` pair, lazily and in order."""
+        for description, topics in items:
+            yield self.extract(description, topics)
@@ -0,0 +1,99 @@
+# src/seo_protocol/metrics_codec.py
+"""
+Compact binary encoding of a metrics snapshot.
+
+A snapshot is packed as a list of unsigned LEB128 varints:
+
+    <layout version> <field 1> <field 2> ...
+
+where the layout (an ordered list of ``(name, kind)`` fields) is looked up
+by version. Each field is stored as ``zigzag(value) + 1`` so that 0 means
+"missing"; trailing missing fields are dropped. Typical GitHub counters
+fit in 1–3 bytes, so a full snapshot takes about 15 bytes.
+
+Layouts only ever grow: a new metric is appended as a new layout version,
+so blobs written with an older layout keep decoding unchanged.
+"""
+from collections.abc import Iterator
+
+# Metrics known at the time of writing, in storage order
+DEFAULT_LAYOUT = (
+    ("stars", "int"),
+    ("forks", "int"),
+    ("watchers", "int"),
+    ("contributors", "int"),
+    ("commits", "int"),
+    ("issues", "int"),
+    ("views_last_14d", "int"),
+    ("clones_last_14d", "int"),
+    ("has_readme", "bool"),
+    ("has_license", "bool"),
+)
+
+
+def encode_varints(values) -> bytes:
+    """Unsigned LEB128 encoding of non-negative integers."""
+    out = bytearray()
+    for value in values:
+        while value > 0x7F:
+            out.append((value & 0x7F) | 0x80)
+            value >>= 7
+        out.append(value)
+    return bytes(out)
+
+
+def iter_varints(blob: bytes) -> Iterator[int]:
+    """Decode unsigned LEB128 integers one at a time."""
+    value = shift = 0
+    for byte in blob:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            yield value
+            value = shift = 0
+
+
+def decode_varints(blob: bytes) -> list[int]:
+    return list(iter_varints(blob))
+
+
+def layout_version(blob: bytes) -> int:
+    """Layout version of a packed snapshot, without decoding its fields."""
+    return next(iter_varints(blob))
+
+
+def field_kind(value) -> str | None:
+    """Storage kind of a metric value, or None if it cannot be packed."""
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, int):
+        return "int"
+    return None
+
+
+def pack(metrics: dict, version: int, layout) -> bytes:
+    """Pack ``metrics`` with ``layout``; metrics missing from it are skipped."""
+    encoded = [version]
+    for name, _ in layout:
+        value = metrics.get(name)
+        if value is None:
+            encoded.append(0)
+        else:
+            value = int(value)
+            encoded.append(((value << 1) ^ (value >> 63)) + 1)
+    while encoded[-1] == 0 and len(encoded) > 1:
+        encoded.pop()
+    return encode_varints(encoded)
+
+
+def unpack(blob: bytes, layouts: dict) -> dict:
+    """Decode a packed snapshot; ``layouts`` maps version → layout."""
+    version, *encoded = decode_varints(blob)
+    metrics = {}
+    for (name, kind), raw in zip(layouts[version], encoded):
+        if raw == 0:
+            continue
+        value = ((raw - 1) >> 1) ^ -((raw - 1) & 1)
+        metrics[name] = bool(value) if kind == "bool" else value
+    return metrics
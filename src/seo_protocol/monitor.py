@@ -1,66 +1,600 @@
 # src/seo_protocol/monitor.py
+import json
 import logging
 import sqlite3
-from datetime import datetime, timedelta, timezone 
+import threading
+import time
+from array import array
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from itertools import islice
+from typing import NamedTuple
+from .metrics_codec import DEFAULT_LAYOUT, field_kind, layout_version, pack, unpack
+from datetime import datetime, timezone
 
 
 
 logger = logging.getLogger(__name__)
 
+# Tuned for many small writes: WAL lets readers run alongside the writer,
+# and synchronous=NORMAL only fsyncs at checkpoints (still crash-safe in WAL).
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-16000",     # 16 MB page cache per connection
+    "PRAGMA temp_store=MEMORY",
+)
+
+# Databases at this version skip ``_init_db``: bump it with every table or
+# column it adds (3: readme_cache; 4: corpus_documents; 5: corpus scores).
+SCHEMA_VERSION = 5
+
+# Rollup tables maintained on every write: (name, bucket width in seconds,
+# offset aligning buckets; weeks start on Monday 00:00 UTC).
+ROLLUPS = (
+    ("hourly", 3600, 0),
+    ("daily", 86400, 0),
+    ("weekly", 7 * 86400, 3 * 86400),
+)
+
+# How long each level is kept by ``compact`` (None = forever)
+RETENTION_DAYS = {"raw": 30, "hourly": 180, "daily": 730, "weekly": None}
+
+INSERT_SNAPSHOT = """
+    INSERT INTO metrics (repo, ts, stars, forks, score, packed) VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT (repo, ts) DO UPDATE SET
+        stars = excluded.stars, forks = excluded.forks, score = excluded.score,
+        packed = excluded.packed
+"""
+
+# Default resolution of ``get_historical_data``: about this many points per range
+MAX_POINTS = 500
+
+def _bucket_sql(column: str, width: int, offset: int) -> str:
+    """SQL expression for the start of the bucket containing ``column``."""
+    return f"({column} - ({column} + {offset}) % {width})"
+
+
+def _iso(ts: int) -> str:
+    """Epoch seconds → naive UTC ISO string (the format of the old ``date`` column)."""
+    return datetime.fromtimestamp(ts, timezone.utc).replace(tzinfo=None).isoformat()
+
+
+class HistoryRow(NamedTuple):
+    """One history point as streamed by ``Monitor.iter_history``."""
+    ts: int
+    stars: int | None
+    forks: int | None
+    score: float | None
+    packed: bytes | None
+
+
 class Monitor:
-    """Simple local storage for historical metrics (SQLite)."""
+    """
+    Simple local storage for historical metrics (SQLite).
+
+    Each thread keeps one long-lived connection to the database. Every call
+    runs in its own transaction unless it happens inside ``session()``, which
+    groups any number of calls into a single commit.
+
+    Every snapshot keeps the full metrics vector packed into a small varint
+    blob (see ``metrics_codec``); stars, forks and score also have their own
+    columns. New metrics extend the packing layout as a new version stored
+    in ``metric_layouts``, so older snapshots stay readable.
 
-    def __init__(self, db_path: str = "seo_monitor.db"):
+    Snapshots are stored with epoch timestamps (``ts``) and rolled up into
+    hourly, daily and weekly tables as they are written, so long ranges are
+    read from a few hundred rollup rows instead of every raw snapshot.
+    ``compact`` applies the retention policy (``retention_days`` overrides
+    entries of ``RETENTION_DAYS``).
+    """
+
+    def __init__(self, db_path: str = "seo_monitor.db", retention_days: dict | None = None):
         self.db_path = db_path
-        self._init_db()
+        self.retention_days = {**RETENTION_DAYS, **(retention_days or {})}
+        self.analyses_reused = 0
+        self.analyses_computed = 0
+        self.readmes_reused = 0
+        self.readmes_parsed = 0
+        self._stats_lock = threading.Lock()
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+        self._layouts = {}
+        self._layout_lock = threading.Lock()
+        self._connection()
+
+    def _connection(self) -> sqlite3.Connection:
+        """
+        This thread's connection, opened (and tuned) on first use. A database
+        below ``SCHEMA_VERSION`` is upgraded first: the file may have been
+        created or replaced since another connection checked it.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # Threads never share a connection; check_same_thread=False only
+            # lets close() release them from whichever thread calls it.
+            conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+            for pragma in PRAGMAS:
+                conn.execute(pragma)
+            self._local.conn = conn
+            self._local.depth = 0
+            with self._connections_lock:
+                self._connections.append(conn)
+            if conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+                self._init_db()
+        return conn
+
+    @contextmanager
+    def session(self):
+        """
+        Group calls into one transaction on this thread's connection.
+
+        Commits when the outermost session exits and rolls back if it raises.
+        Yields the connection for ad-hoc queries.
+        """
+        conn = self._connection()
+        self._local.depth += 1
+        try:
+            yield conn
+        except BaseException:
+            self._local.depth -= 1
+            if self._local.depth == 0:
+                conn.rollback()
+            raise
+        self._local.depth -= 1
+        if self._local.depth == 0:
+            conn.commit()
+
+    def close(self):
+        """Close the connections of every thread; calls made afterwards open new ones."""
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
 
     def _init_db(self):
-        """Create table if it doesn't exist."""
+        """Create tables if they don't exist, migrating older schemas."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.session() as conn:
+                # Holds the write lock: another connection may be upgrading it too
+                conn.execute("BEGIN IMMEDIATE")
+                version = conn.execute("PRAGMA user_version").fetchone()[0]
+                if version >= SCHEMA_VERSION:
+                    return
+                columns = {row[1] for row in conn.execute("PRAGMA table_info(metrics)")}
+                migrate = "date" in columns
+                if migrate:
+                    conn.execute("ALTER TABLE metrics RENAME TO metrics_v0")
+
+                # WITHOUT ROWID: the (repo, ts) key is the table itself, so
+                # range scans per repo are covered without a separate index.
                 conn.execute("""
                     CREATE TABLE IF NOT EXISTS metrics (
                         repo TEXT NOT NULL,
-                        date TEXT NOT NULL,
+                        ts INTEGER NOT NULL,
                         stars INTEGER,
                         forks INTEGER,
                         score REAL,
-                        PRIMARY KEY (repo, date)
+                        packed BLOB,
+                        PRIMARY KEY (repo, ts)
+                    ) WITHOUT ROWID
+                """)
+                if version == 1:
+                    for table in ("metrics", *(f"metrics_{name}" for name, _, _ in ROLLUPS)):
+                        conn.execute(f"ALTER TABLE {table} ADD COLUMN packed BLOB")
+                for name, width, offset in ROLLUPS:
+                    conn.execute(f"""
+                        CREATE TABLE IF NOT EXISTS metrics_{name} (
+                            repo TEXT NOT NULL,
+                            bucket INTEGER NOT NULL,
+                            samples INTEGER NOT NULL,
+                            score_sum REAL,
+                            last_ts INTEGER NOT NULL,
+                            stars INTEGER,
+                            forks INTEGER,
+                            packed BLOB,
+                            PRIMARY KEY (repo, bucket)
+                        ) WITHOUT ROWID
+                    """)
+                    conn.execute(f"DROP TRIGGER IF EXISTS metrics_{name}_rollup")
+                    conn.execute(f"DROP TRIGGER IF EXISTS metrics_{name}_rollup_update")
+                    # Metrics are running totals: keep the latest snapshot of
+                    # the bucket; the score is averaged.
+                    conn.execute(f"""
+                        CREATE TRIGGER metrics_{name}_rollup
+                        AFTER INSERT ON metrics BEGIN
+                            INSERT INTO metrics_{name} (repo, bucket, samples, score_sum, last_ts,
+                                                        stars, forks, packed)
+                            VALUES (NEW.repo, {_bucket_sql("NEW.ts", width, offset)}, 1, NEW.score,
+                                    NEW.ts, NEW.stars, NEW.forks, NEW.packed)
+                            ON CONFLICT (repo, bucket) DO UPDATE SET
+                                samples = samples + 1,
+                                score_sum = score_sum + excluded.score_sum,
+                                stars = CASE WHEN excluded.last_ts >= last_ts THEN excluded.stars ELSE stars END,
+                                forks = CASE WHEN excluded.last_ts >= last_ts THEN excluded.forks ELSE forks END,
+                                packed = CASE WHEN excluded.last_ts >= last_ts THEN excluded.packed ELSE packed END,
+                                last_ts = MAX(last_ts, excluded.last_ts);
+                        END
+                    """)
+                    # A snapshot rewritten within the same second replaces its sample
+                    conn.execute(f"""
+                        CREATE TRIGGER metrics_{name}_rollup_update
+                        AFTER UPDATE ON metrics BEGIN
+                            UPDATE metrics_{name} SET
+                                score_sum = score_sum - OLD.score + NEW.score,
+                                stars = CASE WHEN last_ts = NEW.ts THEN NEW.stars ELSE stars END,
+                                forks = CASE WHEN last_ts = NEW.ts THEN NEW.forks ELSE forks END,
+                                packed = CASE WHEN last_ts = NEW.ts THEN NEW.packed ELSE packed END
+                            WHERE repo = NEW.repo AND bucket = {_bucket_sql("NEW.ts", width, offset)};
+                        END
+                    """)
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS metric_layouts (
+                        version INTEGER PRIMARY KEY,
+                        fields TEXT NOT NULL
+                    )
+                """)
+                conn.execute("INSERT OR IGNORE INTO metric_layouts (version, fields) VALUES (1, ?)",
+                             (json.dumps(DEFAULT_LAYOUT),))
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS analysis_cache (
+                        repo TEXT PRIMARY KEY,
+                        fingerprint TEXT NOT NULL,
+                        result TEXT NOT NULL,
+                        updated TEXT NOT NULL
                     )
                 """)
-                conn.commit()
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS readme_cache (
+                        repo TEXT PRIMARY KEY,
+                        sha TEXT NOT NULL,
+                        keywords TEXT NOT NULL,
+                        stats TEXT NOT NULL,
+                        updated TEXT NOT NULL
+                    )
+                """)
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS corpus_documents (
+                        repo TEXT PRIMARY KEY,
+                        terms TEXT NOT NULL,
+                        score REAL,
+                        updated TEXT NOT NULL
+                    )
+                """)
+                if "score" not in {row[1] for row in conn.execute("PRAGMA table_info(corpus_documents)")}:
+                    conn.execute("ALTER TABLE corpus_documents ADD COLUMN score REAL")
+
+                if migrate:
+                    self._migrate_v0(conn)
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
         except sqlite3.Error as e:
             logger.error(f"Database initialization failed: {e}")
 
+    def _load_layouts(self, conn: sqlite3.Connection):
+        self._layouts = {
+            version: tuple(tuple(field) for field in json.loads(fields))
+            for version, fields in conn.execute("SELECT version, fields FROM metric_layouts")
+        }
+
+    def _packer(self, conn: sqlite3.Connection, metrics: dict):
+        """
+        Return a function packing metrics dicts with the latest layout,
+        first adding any metric of ``metrics`` the layout does not cover yet.
+        """
+        with self._layout_lock:
+            if not self._layouts:
+                self._load_layouts(conn)
+            version = max(self._layouts)
+            known = {name for name, _ in self._layouts[version]}
+            new = sorted((name, field_kind(value)) for name, value in metrics.items()
+                         if name not in known and field_kind(value))
+            if new:
+                # Another process may have extended the layout meanwhile
+                self._load_layouts(conn)
+                version = max(self._layouts)
+                known = {name for name, _ in self._layouts[version]}
+                new = [field for field in new if field[0] not in known]
+            if new:
+                layout = self._layouts[version] + tuple(new)
+                version += 1
+                conn.execute("INSERT INTO metric_layouts (version, fields) VALUES (?, ?)",
+                             (version, json.dumps(layout)))
+                self._layouts[version] = layout
+                logger.info(f"Metrics layout v{version} adds {', '.join(name for name, _ in new)}")
+            layout = self._layouts[version]
+        return lambda m: pack(m, version, layout)
+
+    def _unpack(self, conn: sqlite3.Connection, blob: bytes | None) -> dict:
+        if blob is None:
+            return {}
+        if layout_version(blob) not in self._layouts:
+            with self._layout_lock:
+                self._load_layouts(conn)
+        return unpack(blob, self._layouts)
+
+    @staticmethod
+    def _migrate_v0(conn: sqlite3.Connection):
+        """Move rows of the ISO-text ``date`` schema into the epoch schema."""
+        # The insert triggers fill the rollups while copying. Snapshots within
+        # the same second collapse into the latest one (SQLite takes the bare
+        # columns from the row that has the MAX()).
+        conn.execute("""
+            INSERT INTO metrics (repo, ts, stars, forks, score)
+            SELECT repo, ts, stars, forks, score FROM (
+                SELECT repo, CAST(strftime('%s', date) AS INTEGER) AS ts,
+                       MAX(date), stars, forks, score
+                FROM metrics_v0
+                WHERE strftime('%s', date) IS NOT NULL
+                GROUP BY repo, ts
+            )
+            ORDER BY repo, ts
+        """)
+        migrated = conn.execute("SELECT COUNT(*) FROM metrics_v0").fetchone()[0]
+        conn.execute("DROP TABLE metrics_v0")
+        logger.info(f"Migrated {migrated} snapshots to the epoch timestamp schema")
+
     def save_current_metrics(self, repo: str, metrics: dict, score: float):
         """Save current snapshot of important metrics."""
         try:
-            date_str = datetime.utcnow().isoformat()
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("""
-                    INSERT OR REPLACE INTO metrics (repo, date, stars, forks, score)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (repo, date_str, metrics.get('stars'), metrics.get('forks'), score))
-                conn.commit()
+            with self.session() as conn:
+                packed = self._packer(conn, metrics)(metrics)
+                conn.execute(INSERT_SNAPSHOT, (repo, int(time.time()), metrics.get('stars'),
+                                               metrics.get('forks'), score, packed))
         except sqlite3.Error as e:
             logger.error(f"Failed to save metrics to database: {e}")
 
-    def get_historical_data(self, repo: str, days_back: int = 90) -> list[dict]:
-        """Get historical data for the given repository."""
+    def save_many(self,
+                  snapshots: Iterable[tuple[str, dict, float]],
+                  chunk_size: int = 5000,
+                  ts: int | None = None) -> int:
+        """
+        Save many ``(repo, metrics, score)`` snapshots at once.
+
+        ``snapshots`` is consumed lazily (a generator is fine); rows are written
+        with ``executemany`` in transactions of ``chunk_size`` rows and share
+        one timestamp (``ts``, default now). Returns the number of rows written.
+        """
+        ts = int(time.time()) if ts is None else ts
+        written = 0
+        start = time.perf_counter()
         try:
-            cutoff = (datetime.utcnow() - timedelta(days=days_back)).isoformat()
-            with sqlite3.connect(self.db_path) as conn:
+            snapshots = iter(snapshots)
+            while chunk := list(islice(snapshots, chunk_size)):
+                with self.session() as conn:
+                    packer = self._packer(conn, {k: v for _, m, _ in chunk for k, v in m.items()})
+                    conn.executemany(INSERT_SNAPSHOT, [
+                        (repo, ts, metrics.get('stars'), metrics.get('forks'), score, packer(metrics))
+                        for repo, metrics, score in chunk
+                    ])
+                written += len(chunk)
+        except sqlite3.Error as e:
+            logger.error(f"Failed to save metrics to database after {written} rows: {e}")
+        elapsed = time.perf_counter() - start
+        rate = written / elapsed if elapsed > 0 else float(written)
+        logger.info(f"Saved {written} snapshots in {elapsed:.2f}s ({rate:,.0f} rows/s)")
+        return written
+
+    def get_historical_data(self,
+                            repo: str,
+                            days_back: int = 90,
+                            resolution: int | None = None) -> list[dict]:
+        """
+        Get historical data for the given repository.
+
+        ``resolution`` is the coarsest spacing (in seconds) the caller can use;
+        by default about ``MAX_POINTS`` points over the range. Reads come from
+        the coarsest table (raw, hourly, daily, weekly) that is fine enough and
+        still retains the whole range; rollup rows carry the last metrics of
+        their bucket and the average score. Each row holds every stored
+        metric plus ``date``, ``ts`` and ``score``.
+
+        Builds the whole list; use ``iter_history`` or ``get_history_columns``
+        for long ranges.
+        """
+        return [
+            {"date": _iso(row.ts), "ts": row.ts, **self.unpack_metrics(row),
+             "stars": row.stars, "forks": row.forks, "score": row.score}
+            for row in self.iter_history(repo, days_back, resolution)
+        ]
+
+    def iter_history(self,
+                     repo: str,
+                     days_back: int = 90,
+                     resolution: int | None = None,
+                     chunk_size: int = 1000) -> Iterator[HistoryRow]:
+        """
+        Stream the history of ``repo`` as ``HistoryRow`` tuples, oldest first.
+
+        Same level selection as ``get_historical_data``; rows are fetched
+        ``chunk_size`` at a time, so memory does not grow with the range.
+        Other metrics stay packed until ``unpack_metrics`` is called.
+        """
+        cutoff = int(time.time()) - days_back * 86400
+        if resolution is None:
+            resolution = days_back * 86400 // MAX_POINTS
+        level, width, offset = self._pick_level(days_back, resolution)
+        # Plain reads need no transaction; a session would stay open for as
+        # long as the caller keeps the generator suspended.
+        conn = self._connection()
+        try:
+            if level == "raw":
                 cursor = conn.execute("""
-                    SELECT date, stars, forks, score
+                    SELECT ts, stars, forks, score, packed
                     FROM metrics
-                    WHERE repo = ? AND date > ?
-                    ORDER BY date ASC
+                    WHERE repo = ? AND ts > ?
+                    ORDER BY ts ASC
                 """, (repo, cutoff))
-
-                return [
-                    {"date": row[0], "stars": row[1], "forks": row[2], "score": row[3]}
-                    for row in cursor.fetchall()
-                ]
+            else:
+                cursor = conn.execute(f"""
+                    SELECT last_ts, stars, forks, score_sum / samples, packed
+                    FROM metrics_{level}
+                    WHERE repo = ? AND bucket >= ?
+                    ORDER BY bucket ASC
+                """, (repo, cutoff - (cutoff + offset) % width))
+            while rows := cursor.fetchmany(chunk_size):
+                yield from map(HistoryRow._make, rows)
         except sqlite3.Error as e:
             logger.error(f"Failed to read historical data: {e}")
-            return []
+
+    def get_history_columns(self,
+                            repo: str,
+                            days_back: int = 90,
+                            resolution: int | None = None,
+                            metrics: Iterable[str] = ("stars", "forks", "score")) -> dict:
+        """
+        History of ``repo`` as NumPy arrays, one per metric plus ``ts``.
+
+        ``ts`` is int64; metrics are float64 with NaN where a snapshot lacks
+        the value. Rows are streamed into compact typed buffers, so only the
+        arrays themselves are ever held in memory.
+        """
+        import numpy as np
+
+        metrics = list(metrics)
+        direct = {"stars": 1, "forks": 2, "score": 3}
+        ts = array("q")
+        columns = {name: array("d") for name in metrics}
+        nan = float("nan")
+        for row in self.iter_history(repo, days_back, resolution):
+            ts.append(row.ts)
+            unpacked = self.unpack_metrics(row) if any(m not in direct for m in metrics) else {}
+            for name, column in columns.items():
+                value = row[direct[name]] if name in direct else unpacked.get(name)
+                column.append(nan if value is None else value)
+        return {"ts": np.frombuffer(ts, dtype=np.int64),
+                **{name: np.frombuffer(column, dtype=np.float64) for name, column in columns.items()}}
+
+    def unpack_metrics(self, row: HistoryRow) -> dict:
+        """Every metric stored with a history row (decoded from ``row.packed``)."""
+        return self._unpack(self._connection(), row.packed)
+
+    def _pick_level(self, days_back: int, resolution: int) -> tuple[str, int, int]:
+        """Coarsest level no coarser than ``resolution`` that retains ``days_back``."""
+        levels = [("raw", 1, 0), *ROLLUPS]
+
+        def retains(name: str) -> bool:
+            keep = self.retention_days.get(name)
+            return keep is None or keep >= days_back
+
+        fine_enough = [lvl for lvl in levels if lvl[1] <= max(resolution, 1) and retains(lvl[0])]
+        if fine_enough:
+            return fine_enough[-1]
+        # Nothing that fine is kept that long: use the finest level that is
+        return next(lvl for lvl in levels if retains(lvl[0]))
+
+    def compact(self, vacuum: bool = False) -> dict:
+        """
+        Apply the retention policy: drop raw snapshots and rollup rows older
+        than ``retention_days`` for their level. Returns rows deleted per level.
+        """
+        now = int(time.time())
+        tables = {"raw": "metrics", **{name: f"metrics_{name}" for name, _, _ in ROLLUPS}}
+        deleted = {}
+        try:
+            with self.session() as conn:
+                for level, table in tables.items():
+                    keep = self.retention_days.get(level)
+                    if keep is None:
+                        continue
+                    column = "ts" if level == "raw" else "last_ts"
+                    cursor = conn.execute(f"DELETE FROM {table} WHERE {column} < ?", (now - keep * 86400,))
+                    deleted[level] = cursor.rowcount
+                conn.execute("PRAGMA optimize")
+            if vacuum:
+                self._connection().execute("VACUUM")
+        except sqlite3.Error as e:
+            logger.error(f"History compaction failed: {e}")
+        logger.info(f"Compacted history: {deleted}")
+        return deleted
+
+    def get_cached_analysis(self, repo: str, fingerprint: str) -> dict | None:
+        """Return the last stored analysis of ``repo`` if its inputs had ``fingerprint``."""
+        try:
+            with self.session() as conn:
+                row = conn.execute(
+                    "SELECT result FROM analysis_cache WHERE repo = ? AND fingerprint = ?",
+                    (repo, fingerprint)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.error(f"Failed to read cached analysis: {e}")
+            row = None
+        with self._stats_lock:
+            if row is None:
+                self.analyses_computed += 1
+            else:
+                self.analyses_reused += 1
+        return json.loads(row[0]) if row else None
+
+    def save_analysis(self, repo: str, fingerprint: str, result: dict):
+        """Store the analysis of ``repo`` together with the fingerprint of its inputs."""
+        try:
+            with self.session() as conn:
+                conn.execute("""
+                    INSERT OR REPLACE INTO analysis_cache (repo, fingerprint, result, updated)
+                    VALUES (?, ?, ?, ?)
+                """, (repo, fingerprint, json.dumps(result), datetime.utcnow().isoformat()))
+        except sqlite3.Error as e:
+            logger.error(f"Failed to cache analysis: {e}")
+
+    def analysis_stats(self) -> dict:
+        """How many analyses were reused vs. recomputed (incremental mode)."""
+        with self._stats_lock:
+            return {"reused": self.analyses_reused, "recomputed": self.analyses_computed}
+
+    def get_readme_stats(self, repo: str, sha: str, keywords_key: str) -> dict | None:
+        """README statistics of ``repo`` if they were computed for blob ``sha`` and these keywords."""
+        try:
+            with self.session() as conn:
+                row = conn.execute(
+                    "SELECT stats FROM readme_cache WHERE repo = ? AND sha = ? AND keywords = ?",
+                    (repo, sha, keywords_key)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.error(f"Failed to read cached README stats: {e}")
+            row = None
+        with self._stats_lock:
+            if row is None:
+                self.readmes_parsed += 1
+            else:
+                self.readmes_reused += 1
+        return json.loads(row[0]) if row else None
+
+    def save_readme_stats(self, repo: str, sha: str, keywords_key: str, stats: dict):
+        """Store the README statistics of ``repo`` (one entry per repo, replaced on change)."""
+        try:
+            with self.session() as conn:
+                conn.execute("""
+                    INSERT OR REPLACE INTO readme_cache (repo, sha, keywords, stats, updated)
+                    VALUES (?, ?, ?, ?, ?)
+                """, (repo, sha, keywords_key, json.dumps(stats), datetime.utcnow().isoformat()))
+        except sqlite3.Error as e:
+            logger.error(f"Failed to cache README stats: {e}")
+
+    def readme_cache_stats(self) -> dict:
+        """How many README analyses were reused vs. parsed."""
+        with self._stats_lock:
+            return {"reused": self.readmes_reused, "parsed": self.readmes_parsed}
+
+    def save_corpus_document(self, repo: str, terms: dict[str, int], score: float | None = None):
+        """Store the term counts and score ``repo`` contributes to the keyword corpus (replacing earlier ones)."""
+        try:
+            with self.session() as conn:
+                conn.execute("""
+                    INSERT OR REPLACE INTO corpus_documents (repo, terms, score, updated)
+                    VALUES (?, ?, ?, ?)
+                """, (repo, json.dumps(terms), score, datetime.utcnow().isoformat()))
+        except sqlite3.Error as e:
+            logger.error(f"Failed to save corpus document: {e}")
+
+    def iter_corpus_documents(self, chunk_size: int = 1000) -> Iterator[tuple[str, dict[str, int], float | None]]:
+        """Stream every stored ``(repo, term counts, score)`` of the keyword corpus."""
+        conn = self._connection()
+        try:
+            cursor = conn.execute("SELECT repo, terms, score FROM corpus_documents")
+            while rows := cursor.fetchmany(chunk_size):
+                for repo, terms, score in rows:
+                    yield repo, json.loads(terms), score
+        except sqlite3.Error as e:
+            logger.error(f"Failed to read corpus documents: {e}")
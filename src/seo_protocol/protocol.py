@@ -0,0 +1,238 @@
+import logging
+from collections.abc import Iterable
+from contextlib import nullcontext
+from itertools import islice
+from .chart_cache import ChartCache
+from .charter import Charter
+from .corpus import KeywordCorpus, document_terms
+from .github_api import SharedGitHubClient
+from .http_cache import ResponseCache
+from .keywords import load_trend_index
+from .monitor import Monitor
+from .seo_analyzer import SEOAnalyzer
+from .seo_booster import SEOBooster
+from .seo_report import SEOReport, fleet_row
+from .token_pool import TokenPool
+
+logger = logging.getLogger(__name__)
+
+# Finished repositories of a batch whose charts are rendered together
+CHART_BATCH = 32
+
+class SEOProtocol:
+    """
+    Runs the full pipeline for a repository:
+    analyze → store snapshot → chart history → suggestions → report file.
+
+    ``repo_name`` may be None when the instance is only used for ``run_batch``.
+    ``token`` may be a list of tokens that are pooled into one quota.
+    GitHub responses are revalidated against the on-disk cache at
+    ``http_cache_path`` (None disables it).
+    Charts are PNG images, or lightweight SVG sparklines with ``chart_format="svg"``;
+    rendered charts are kept in ``chart_cache_dir`` (None disables it).
+    ``trends_path`` is a file of trend terms to suggest instead of the bundled list.
+    Every analyzed repository joins a corpus of the repositories analyzed
+    so far (see ``KeywordCorpus``); reports compare its score with its
+    ``cohort_size`` most similar ones. With ``suggestions="corpus"``
+    suggested keywords are ranked by what those repositories use, falling
+    back to missing trend terms while there are too few of them;
+    ``"trends"`` always lists the missing trend terms.
+    With ``incremental=True`` repositories whose inputs did not change since
+    the last run reuse the analysis stored in the monitor database.
+    Every run ends by applying the history retention policy (see
+    ``Monitor.compact``), so old raw snapshots do not pile up.
+    """
+
+    def __init__(self,
+                 repo_name: str | None,
+                 token: str | list[str],
+                 google_service_json: str | None = None,
+                 db_path: str = "seo_monitor.db",
+                 analyzer: SEOAnalyzer | None = None,
+                 http_cache_path: str | None = "seo_http_cache.db",
+                 http_cache_max_bytes: int = 64 * 1024 * 1024,
+                 incremental: bool = False,
+                 chart_format: str = "png",
+                 chart_cache_dir: str | None = "seo_chart_cache",
+                 chart_cache_max_bytes: int = 32 * 1024 * 1024,
+                 trends_path: str | None = None,
+                 suggestions: str = "corpus",
+                 cohort_size: int = 25):
+        if suggestions not in ("corpus", "trends"):
+            raise ValueError(f"Unknown suggestions mode: {suggestions}")
+        self.repo_name = repo_name
+        self.token = token
+        self.google_service_json = google_service_json
+        self.monitor = Monitor(db_path)
+        self.analyzer = analyzer
+        self.incremental = incremental
+        self.trends = load_trend_index(trends_path) if trends_path else None
+        self.suggestions = suggestions
+        self.cohort_size = cohort_size
+        self._corpus = None
+        self.chart_cache = ChartCache(chart_cache_dir, chart_cache_max_bytes) if chart_cache_dir else None
+        self.charter = Charter(chart_format, cache=self.chart_cache)
+        self.http_cache = ResponseCache(http_cache_path, http_cache_max_bytes) if http_cache_path else None
+        self.client = SharedGitHubClient(token, cache=self.http_cache)
+
+    def run_pipeline(self,
+                     output_format: str = "md",
+                     history_days: int = 30,
+                     min_score: float = 50.0) -> str:
+        """Analyze the repository and write its report. Returns the report path."""
+        analyzer = self.analyzer or SEOAnalyzer(self.token, self.repo_name, client=self.client.get(),
+                                                   trends=self.trends)
+        result = analyzer.analyze(monitor=self.monitor if self.incremental else None,
+                                  readme_cache=self.monitor)
+        from . import analytics  # NumPy is only loaded once a report is published
+
+        result, history = self._store(self.repo_name, result, history_days)
+        chart = self.charter.generate_stars_trend_chart(history) if self._charted(output_format) else None
+        trends = analytics.repo_trends(self.monitor, self.repo_name, history_days)
+        path, _ = self._publish(self.repo_name, result, history, chart, trends, output_format, min_score)
+        self.monitor.compact()
+        self._log_summary()
+        return path
+
+    def run_batch(self,
+                  repo_names: Iterable[str],
+                  output_format: str = "md",
+                  history_days: int = 30,
+                  min_score: float = 50.0,
+                  max_workers: int = 8,
+                  fleet_format: str | None = None,
+                  fleet_path: str | None = None) -> dict[str, str | None]:
+        """
+        Analyze many repositories concurrently and write one report per repo.
+
+        Reports are written as repositories finish, in groups of up to
+        ``CHART_BATCH`` whose charts are rendered in parallel by a process
+        pool that lives as long as the batch, and whose trends are computed
+        in one vectorized pass.
+        With ``fleet_format`` ("html", "md" or "jsonl") one dashboard of the
+        whole batch is also written to ``fleet_path`` (default
+        ``seo_fleet_report.<format>``), streamed as repositories finish.
+        Returns a mapping of repo name → report path (None on failure).
+        """
+        written = {}
+        results = SEOAnalyzer.analyze_many(self.token, repo_names, max_workers, client=self.client,
+                                           monitor=self.monitor if self.incremental else None,
+                                           trends=self.trends, readme_cache=self.monitor)
+        charted = self._charted(output_format)
+
+        def published(pool):
+            from . import analytics
+
+            while chunk := list(islice(results, CHART_BATCH)):
+                stored = {}
+                for repo_name, result in chunk:
+                    if "error" in result:
+                        written[repo_name] = None
+                    else:
+                        stored[repo_name] = self._store(repo_name, result, history_days)
+                histories = {repo_name: history for repo_name, (_, history) in stored.items()}
+                charts = self.charter.render_many(histories, pool=pool) if charted else {}
+                trends = analytics.fleet_trends(self.monitor, list(stored), history_days)
+                for repo_name, (result, history) in stored.items():
+                    written[repo_name], row = self._publish(repo_name, result, history, charts.get(repo_name),
+                                                            trends[repo_name], output_format, min_score)
+                    yield row
+
+        try:
+            with self.charter.render_pool() if charted else nullcontext() as pool:
+                if fleet_format:
+                    SEOReport().write_fleet(published(pool), fleet_path or f"seo_fleet_report.{fleet_format}",
+                                            fleet_format)
+                else:
+                    for _ in published(pool):
+                        pass
+            self.monitor.compact()
+        finally:
+            # Waits for the analysis threads, then closes the connections
+            # they opened; the next call opens a fresh one
+            results.close()
+            self.monitor.close()
+        self._log_summary()
+        return written
+
+    def run_summary(self) -> dict:
+        """Counters describing the work done so far (e.g. HTTP cache hits)."""
+        scheduler = self.client.scheduler
+        section = "token_pool" if isinstance(scheduler, TokenPool) else "rate_limit"
+        summary = {section: scheduler.stats()}
+        if self.http_cache is not None:
+            summary["http_cache"] = self.http_cache.stats()
+        if self.chart_cache is not None:
+            summary["chart_cache"] = self.chart_cache.stats()
+        summary["readme_cache"] = self.monitor.readme_cache_stats()
+        if self._corpus is not None:
+            summary["corpus"] = self._corpus.stats()
+        if self.incremental:
+            summary["incremental"] = self.monitor.analysis_stats()
+        return summary
+
+    @property
+    def corpus(self) -> KeywordCorpus:
+        """The keyword corpus of every analyzed repository, loaded from the monitor database on first use."""
+        if self._corpus is None:
+            self._corpus = KeywordCorpus.from_monitor(self.monitor)
+        return self._corpus
+
+    def _compare_with_corpus(self, repo_name: str, result: dict) -> dict:
+        """
+        Add the repository to the corpus, compare its score with its cohort
+        and (in corpus mode) rank its suggested keywords by its neighbours.
+        """
+        terms = document_terms(result['keywords'], result.get('readme'))
+        self.corpus.add(repo_name, terms, result['score'])
+        self.monitor.save_corpus_document(repo_name, terms, result['score'])
+        result = {**result, "cohort": self.corpus.cohort(repo_name, self.cohort_size)}
+        if self.suggestions == "corpus":
+            ranked = self.corpus.suggest(repo_name)
+            if ranked:
+                result["suggested_keywords"] = ranked
+        return result
+
+    def _log_summary(self):
+        for section, stats in self.run_summary().items():
+            details = ", ".join(f"{k}={v}" for k, v in stats.items())
+            logger.info(f"Run summary [{section}]: {details}")
+
+    @staticmethod
+    def _charted(output_format: str) -> bool:
+        """JSON and MessagePack reports carry no chart, so rendering (and importing matplotlib) is skipped."""
+        return output_format not in ("json", "msgpack")
+
+    def _store(self, repo_name: str, result: dict, history_days: int) -> tuple[dict, list[dict]]:
+        """Record one analyzed repository; returns its result with the corpus comparison and its history."""
+        result = self._compare_with_corpus(repo_name, result)
+        self.monitor.save_current_metrics(repo_name, result['metrics'], result['score'])
+        history = self.monitor.get_historical_data(repo_name, days_back=history_days)
+        return result, history
+
+    def _publish(self,
+                 repo_name: str,
+                 result: dict,
+                 history: list[dict],
+                 chart: str | None,
+                 trends: dict,
+                 output_format: str,
+                 min_score: float) -> tuple[str, dict]:
+        """
+        Write the report of one stored repository (see ``_store``) with its
+        chart and trends; returns its path and fleet row.
+        """
+        repo_url = f"https://github.com/{repo_name}"
+        booster = SEOBooster(repo_url, self.google_service_json)
+        suggestions = booster.get_improvement_suggestions(
+            result['keywords'], result['suggested_keywords'], result['score'], min_score, trends,
+            result.get('readme'), result.get('cohort')
+        )
+        booster.try_submit_urls_to_google()
+
+        data = {"repo": repo_name, **result, "suggestions": suggestions, "trends": trends,
+                "metadata": self.run_summary()}
+        path = f"seo_report_{repo_name.replace('/', '_')}.{output_format}"
+        SEOReport().write(path, data, output_format, chart, self.charter.mime_type)
+        logger.info(f"Report written to {path}")
+        return path, fleet_row(data, history)
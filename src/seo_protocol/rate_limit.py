@@ -0,0 +1,211 @@
+import logging
+import random
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+
+class _Bucket:
+    """Token bucket for one GitHub rate-limit resource ('core', 'graphql', ...)."""
+
+    def __init__(self, rate: float, burst: int, now: float):
+        self.rate = rate                # tokens per second
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = now
+        self.remaining = None           # last X-RateLimit-Remaining seen
+        self.reset_at = None            # last X-RateLimit-Reset seen
+        self.paused_until = 0.0         # no requests before this moment
+        self.cautious_until = 0.0       # paced until this moment after being throttled
+
+    def refill(self, now: float, default_rate: float):
+        if self.reset_at is not None and now >= self.reset_at:
+            # New quota window: forget the old budget until headers say otherwise
+            self.rate, self.tokens = default_rate, float(self.burst)
+            self.remaining = self.reset_at = None
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def paced(self, now: float, reserve: int) -> bool:
+        """Whether requests must be spread out rather than sent as fast as they come."""
+        return now < self.cautious_until or (self.remaining is not None and self.remaining <= reserve)
+
+
+class RateLimitScheduler:
+    """
+    Paces every worker sharing a token against GitHub's rate limits.
+
+    While the remaining quota (``X-RateLimit-Remaining``) is above
+    ``reserve`` requests are sent as fast as the workers issue them. Below
+    it, and for ``cooldown`` seconds after GitHub asked to slow down
+    (secondary limit, ``Retry-After``), each resource is paced by a token
+    bucket whose refill rate is the remaining requests spread over the time
+    left until ``X-RateLimit-Reset``. When the quota is exhausted, or while a
+    ``Retry-After`` runs, the resource is paused and blocked callers sleep
+    until the pause ends instead of retrying on a fixed timer. Retries back
+    off exponentially with full jitter.
+    """
+
+    def __init__(self,
+                 requests_per_hour: int = 5000,
+                 burst: int = 10,
+                 reserve: int = 500,
+                 cooldown: float = 60.0,
+                 max_retries: int = 5,
+                 base_backoff: float = 1.0,
+                 max_backoff: float = 120.0,
+                 clock=time.time):
+        self.requests_per_hour = requests_per_hour
+        self.default_rate = requests_per_hour / 3600.0
+        self.burst = burst
+        self.reserve = reserve
+        self.cooldown = cooldown
+        self.max_retries = max_retries
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.clock = clock
+        self.throttle_waits = 0
+        self._buckets = {}
+        self._cond = threading.Condition()
+
+    @staticmethod
+    def resource_for(url: str) -> str:
+        return "graphql" if url.split("?", 1)[0].rstrip("/").endswith("/graphql") else "core"
+
+    def _bucket(self, resource: str) -> _Bucket:
+        bucket = self._buckets.get(resource)
+        if bucket is None:
+            bucket = self._buckets[resource] = _Bucket(self.default_rate, self.burst, self.clock())
+        return bucket
+
+    def headroom(self, resource: str = "core") -> float:
+        """
+        Requests left for ``resource``, assuming a full quota until told otherwise.
+
+        Negative while paused (the sooner the pause ends, the higher).
+        """
+        with self._cond:
+            bucket = self._bucket(resource)
+            now = self.clock()
+            if now < bucket.paused_until:
+                return now - bucket.paused_until
+            if bucket.remaining is None or (bucket.reset_at is not None and now >= bucket.reset_at):
+                return float(self.requests_per_hour)
+            return float(bucket.remaining)
+
+    def acquire(self, resource: str = "core") -> None:
+        """
+        Block until a request against ``resource`` may be sent.
+
+        The request goes out with the session's own token (``TokenPool.acquire``
+        returns the token to use instead).
+        """
+        with self._cond:
+            while True:
+                bucket = self._bucket(resource)
+                now = self.clock()
+                if now < bucket.paused_until:
+                    # Woken early only if a response shows the quota is back
+                    self._cond.wait(bucket.paused_until - now)
+                    continue
+                bucket.refill(now, self.default_rate)
+                if not bucket.paced(now, self.reserve):
+                    if bucket.remaining is not None:
+                        bucket.remaining -= 1       # until its response reports the quota
+                    return
+                if bucket.tokens >= 1:
+                    bucket.tokens -= 1
+                    return
+                self._cond.wait((1 - bucket.tokens) / bucket.rate)
+
+    def observe(self, resource: str, status: int, headers, body: bytes = b"",
+                attempt: int = 0, token: str | None = None) -> bool:
+        """
+        Update the quota from a response (``token`` is only used by ``TokenPool``).
+
+        Returns True when the request was throttled and should be retried
+        (after the pause this sets for every caller).
+        """
+        with self._cond:
+            bucket = self._bucket(resource)
+            now = self.clock()
+
+            if status == 304:
+                # Conditional hits are free: give the token back
+                bucket.tokens = min(bucket.burst, bucket.tokens + 1)
+
+            remaining = headers.get("X-RateLimit-Remaining")
+            reset = headers.get("X-RateLimit-Reset")
+            if remaining is not None and reset is not None:
+                remaining, reset = int(remaining), float(reset)
+                window = max(reset - now, 1.0)
+                bucket.rate = max(remaining / window, self.default_rate / 10)
+                bucket.tokens = min(bucket.tokens, remaining)
+                if remaining == 0:
+                    bucket.paused_until = max(bucket.paused_until, reset)
+                elif bucket.remaining == 0:
+                    bucket.paused_until = 0.0
+                    self._cond.notify_all()
+                bucket.remaining = remaining
+                bucket.reset_at = reset
+
+            throttled = status == 429 or (status == 403 and (
+                "Retry-After" in headers
+                or headers.get("X-RateLimit-Remaining") == "0"
+                or b"rate limit" in body.lower()
+            ))
+            if not throttled:
+                return False
+
+            self.throttle_waits += 1
+            if "Retry-After" in headers:
+                delay = float(headers["Retry-After"]) + random.uniform(0, 1)
+            elif bucket.remaining == 0 and reset is not None:
+                delay = max(reset - now, 0) + random.uniform(0, 1)
+            else:
+                delay = random.uniform(0, min(self.max_backoff, self.base_backoff * 2 ** attempt))
+            bucket.paused_until = max(bucket.paused_until, now + delay)
+            # Resume gently: paced, without the accumulated burst
+            bucket.cautious_until = max(bucket.cautious_until, bucket.paused_until + self.cooldown)
+            bucket.tokens = min(bucket.tokens, 1.0)
+            logger.warning(f"GitHub {resource} rate limit hit, pausing requests for {delay:.1f}s")
+            return True
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                "throttle_waits": self.throttle_waits,
+                **{f"{name}_remaining": b.remaining for name, b in self._buckets.items()},
+            }
+
+
+class RateLimitAdapter(HTTPAdapter):
+    """
+    Transport adapter that sends every request through a ``RateLimitScheduler``
+    (or a ``TokenPool``, which also picks the token for each attempt).
+    """
+
+    def __init__(self, scheduler=None, **kwargs):
+        super().__init__(**kwargs)
+        self.scheduler = scheduler
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        if self.scheduler is None:
+            return super().send(request, **kwargs)
+
+        resource = self.scheduler.resource_for(request.url)
+        attempt = 0
+        while True:
+            token = self.scheduler.acquire(resource)
+            if token is not None:
+                request.headers["Authorization"] = f"Bearer {token}"
+            response = super().send(request, **kwargs)
+            body = response.content if response.status_code in (403, 429) else b""
+            throttled = self.scheduler.observe(resource, response.status_code,
+                                               response.headers, body, attempt, token)
+            if not throttled or attempt >= self.scheduler.max_retries:
+                return response
+            attempt += 1
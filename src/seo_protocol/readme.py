@@ -0,0 +1,139 @@
+# src/seo_protocol/readme.py
+"""
+README structure and keyword statistics.
+
+``MarkdownScanner`` reads a README line by line, once, keeping only
+counters: headings, fenced code blocks, badges, images, links, lists,
+tables, words and how often each word occurs in the prose (code blocks
+excluded), from which the keyword hits and the README's most frequent terms
+are reported. Nothing needs the whole document in memory, so lines can come
+straight from a download.
+"""
+import hashlib
+import logging
+import re
+from collections import Counter
+from collections.abc import Iterable
+from itertools import islice
+from .keywords import ENGLISH_STOPWORDS
+
+logger = logging.getLogger(__name__)
+
+# Bump when the statistics change so cached ones are recomputed
+STATS_VERSION = 2
+
+# Most frequent prose words reported as the README's terms
+TOP_TERMS = 40
+
+_FENCE_RE = re.compile(r"^ {0,3}(```+|~~~+)")
+_ATX_RE = re.compile(r"^ {0,3}(#{1,6})(?:\s|$)")
+_HTML_HEADING_RE = re.compile(r"<h([1-6])\b", re.IGNORECASE)
+_SETEXT_RE = re.compile(r"^ {0,3}(=+|-+)\s*$")
+_LIST_RE = re.compile(r"^\s*(?:[-*+]|\d+[.)])\s+\S")
+_TABLE_RULE_RE = re.compile(r"^\s*\|?\s*:?-{3,}:?\s*(?:\|\s*:?-{3,}:?\s*)+\|?\s*$")
+_IMAGE_RE = re.compile(r"!\[[^\]]*\]\(\s*<?([^)\s>]+)|<img\b[^>]*\bsrc=[\"']([^\"']+)", re.IGNORECASE)
+_LINK_RE = re.compile(r"(?<!!)\[[^\]]*\]\([^)]+\)|<https?://[^>]+>|<a\b[^>]*\bhref=|^ {0,3}\[[^\]]+\]:\s*\S",
+                      re.IGNORECASE)
+_BADGE_RE = re.compile(r"shields\.io|badgen\.net|badge|travis-ci|codecov|circleci|coveralls", re.IGNORECASE)
+# Link targets and inline code are not prose
+_NOT_PROSE_RE = re.compile(r"\]\([^)]*\)|`[^`]*`|<[^>]+>|https?://\S+")
+_WORD_RE = re.compile(r"[^\W_]+(?:[-'][^\W_]+)*")
+
+
+def keywords_key(keywords: Iterable[str]) -> str:
+    """Identifies the keyword set (and stats version) that statistics were computed for."""
+    encoded = "\n".join(sorted({k.lower() for k in keywords})).encode("utf-8")
+    return f"{STATS_VERSION}:{hashlib.sha1(encoded).hexdigest()}"
+
+
+class MarkdownScanner:
+    """Single-pass Markdown statistics; ``feed`` lines, then read ``result``."""
+
+    def __init__(self, keywords: Iterable[str] = ()):
+        self.keywords = {k.lower() for k in keywords}
+        self.word_counts = Counter()
+        self.headings = {"h1": 0, "h2": 0, "h3": 0}
+        self.counts = dict.fromkeys(("lines", "bytes", "words", "code_blocks", "badges", "images",
+                                     "links", "list_items", "tables"), 0)
+        self._fence = None                  # opening fence while inside a code block
+        self._paragraph = False             # previous line was paragraph text (setext headings)
+
+    def feed(self, line: str):
+        counts = self.counts
+        counts["lines"] += 1
+        counts["bytes"] += len(line.encode("utf-8")) + 1
+
+        fence = _FENCE_RE.match(line)
+        if self._fence is not None:
+            if fence and fence.group(1)[0] == self._fence[0] and len(fence.group(1)) >= len(self._fence):
+                self._fence = None
+            return
+        if fence:
+            self._fence = fence.group(1)
+            counts["code_blocks"] += 1
+            self._paragraph = False
+            return
+
+        if not line.strip():
+            self._paragraph = False
+            return
+
+        if self._paragraph and _SETEXT_RE.match(line):
+            self._heading(1 if line.strip()[0] == "=" else 2)
+            self._paragraph = False
+            return
+
+        # Most lines are plain prose: only run the patterns their characters allow
+        markup = "<" in line
+        atx = _ATX_RE.match(line) if "#" in line else None
+        if atx:
+            self._heading(len(atx.group(1)))
+        if markup:
+            for level in _HTML_HEADING_RE.findall(line):
+                self._heading(int(level))
+
+        if "-" in line and _TABLE_RULE_RE.match(line):
+            counts["tables"] += 1
+            self._paragraph = False
+            return
+        if _LIST_RE.match(line):
+            counts["list_items"] += 1
+
+        if markup or "[" in line:
+            for match in _IMAGE_RE.finditer(line):
+                url = match.group(1) or match.group(2)
+                counts["badges" if _BADGE_RE.search(url) else "images"] += 1
+            counts["links"] += len(_LINK_RE.findall(line))
+            line = _NOT_PROSE_RE.sub(" ", line)
+        elif "`" in line or "://" in line:
+            line = _NOT_PROSE_RE.sub(" ", line)
+
+        words = _WORD_RE.findall(line.lower())
+        counts["words"] += len(words)
+        self.word_counts.update(words)
+        self._paragraph = atx is None
+
+    def _heading(self, level: int):
+        self.headings[f"h{min(level, 3)}"] += 1
+
+    def result(self) -> dict:
+        counts = self.word_counts
+        keyword_hits = {k: counts[k] for k in sorted(self.keywords)}
+        words = self.counts["words"]
+        terms = (item for item in counts.most_common()
+                 if len(item[0]) > 2 and item[0] not in ENGLISH_STOPWORDS and not item[0].isdigit())
+        return {
+            **self.counts,
+            "headings": dict(self.headings),
+            "keyword_hits": keyword_hits,
+            "keyword_density": round(sum(keyword_hits.values()) / words, 4) if words else 0.0,
+            "terms": dict(islice(terms, TOP_TERMS)),
+        }
+
+
+def analyze_readme(lines: Iterable[str], keywords: Iterable[str] = ()) -> dict:
+    """Statistics of a README given as an iterable of lines (see ``MarkdownScanner``)."""
+    scanner = MarkdownScanner(keywords)
+    for line in lines:
+        scanner.feed(line.rstrip("\r\n"))
+    return scanner.result()
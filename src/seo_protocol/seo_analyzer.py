@@ -1,9 +1,51 @@
 # src/seo_protocol/seo_analyzer.py
+import hashlib
+import json
 import logging
-from .github_api import GitHubAPI
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+from .github_api import GitHubAPI, SharedGitHubClient
+from .github_graphql import GraphQLMetricsFetcher, graphql_url
+from .keywords import TrendIndex, load_trend_index
+from .monitor import Monitor
 
 logger = logging.getLogger(__name__)
 
+# Weight of each score component; override per call to re-score history.
+DEFAULT_WEIGHTS = {
+    'engagement': 0.30,
+    'activity': 0.25,
+    'contributors': 0.20,
+    'keywords': 0.20,
+    'structure': 0.05,
+}
+
+def input_fingerprint(metrics: dict,
+                      description: str | None,
+                      topics: list[str],
+                      tokenizer: str = "auto",
+                      trends_digest: str | None = None,
+                      readme_sha: str | None = None) -> str:
+    """
+    Hash of everything an analysis result depends on: the metrics, the
+    description and topics, the README blob and the keyword settings
+    (tokenizer, trend list, scoring weights). Equal fingerprints mean equal
+    results.
+    ``trends_digest`` identifies the trend vocabulary (default: the bundled one).
+    """
+    inputs = {
+        "metrics": metrics,
+        "description": description or "",
+        "topics": list(topics),
+        "tokenizer": tokenizer,
+        "trends": trends_digest or load_trend_index().digest,
+        "readme": readme_sha,
+        "weights": DEFAULT_WEIGHTS,
+    }
+    encoded = json.dumps(inputs, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
 class SEOAnalyzer:
     """
     Computes visibility score and performs the core analysis.
@@ -16,11 +58,21 @@ class SEOAnalyzer:
       •  5% — Structural bonuses (README + license)
     """
 
-    def __init__(self, token: str, repo_name: str):
-        self.api = GitHubAPI(token, repo_name)
+    def __init__(self,
+                 token: str | list[str],
+                 repo_name: str,
+                 client=None,
+                 lazy: bool = False,
+                 trends: TrendIndex | None = None):
+        self.repo_name = repo_name
+        self.api = GitHubAPI(token, repo_name, client=client, lazy=lazy, trends=trends)
 
-    def compute_visibility_score(self, metrics: dict, keywords: list[str]) -> float:
+    def compute_visibility_score(self,
+                                 metrics: dict,
+                                 keywords: list[str],
+                                 weights: dict | None = None) -> float:
         """Calculate the visibility score based on collected metrics."""
+        w = {**DEFAULT_WEIGHTS, **(weights or {})}
         try:
             engagement = (metrics.get('stars', 0) + metrics.get('forks', 0) + metrics.get('watchers', 0)) / 3.0
             activity = (metrics.get('commits', 0) + metrics.get('issues', 0) +
@@ -30,11 +82,11 @@ class SEOAnalyzer:
             bonus = (10 if metrics.get('has_readme', False) else 0) + \
                     (10 if metrics.get('has_license', False) else 0)
 
-            raw_score = (0.30 * engagement +
-                         0.25 * activity +
-                         0.20 * contrib +
-                         0.20 * keyword_score +
-                         0.05 * bonus)
+            raw_score = (w['engagement'] * engagement +
+                         w['activity'] * activity +
+                         w['contributors'] * contrib +
+                         w['keywords'] * keyword_score +
+                         w['structure'] * bonus)
 
             return round(min(100.0, raw_score / 10.0), 2)
 
@@ -42,15 +94,203 @@ class SEOAnalyzer:
             logger.warning(f"Score calculation issue: {e}")
             return 0.0
 
-    def analyze(self) -> dict:
-        """Perform complete analysis in one call."""
-        metrics = self.api.fetch_metrics()
-        keywords, suggested = self.api.extract_keywords()
+    @staticmethod
+    def compute_visibility_scores(table, weights: dict | None = None):
+        """
+        Score many repositories at once; returns a float64 NumPy array.
+
+        ``table`` is columnar: a dict of equal-length arrays or a NumPy
+        structured array, with the metric names used by ``fetch_metrics``
+        plus ``keyword_count`` (the ``len(keywords)`` of the scalar version).
+        Missing columns count as 0. Results match ``compute_visibility_score``
+        exactly, including its rounding.
+        """
+        import numpy as np
+
+        w = {**DEFAULT_WEIGHTS, **(weights or {})}
+        names = table.dtype.names if hasattr(table, 'dtype') else tuple(table)
+        size = len(table[names[0]]) if names else 0
+
+        def col(name):
+            if name not in names:
+                return np.zeros(size, dtype=np.int64)
+            values = np.asarray(table[name])
+            return values.astype(np.int64) if values.dtype == bool else values
+
+        def total(*columns):
+            # Counts are summed in float64, which is exact below 2**53 just
+            # like the scalar version's int sums
+            values = np.array(col(columns[0]), dtype=np.float64)
+            for name in columns[1:]:
+                values += col(name)
+            return values
+
+        def flag(name):
+            return np.asarray(table[name]) != 0 if name in names else np.zeros(size, dtype=bool)
+
+        # Same operations in the same order as the scalar version, so every
+        # intermediate float64 is bit-identical. Temporaries are updated in
+        # place: at a million rows, allocating a fresh array per operation
+        # costs as much as the arithmetic.
+        engagement = total('stars', 'forks', 'watchers')
+        engagement /= 3.0
+        activity = total('commits', 'issues', 'views_last_14d', 'clones_last_14d')
+        activity /= 4.0
+        keyword_score = col('keyword_count') * 5.0
+        # The structure bonus is 0, 10 or 20: look its weighted value up
+        structure = np.array([0, 10, 20]) * w['structure']
+        bonus = np.add(flag('has_readme'), flag('has_license'), dtype=np.uint8)
+
+        raw_score = engagement
+        raw_score *= w['engagement']
+        activity *= w['activity']
+        raw_score += activity
+        raw_score += w['contributors'] * col('contributors')
+        keyword_score *= w['keywords']
+        raw_score += keyword_score
+        raw_score += structure[bonus]
+        raw_score /= 10.0
+        capped = np.minimum(100.0, raw_score, out=raw_score)
+
+        # round(x, 2) rounds the exact value of x * 100, np.round the float
+        # product, which can land on a .5 the exact value is not. For the
+        # products that do, recover the rounding error (Dekker's split, exact
+        # for |x| < 2**969) and move the ones it decides away from .5.
+        half = capped * 100.0
+        cents = np.rint(half)
+        half -= cents
+        ties = np.flatnonzero((half == 0.5) | (half == -0.5))
+        if ties.size:
+            x, half = capped[ties], half[ties]
+            product = cents[ties] + half
+            split = x * 134217729.0
+            hi = split - (split - x)
+            error = (hi * 100.0 - product) + (x - hi) * 100.0
+            cents[ties] += np.where(half * error > 0, half + half, 0.0)
+        cents /= 100.0
+        return cents
+
+    def analyze(self,
+                prefetched: dict | None = None,
+                monitor: Monitor | None = None,
+                readme_cache: Monitor | None = None) -> dict:
+        """
+        Perform complete analysis in one call.
+
+        ``prefetched`` is a GraphQL record ({"metrics", "description", "topics"});
+        only what it does not cover is requested over REST.
+
+        With a ``monitor`` the analysis is incremental: when the fingerprint of
+        the inputs matches the one stored for the last run, keyword extraction
+        and scoring are skipped and the stored result is returned.
+
+        README statistics are cached by blob SHA in ``readme_cache``, so an
+        unchanged README is not downloaded or parsed again.
+        """
+        if prefetched:
+            metrics = self.api.fetch_metrics(known=prefetched['metrics'],
+                                             pushed_at=prefetched.get('pushed_at'))
+            description, topics = prefetched['description'], prefetched['topics']
+            readme_sha = prefetched.get('readme_sha')
+        else:
+            metrics = self.api.fetch_metrics()
+            description = topics = readme_sha = None
+            if monitor is not None:
+                description, topics = self.api.repo.description, self.api.repo.get_topics()
+
+        # Empty metrics mean the fetch failed; never cache that
+        fingerprint = None
+        has_readme = bool(metrics.get('has_readme'))
+        if monitor is not None and metrics:
+            if readme_sha is None and has_readme:
+                readme = self.api.readme()   # already read by fetch_metrics
+                readme_sha = readme.sha if readme is not None else None
+            fingerprint = input_fingerprint(metrics, description, topics, self.api.tokenizer,
+                                            self.api.trends.digest, readme_sha)
+            cached = monitor.get_cached_analysis(self.repo_name, fingerprint)
+            if cached is not None:
+                logger.debug(f"Inputs of {self.repo_name} unchanged, reusing last analysis")
+                return cached
+
+        keywords, suggested = self.api.extract_keywords(description, topics)
         score = self.compute_visibility_score(metrics, keywords)
+        readme = self.api.readme_stats(keywords, readme_sha, readme_cache) if has_readme else None
 
-        return {
+        result = {
             "metrics": metrics,
             "score": score,
             "keywords": keywords,
-            "suggested_keywords": list(suggested)
+            "suggested_keywords": list(suggested),
+            "readme": readme,
         }
+        if fingerprint is not None:
+            monitor.save_analysis(self.repo_name, fingerprint, result)
+        return result
+
+    @classmethod
+    def analyze_many(cls,
+                     token: str | list[str],
+                     repo_names: Iterable[str],
+                     max_workers: int = 8,
+                     use_graphql: bool = True,
+                     graphql_endpoint: str | None = None,
+                     client: SharedGitHubClient | None = None,
+                     monitor: Monitor | None = None,
+                     trends: TrendIndex | None = None,
+                     readme_cache: Monitor | None = None) -> Iterator[tuple[str, dict]]:
+        """
+        Analyze many repositories concurrently on a bounded thread pool.
+
+        All workers share one authenticated client (``client``, or a new
+        ``SharedGitHubClient`` for ``token``). Results are yielded as
+        ``(repo_name, result)`` in completion order, as soon as each repository
+        finishes. A repository that cannot be analyzed yields
+        ``{"error": "..."}`` instead of stopping the batch.
+
+        ``repo_names`` is consumed lazily, so at most ``2 * max_workers``
+        repositories are in flight at any time.
+
+        With ``use_graphql`` the GraphQL-answerable metrics of each chunk of
+        repos are fetched in one request; repos GraphQL cannot resolve, or all
+        of them if the endpoint fails, go through the plain REST path. The
+        endpoint defaults to the GraphQL API of the client's ``base_url``.
+
+        Pass a ``monitor`` to only re-score repos whose inputs changed
+        (see ``analyze``), ``readme_cache`` to reuse README statistics and
+        ``trends`` to use another trend vocabulary.
+        """
+        shared = client or SharedGitHubClient(token, pool_size=max_workers)
+
+        def run(repo_name: str, prefetched: dict | None) -> dict:
+            analyzer = cls(token, repo_name, client=shared.get(), lazy=prefetched is not None, trends=trends)
+            return analyzer.analyze(prefetched, monitor, readme_cache)
+
+        def with_prefetch(names: Iterator[str]) -> Iterator[tuple[str, dict | None]]:
+            if not use_graphql:
+                for repo_name in names:
+                    yield repo_name, None
+                return
+            endpoint = graphql_endpoint or graphql_url(shared.base_url)
+            fetcher = GraphQLMetricsFetcher(shared.token, endpoint, session=shared.session)
+            while chunk := list(islice(names, fetcher.batch_size)):
+                yield from fetcher.fetch(chunk).items()
+
+        work = with_prefetch(iter(repo_names))
+        pending = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            while True:
+                for repo_name, prefetched in work:
+                    pending[pool.submit(run, repo_name, prefetched)] = repo_name
+                    if len(pending) >= 2 * max_workers:
+                        break
+                if not pending:
+                    return
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    repo_name = pending.pop(future)
+                    try:
+                        yield repo_name, future.result()
+                    except Exception as e:
+                        logger.error(f"Analysis failed for {repo_name}: {e}")
+                        yield repo_name, {"error": str(e)}
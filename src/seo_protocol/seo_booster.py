@@ -1,8 +1,5 @@
 # src/seo_protocol/seo_booster.py
 import logging
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
-from oauth2client.service_account import ServiceAccountCredentials
 
 logger = logging.getLogger(__name__)
 
@@ -17,10 +14,21 @@ class SEOBooster:
                                     keywords: list[str],
                                     suggested: list[str],
                                     score: float,
-                                    alert_threshold: float = 50.0) -> list[str]:
+                                    alert_threshold: float = 50.0,
+                                    trends: dict | None = None,
+                                    readme: dict | None = None,
+                                    cohort: dict | None = None) -> list[str]:
         """
         Generate actionable improvement suggestions.
         Returns list of strings (each is one suggestion/recommendation).
+
+        With ``trends`` (see ``analytics.repo_trends``) alerts follow the
+        history: a score forecast to drop below ``alert_threshold``, stalled
+        star growth and unusual spikes or drops are reported as well.
+        With ``readme`` statistics (see ``readme.analyze_readme``) README
+        advice names what is actually missing instead of a generic checklist.
+        With a ``cohort`` (see ``KeywordCorpus.cohort``) a score in the bottom
+        quarter of similar repositories points at the peers to learn from.
         """
         suggestions = []
 
@@ -31,20 +39,102 @@ class SEOBooster:
             suggestions.append(f"Blog/article idea: 'Deep dive into {keywords[0]} – my open-source approach'")
 
         # Suggestions for improving README and project visibility
+        if readme:
+            suggestions.extend(self._readme_suggestions(readme, keywords))
+        else:
+            suggestions.append("Make README more discoverable: clear H1/H2 headers + code examples + badges")
         suggestions.extend([
-            "Make README more discoverable: clear H1/H2 headers + code examples + badges",
             "Consider structured data hints in README for better AI/LLM crawling",
             "Build backlinks: contribute to related projects and mention your repo in PRs"
         ])
 
-        # If the score is low, add alerts and suggestions
+        forecast = [v for v in ((trends or {}).get('score', {}).get('forecast') or []) if v is not None]
+
+        # If the score is (or is heading) low, add alerts and suggestions
+        heading_low = bool(forecast) and forecast[-1] < alert_threshold
         if score < alert_threshold:
             suggestions.append(f"**ALERT** Visibility score {score:.1f} < {alert_threshold}")
-            if suggested:
-                suggestions.append(f"→ Consider adding trending keywords: {', '.join(suggested[:4])}")
+        elif heading_low:
+            suggestions.append(f"**ALERT** Visibility score {score:.1f} is forecast to fall to "
+                               f"{forecast[-1]:.1f} (< {alert_threshold}) within {len(forecast)} days")
+        if (score < alert_threshold or heading_low) and suggested:
+            suggestions.append(f"→ Consider adding trending keywords: {', '.join(suggested[:4])}")
+
+        if trends:
+            suggestions.extend(self._trend_alerts(trends))
+
+        # A handful of neighbours says little about where the repo stands
+        if cohort and cohort['size'] >= 5 and cohort['percentile'] < 25:
+            leaders = sorted(cohort['peers'], key=lambda p: p['score'], reverse=True)[:3]
+            suggestions.append(
+                f"Score is below most similar repositories ({cohort['percentile']:.0f}th percentile of "
+                f"{cohort['size']}, median {cohort['median']:.1f}) → compare with "
+                + ", ".join(f"{p['repo']} ({p['score']:.1f})" for p in leaders)
+            )
 
         return suggestions
 
+    @staticmethod
+    def _readme_suggestions(readme: dict, keywords: list[str]) -> list[str]:
+        """README advice from its measured structure and keyword usage."""
+        tips = []
+        headings = readme.get('headings', {})
+        if readme.get('words', 0) < 150:
+            tips.append(f"README is short ({readme.get('words', 0)} words) → explain what the project does, "
+                        "why it exists and how to get started")
+        if not headings.get('h1'):
+            tips.append("Add an H1 title to the README: project name plus a one-line pitch")
+        if headings.get('h2', 0) < 2:
+            tips.append(f"Split the README into H2 sections (Installation, Usage, Contributing); "
+                        f"it has {headings.get('h2', 0)}")
+        if not readme.get('code_blocks'):
+            tips.append("Add a fenced code example (install command, minimal usage) to the README")
+        if not readme.get('badges'):
+            tips.append("Add badges (build status, license, latest release) at the top of the README")
+        if readme.get('links', 0) < 3:
+            tips.append(f"Link docs, demos and related projects from the README "
+                        f"(only {readme.get('links', 0)} links)")
+
+        density = readme.get('keyword_density', 0.0)
+        hits = readme.get('keyword_hits', {})
+        missing = [k for k in dict.fromkeys(keywords) if hits.get(k.lower()) == 0]
+        if keywords and density < 0.01:
+            absent = f" ({', '.join(missing[:3])} never appear)" if missing else ""
+            tips.append(f"Mention your keywords in the README prose: {density:.1%} of words{absent}")
+        elif density > 0.08:
+            tips.append(f"Keyword density in the README is {density:.1%} → write for readers, "
+                        "search engines penalise keyword stuffing")
+
+        if not tips:
+            tips.append(f"README structure looks complete ({sum(headings.values())} headings, "
+                        f"{readme.get('code_blocks', 0)} code blocks, {readme.get('badges', 0)} badges)")
+        return tips
+
+    @staticmethod
+    def _trend_alerts(trends: dict) -> list[str]:
+        """Alerts and hints derived from velocity and anomalies in the history."""
+        alerts = []
+        stars = trends.get('stars', {})
+        velocity = stars.get('velocity_per_day')
+        # Most repositories gain no stars in a given week: only a loss is an alert
+        if velocity is not None and velocity < 0:
+            alerts.append(f"**ALERT** Stars are declining ({velocity:+.2f}/day over the last week) "
+                          "→ check recent issues and releases for what drives users away")
+        elif velocity == 0:
+            alerts.append("Star growth has stalled (no new stars over the last week) "
+                          "→ share a release note or demo to restart discovery")
+
+        for metric, stats in trends.items():
+            name = metric.replace('_', ' ')
+            for anomaly in stats.get('anomalies', []):
+                if anomaly['zscore'] > 0:
+                    alerts.append(f"Unusual jump in {name} on {anomaly['date']} "
+                                  f"(z={anomaly['zscore']:.1f}) → find the referrer and engage with it")
+                else:
+                    alerts.append(f"**ALERT** Unusual drop in {name} on {anomaly['date']} "
+                                  f"(z={anomaly['zscore']:.1f})")
+        return alerts
+
     def try_submit_urls_to_google(self, urls: list[str] | None = None) -> None:
         """Try to notify Google about updated/important URLs (optional feature)."""
         if not self.google_service_json:
@@ -53,6 +143,15 @@ class SEOBooster:
 
         urls = urls or [self.repo_url, f"{self.repo_url}/blob/main/README.md"]
 
+        # Heavy optional dependencies, only needed when actually submitting
+        try:
+            from googleapiclient.discovery import build
+            from googleapiclient.errors import HttpError
+            from oauth2client.service_account import ServiceAccountCredentials
+        except ImportError as e:
+            logger.warning(f"Google API client not installed ({e}) → skipping Indexing API submission")
+            return
+
         try:
             credentials = ServiceAccountCredentials.from_json_keyfile_name(
                 self.google_service_json,
@@ -1,108 +1,492 @@
 # src/seo_protocol/seo_report.py
+import functools
 import logging
-import jinja2
-import json
+import os
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from . import serializers
+from .charter import sparkline_svg, sparkline_text
 
 logger = logging.getLogger(__name__)
 
+HTML_TEMPLATE = """\
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>SEO Report - {{ repo }}</title>
+    <style>
+        body { font-family: system-ui, sans-serif; max-width: 900px; margin: 2rem auto; line-height: 1.6; }
+        h1, h2 { color: #2c3e50; }
+        .score { font-size: 2.5rem; font-weight: bold; color: #27ae60; }
+        .alert { color: #c0392b; font-weight: bold; }
+        ul { padding-left: 1.5rem; }
+        img { max-width: 100%; margin: 1.5rem 0; border-radius: 8px; }
+    </style>
+</head>
+<body>
+    <h1>SEO Report — {{ repo }}</h1>
+    <p class="score">{{ "%.1f"|format(score) }}/100</p>
+
+    <h2>Metrics</h2>
+    <ul>
+    {% for key, value in metrics.items() %}
+        <li><strong>{{ key|replace("_", " ")|title }}:</strong> {{ value }}</li>
+    {% endfor %}
+    </ul>
+
+    <h2>Improvement Suggestions</h2>
+    <ul>
+    {% for s in suggestions %}
+        <li {% if 'ALERT' in s %}class="alert"{% endif %}>{{ s }}</li>
+    {% endfor %}
+    </ul>
+
+    {% if cohort %}
+    <h2>Peer Comparison</h2>
+    <ul>
+    {% for line in cohort %}
+        <li>{{ line }}</li>
+    {% endfor %}
+    </ul>
+    {% endif %}
+
+    {% if trends %}
+    <h2>Trends</h2>
+    <ul>
+    {% for line in trends %}
+        <li>{{ line }}</li>
+    {% endfor %}
+    </ul>
+    {% endif %}
+
+    {% if chart %}
+    <h2>Stars Growth Trend</h2>
+    <img src="data:{{ chart_mime }};base64,{{ chart }}" alt="Stars growth chart">
+    {% endif %}
+
+    {% if metadata %}
+    <h2>Run Metadata</h2>
+    <ul>
+    {% for line in metadata %}
+        <li>{{ line }}</li>
+    {% endfor %}
+    </ul>
+    {% endif %}
+</body>
+</html>
+"""
+
+# One page of the fleet dashboard; columns sort client-side within the page
+FLEET_TEMPLATE = """\
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>SEO Fleet Report - page {{ page }}</title>
+    <style>
+        body { font-family: system-ui, sans-serif; max-width: 1200px; margin: 2rem auto; line-height: 1.4; }
+        h1, h2 { color: #2c3e50; }
+        table { border-collapse: collapse; width: 100%; }
+        th, td { padding: 0.35rem 0.6rem; border-bottom: 1px solid #ddd; text-align: left; vertical-align: top; }
+        th { cursor: pointer; background: #f5f7f9; }
+        td.num { text-align: right; font-variant-numeric: tabular-nums; }
+        .up { color: #27ae60; } .down { color: #c0392b; }
+        .alert { color: #c0392b; font-weight: bold; }
+        nav { margin: 1rem 0; display: flex; gap: 1rem; }
+    </style>
+</head>
+<body>
+    <h1>SEO Fleet Report</h1>
+    {% if rows %}
+    <p>Repositories {{ first }}–{{ first + rows|length - 1 }}{% if summary %} of {{ summary.repos }}{% endif %}</p>
+    {% else %}
+    <p>No repositories.</p>
+    {% endif %}
+    <nav>
+        {% if prev_href %}<a href="{{ prev_href }}">← Previous</a>{% endif %}
+        {% if next_href %}<a href="{{ next_href }}">Next →</a>{% endif %}
+    </nav>
+    <table id="fleet">
+        <thead><tr>
+            <th data-type="text">Repository</th><th data-type="num">Score</th><th data-type="num">Δ Score</th>
+            <th data-type="num">Peer Percentile</th>
+            <th data-type="num">Stars</th><th data-type="num">Δ Stars</th><th>Trend</th><th data-type="text">Top Suggestions</th>
+        </tr></thead>
+        <tbody>
+        {% for row in rows %}
+            <tr>
+                <td data-sort="{{ row.repo|e }}"><a href="https://github.com/{{ row.repo|e }}">{{ row.repo|e }}</a></td>
+                <td class="num" data-sort="{{ row.score }}">{{ "%.1f"|format(row.score) }}</td>
+                <td class="num {{ 'up' if row.score_delta > 0 else 'down' if row.score_delta < 0 }}" data-sort="{{ row.score_delta }}">{{ "%+.1f"|format(row.score_delta) }}</td>
+                <td class="num" data-sort="{{ row.percentile if row.percentile is not none else -1 }}">{{ "%.0f"|format(row.percentile) if row.percentile is not none else "–" }}</td>
+                <td class="num" data-sort="{{ row.stars }}">{{ row.stars }}</td>
+                <td class="num {{ 'up' if row.stars_delta > 0 else 'down' if row.stars_delta < 0 }}" data-sort="{{ row.stars_delta }}">{{ "%+d"|format(row.stars_delta) }}</td>
+                <td>{{ row.sparkline }}</td>
+                <td data-sort="{{ row.suggestions|join(' ')|e }}">{% for s in row.suggestions %}<div {% if 'ALERT' in s %}class="alert"{% endif %}>{{ s|e }}</div>{% endfor %}</td>
+            </tr>
+        {% endfor %}
+        </tbody>
+    </table>
+    <nav>
+        {% if prev_href %}<a href="{{ prev_href }}">← Previous</a>{% endif %}
+        {% if next_href %}<a href="{{ next_href }}">Next →</a>{% endif %}
+    </nav>
+    {% if summary and summary.repos %}
+    <h2>Fleet Summary</h2>
+    <ul>
+        <li>Repositories: {{ summary.repos }}</li>
+        <li>Average score: {{ "%.1f"|format(summary.mean_score) }}</li>
+        <li>Lowest score: {{ "%.1f"|format(summary.min_score) }}, highest: {{ "%.1f"|format(summary.max_score) }}</li>
+        <li>Repositories with alerts: {{ summary.alerts }}</li>
+        <li>Stars gained: {{ "%+d"|format(summary.stars_delta) }}</li>
+    </ul>
+    {% endif %}
+    <script>
+    document.querySelectorAll("#fleet th[data-type]").forEach((th, column) => {
+        th.addEventListener("click", () => {
+            const body = th.closest("table").tBodies[0];
+            const descending = th.dataset.order !== "desc";
+            th.dataset.order = descending ? "desc" : "asc";
+            const key = tr => tr.cells[column].dataset.sort;
+            const numeric = th.dataset.type === "num";
+            [...body.rows]
+                .sort((a, b) => (numeric ? key(a) - key(b) : key(a).localeCompare(key(b))) * (descending ? -1 : 1))
+                .forEach(tr => body.appendChild(tr));
+        });
+    });
+    </script>
+</body>
+</html>
+"""
+
+TEMPLATES = {"report.html": HTML_TEMPLATE, "fleet.html": FLEET_TEMPLATE}
+
+FLEET_FORMATS = ("html", "md", "jsonl")
+FLEET_PAGE_SIZE = 250
+
+
+@functools.lru_cache(maxsize=None)
+def template_environment(bytecode_cache_dir: str | None = None):
+    """
+    The Jinja environment shared by every report (one per bytecode cache).
+
+    Templates are compiled once per process and kept by the environment;
+    with ``bytecode_cache_dir`` the compiled code is also stored on disk so
+    new processes skip compilation too.
+    """
+    import jinja2  # only HTML reports need it
+
+    bytecode_cache = None
+    if bytecode_cache_dir:
+        os.makedirs(bytecode_cache_dir, exist_ok=True)
+        bytecode_cache = jinja2.FileSystemBytecodeCache(bytecode_cache_dir)
+    # The templates are constants: never check them for changes
+    return jinja2.Environment(loader=jinja2.DictLoader(TEMPLATES),
+                              bytecode_cache=bytecode_cache,
+                              auto_reload=False)
+
+
+def fleet_row(data: dict, history: list[dict], top: int = 3) -> dict:
+    """
+    Compact dashboard entry of one repository: score and stars with their
+    change over ``history``, its score percentile among similar repositories,
+    its first ``top`` suggestions and stars series.
+    """
+    first = history[0] if history else {}
+    stars = data['metrics'].get('stars', 0)
+    return {
+        "repo": data['repo'],
+        "score": data['score'],
+        "score_delta": round(data['score'] - first.get('score', data['score']), 2),
+        "stars": stars,
+        "stars_delta": stars - first.get('stars', stars),
+        "percentile": (data.get('cohort') or {}).get('percentile'),
+        "suggestions": list(data.get('suggestions', []))[:top],
+        "stars_series": [row['stars'] for row in history],
+    }
+
+
+def _page_path(path: str, page: int) -> str:
+    """``report.html`` for page 1, then ``report_2.html``, ``report_3.html``…"""
+    if page == 1:
+        return path
+    stem, ext = os.path.splitext(path)
+    return f"{stem}_{page}{ext}"
+
+
 class SEOReport:
-    """Handles different report formats."""
+    """
+    Handles different report formats.
+
+    ``generate`` returns the whole report; ``generate_stream`` yields it in
+    chunks and ``write`` streams it to a file, so large reports (and their
+    embedded charts) are never assembled into one string.
+
+    'json' and the binary 'msgpack' format go through ``serializers``.
+    """
+
+    ERROR_REPORT = "# Error\nReport generation failed."
+
+    def __init__(self, bytecode_cache_dir: str | None = None):
+        self.bytecode_cache_dir = bytecode_cache_dir
 
     def generate(self,
                  data: dict,
                  format_type: str = "md",
-                 chart_base64: str | None = None) -> str:
+                 chart_base64: str | None = None,
+                 chart_mime: str = "image/png") -> str | bytes:
         """
         Generate report in requested format.
-        Supported formats: 'md', 'html', 'json'
+        Supported formats: 'md', 'html', 'json', 'msgpack' (returned as bytes)
+        ``chart_mime`` is the type of the encoded chart (PNG or SVG).
         """
+        binary = self._is_binary(format_type)
         try:
-            if format_type == "json":
-                return json.dumps(data, indent=2)
-
-            elif format_type == "html":
-                return self._render_html(data, chart_base64)
+            chunks = self.generate_stream(data, format_type, chart_base64, chart_mime)
+            return b"".join(chunks) if binary else "".join(chunks)
+        except Exception as e:
+            logger.error(f"Report generation failed: {e}")
+            return self.ERROR_REPORT.encode("utf-8") if binary else self.ERROR_REPORT
 
-            else:  # default → markdown
-                return self._render_markdown(data, chart_base64)
+    def generate_stream(self,
+                        data: dict,
+                        format_type: str = "md",
+                        chart_base64: str | None = None,
+                        chart_mime: str = "image/png") -> Iterator[str] | Iterator[bytes]:
+        """Yield the report in chunks (see ``generate``); errors are raised."""
+        if format_type in serializers.formats():
+            payload = serializers.dumps(data, format_type, pretty=True)
+            return iter([payload if self._is_binary(format_type) else payload.decode("utf-8")])
+        elif format_type == "html":
+            return self._template("report.html").generate(**self._html_context(data, chart_base64, chart_mime))
+        else:  # default → markdown
+            return self._markdown_chunks(data, chart_base64, chart_mime)
 
+    def write(self,
+              path: str,
+              data: dict,
+              format_type: str = "md",
+              chart_base64: str | None = None,
+              chart_mime: str = "image/png"):
+        """
+        Stream the report to ``path``. It is written to a temporary file and
+        moved into place, so a failure leaves the error report instead of a
+        truncated one.
+        """
+        tmp = f"{path}.tmp"
+        binary = self._is_binary(format_type)
+        try:
+            with open(tmp, "wb" if binary else "w", encoding=None if binary else "utf-8") as f:
+                for chunk in self.generate_stream(data, format_type, chart_base64, chart_mime):
+                    f.write(chunk)
         except Exception as e:
             logger.error(f"Report generation failed: {e}")
-            return "# Error\nReport generation failed."
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(self.ERROR_REPORT)
+        os.replace(tmp, path)
+
+    def write_fleet(self,
+                    rows: Iterable[dict],
+                    path: str,
+                    format_type: str = "html",
+                    page_size: int = FLEET_PAGE_SIZE) -> list[str]:
+        """
+        Write one dashboard of many repositories from ``fleet_row`` entries.
+
+        ``rows`` is consumed as a stream and only one page of it is held at a
+        time, so the fleet can be any size. HTML is split into pages of
+        ``page_size`` repositories linked to each other (``path``,
+        ``path_2``…, the summary on the last one); Markdown is one table and
+        ``jsonl`` one JSON object per line. Returns the written paths.
+        """
+        if format_type not in FLEET_FORMATS:
+            raise ValueError(f"Unknown fleet report format: {format_type}")
+        summary = {"repos": 0, "score_total": 0.0, "min_score": None, "max_score": None,
+                   "alerts": 0, "stars_delta": 0}
+
+        def counted(rows):
+            for row in rows:
+                summary["repos"] += 1
+                summary["score_total"] += row["score"]
+                if summary["min_score"] is None or row["score"] < summary["min_score"]:
+                    summary["min_score"] = row["score"]
+                if summary["max_score"] is None or row["score"] > summary["max_score"]:
+                    summary["max_score"] = row["score"]
+                summary["alerts"] += any("ALERT" in s for s in row["suggestions"])
+                summary["stars_delta"] += row["stars_delta"]
+                yield row
+
+        rows = counted(rows)
+        if format_type == "jsonl":
+            with open(path, "wb") as f:
+                for row in rows:
+                    f.write(serializers.dumps(row))
+                    f.write(b"\n")
+            paths = [path]
+        elif format_type == "md":
+            with open(path, "w", encoding="utf-8") as f:
+                for chunk in self._fleet_markdown_chunks(rows, summary):
+                    f.write(chunk)
+            paths = [path]
+        else:
+            paths = self._write_fleet_pages(rows, path, page_size, summary)
+        logger.info(f"Fleet report of {summary['repos']} repositories written to {paths[0]}"
+                    f" ({len(paths)} file(s))")
+        return paths
+
+    def _write_fleet_pages(self, rows: Iterator[dict], path: str, page_size: int, summary: dict) -> list[str]:
+        template = self._template("fleet.html")
+        paths = []
+        page = list(islice(rows, page_size))
+        number, first = 1, 1
+        while True:
+            # Read one page ahead to know whether a "next" link is needed
+            following = list(islice(rows, page_size))
+            last = not following
+            for row in page:
+                row["sparkline"] = sparkline_svg(row["stars_series"], 120, 24)
+            context = dict(
+                page=number, first=first, rows=page,
+                prev_href=os.path.basename(_page_path(path, number - 1)) if number > 1 else None,
+                next_href=None if last else os.path.basename(_page_path(path, number + 1)),
+                summary=self._fleet_summary(summary) if last else None,
+            )
+            paths.append(_page_path(path, number))
+            with open(paths[-1], "w", encoding="utf-8") as f:
+                for chunk in template.generate(**context):
+                    f.write(chunk)
+            if last:
+                return paths
+            first += len(page)
+            page, number = following, number + 1
 
-    def _render_markdown(self, data: dict, chart_base64: str | None) -> str:
-        lines = [
-            f"# SEO Report — {data['repo']}",
-            "",
-            f"## Visibility Score: **{data['score']:.1f}/100**",
-            "",
-            "## Collected Metrics",
-        ]
+    def _fleet_markdown_chunks(self, rows: Iterator[dict], summary: dict) -> Iterator[str]:
+        yield "# SEO Fleet Report\n\n"
+        yield "| Repository | Score | Δ Score | Peer Percentile | Stars | Δ Stars | Trend | Top Suggestions |\n"
+        yield "|---|---:|---:|---:|---:|---:|---|---|\n"
+        for row in rows:
+            suggestions = "<br>".join(s.replace("|", "\\|") for s in row["suggestions"])
+            percentile = "–" if row.get("percentile") is None else f"{row['percentile']:.0f}"
+            yield (f"| {row['repo']} | {row['score']:.1f} | {row['score_delta']:+.1f} | {percentile} | {row['stars']} "
+                   f"| {row['stars_delta']:+d} | {sparkline_text(row['stars_series'])} | {suggestions} |\n")
+        totals = self._fleet_summary(summary)
+        if totals["repos"]:
+            yield "\n## Fleet Summary\n"
+            yield f"- Repositories: {totals['repos']}\n"
+            yield f"- Average score: {totals['mean_score']:.1f}\n"
+            yield f"- Lowest score: {totals['min_score']:.1f}, highest: {totals['max_score']:.1f}\n"
+            yield f"- Repositories with alerts: {totals['alerts']}\n"
+            yield f"- Stars gained: {totals['stars_delta']:+d}\n"
+
+    @staticmethod
+    def _fleet_summary(summary: dict) -> dict:
+        repos = summary["repos"]
+        return {**summary, "mean_score": summary["score_total"] / repos if repos else 0.0}
+
+    @staticmethod
+    def _is_binary(format_type: str) -> bool:
+        return format_type in serializers.formats() and serializers.get(format_type).binary
+
+    def _template(self, name: str):
+        return template_environment(self.bytecode_cache_dir).get_template(name)
+
+    def _markdown_chunks(self, data: dict, chart_base64: str | None, chart_mime: str) -> Iterator[str]:
+        yield f"# SEO Report — {data['repo']}\n"
+        yield "\n"
+        yield f"## Visibility Score: **{data['score']:.1f}/100**\n"
+        yield "\n"
+        yield "## Collected Metrics"
 
         for k, v in data['metrics'].items():
-            lines.append(f"- **{k.replace('_', ' ').title()}**: {v}")
+            yield f"\n- **{k.replace('_', ' ').title()}**: {v}"
 
-        lines.extend(["", "## Improvement Suggestions"])
+        yield "\n\n## Improvement Suggestions"
         for suggestion in data['suggestions']:
-            lines.append(f"- {suggestion}")
+            yield f"\n- {suggestion}"
+
+        cohort = self._cohort_lines(data.get('cohort'))
+        if cohort:
+            yield "\n\n## Peer Comparison"
+            for line in cohort:
+                yield f"\n- {line}"
+
+        trends = self._trend_lines(data.get('trends'))
+        if trends:
+            yield "\n\n## Trends"
+            for line in trends:
+                yield f"\n- {line}"
 
         if chart_base64:
-            lines.append("")
-            lines.append("## Stars Growth Trend")
-            lines.append(f"![Stars Trend](data:image/png;base64,{chart_base64})")
-
-        return "\n".join(lines)
-
-    def _render_html(self, data: dict, chart_base64: str | None) -> str:
-        """Render the HTML content with the necessary structure."""
-        html_template = """
-        <!DOCTYPE html>
-        <html lang="en">
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>SEO Report - {{ repo }}</title>
-            <style>
-                body { font-family: system-ui, sans-serif; max-width: 900px; margin: 2rem auto; line-height: 1.6; }
-                h1, h2 { color: #2c3e50; }
-                .score { font-size: 2.5rem; font-weight: bold; color: #27ae60; }
-                .alert { color: #c0392b; font-weight: bold; }
-                ul { padding-left: 1.5rem; }
-                img { max-width: 100%; margin: 1.5rem 0; border-radius: 8px; }
-            </style>
-        </head>
-        <body>
-            <h1>SEO Report — {{ repo }}</h1>
-            <p class="score">{{ "%.1f"|format(score) }}/100</p>
-
-            <h2>Metrics</h2>
-            <ul>
-            {% for key, value in metrics.items() %}
-                <li><strong>{{ key|replace("_", " ")|title }}:</strong> {{ value }}</li>
-            {% endfor %}
-            </ul>
-
-            <h2>Improvement Suggestions</h2>
-            <ul>
-            {% for s in suggestions %}
-                <li {% if 'ALERT' in s %}class="alert"{% endif %}>{{ s }}</li>
-            {% endfor %}
-            </ul>
-
-            {% if chart %}
-            <h2>Stars Growth Trend</h2>
-            <img src="data:image/png;base64,{{ chart }}" alt="Stars growth chart">
-            {% endif %}
-        </body>
-        </html>
-        """
+            yield "\n\n## Stars Growth Trend"
+            yield f"\n![Stars Trend](data:{chart_mime};base64,"
+            yield chart_base64
+            yield ")"
+
+        metadata = self._metadata_lines(data.get('metadata'))
+        if metadata:
+            yield "\n\n## Run Metadata"
+            for line in metadata:
+                yield f"\n- {line}"
+
+    @staticmethod
+    def _trend_lines(trends: dict | None) -> list[str]:
+        """One line per metric: velocity, rolling average, forecast and anomalies."""
+        lines = []
+        for metric, t in (trends or {}).items():
+            parts = []
+            if t.get('velocity_per_day') is not None:
+                parts.append(f"{t['velocity_per_day']:+.2f}/day")
+            if t.get('rolling_mean') is not None:
+                parts.append(f"rolling average {t['rolling_mean']:.1f}")
+            forecast = [v for v in t.get('forecast') or [] if v is not None]
+            if forecast:
+                parts.append(f"forecast {forecast[-1]:.1f} in {len(forecast)} days")
+            if t.get('anomalies'):
+                parts.append("anomalies: " + ", ".join(f"{a['date']} (z={a['zscore']:.1f})"
+                                                       for a in t['anomalies']))
+            if parts:
+                lines.append(f"{metric.replace('_', ' ').title()}: {', '.join(parts)}")
+        return lines
+
+    @staticmethod
+    def _cohort_lines(cohort: dict | None) -> list[str]:
+        """Score percentile among similar repositories, then the most similar ones."""
+        if not cohort:
+            return []
+        lines = [f"Score percentile {cohort['percentile']:.0f} among {cohort['size']} similar repositories "
+                 f"(rank {cohort['rank']}, median score {cohort['median']:.1f})"]
+        lines.extend(f"{p['repo']}: score {p['score']:.1f}, similarity {p['similarity']:.2f}"
+                     for p in cohort['peers'])
+        return lines
+
+    @staticmethod
+    def _metadata_lines(metadata: dict | None) -> list[str]:
+        """Flatten run metadata (e.g. token pool stats) into readable lines."""
+        def fmt(stats: dict) -> str:
+            return ", ".join(f"{k}={v}" for k, v in stats.items())
+
+        lines = []
+        for section, stats in (metadata or {}).items():
+            title = section.replace('_', ' ').title()
+            if stats and all(isinstance(v, dict) for v in stats.values()):
+                lines.extend(f"{title} — {name}: {fmt(v)}" for name, v in stats.items())
+            else:
+                lines.append(f"{title}: {fmt(stats)}")
+        return lines
 
-        env = jinja2.Environment(loader=jinja2.DictLoader({"report": html_template}))
-        template = env.get_template("report")
-        return template.render(
+    def _html_context(self, data: dict, chart_base64: str | None, chart_mime: str) -> dict:
+        """Variables of the HTML template."""
+        return dict(
             repo=data['repo'],
             score=data['score'],
             metrics=data['metrics'],
             suggestions=data['suggestions'],
-            chart=chart_base64
+            chart=chart_base64,
+            chart_mime=chart_mime,
+            trends=self._trend_lines(data.get('trends')),
+            cohort=self._cohort_lines(data.get('cohort')),
+            metadata=self._metadata_lines(data.get('metadata'))
         )
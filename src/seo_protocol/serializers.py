@@ -0,0 +1,289 @@
+# src/seo_protocol/serializers.py
+"""
+Serialization of analysis results and reports.
+
+Every format is a ``Serializer`` in a small registry:
+
+    • 'json'    — orjson when it is installed, otherwise the stdlib encoder
+                  (both produce the same text for finite numbers)
+    • 'msgpack' — compact binary MessagePack for machine-to-machine
+                  transfer: the msgpack package when it is installed,
+                  otherwise the bundled pure-Python codec
+
+Values JSON has no type for are converted the same way by every backend:
+sets become sorted lists, dates and datetimes ISO 8601 strings and NumPy
+values plain numbers or lists. Other formats can be added with ``register``.
+"""
+import json
+import logging
+import struct
+import threading
+from collections.abc import Callable
+from datetime import date, datetime
+from typing import Any, NamedTuple
+
+logger = logging.getLogger(__name__)
+
+
+class Serializer(NamedTuple):
+    name: str
+    extension: str
+    binary: bool
+    dumps: Callable[..., bytes]        # dumps(obj, pretty=False) -> bytes
+    loads: Callable[[bytes], Any]
+    backend: str
+
+
+def to_builtin(obj):
+    """``default`` hook shared by every encoder for types they lack."""
+    if isinstance(obj, (set, frozenset)):
+        try:
+            return sorted(obj)
+        except TypeError:
+            return list(obj)
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if hasattr(obj, "tolist"):         # NumPy arrays and scalars
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not serializable")
+
+
+# --- JSON ---------------------------------------------------------------
+
+def _stdlib_json_dumps(obj, pretty: bool = False) -> bytes:
+    if pretty:
+        text = json.dumps(obj, default=to_builtin, ensure_ascii=False, indent=2)
+    else:
+        text = json.dumps(obj, default=to_builtin, ensure_ascii=False, separators=(",", ":"))
+    return text.encode("utf-8")
+
+
+def _json_serializer() -> Serializer:
+    try:
+        import orjson
+    except ImportError:
+        return Serializer("json", "json", False, _stdlib_json_dumps, json.loads, "json")
+
+    def dumps(obj, pretty: bool = False) -> bytes:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=to_builtin, option=option)
+
+    return Serializer("json", "json", False, dumps, orjson.loads, "orjson")
+
+
+# --- MessagePack --------------------------------------------------------
+
+def msgpack_dumps(obj, pretty: bool = False) -> bytes:
+    """Pure-Python MessagePack encoder (same bytes as ``msgpack.packb``)."""
+    out = bytearray()
+    _pack(obj, out)
+    return bytes(out)
+
+
+def _pack(obj, out: bytearray, depth: int = 0):
+    if depth > 512:
+        raise ValueError("Object is nested too deeply")
+    if obj is None:
+        out.append(0xC0)
+    elif obj is True:
+        out.append(0xC3)
+    elif obj is False:
+        out.append(0xC2)
+    elif isinstance(obj, int):
+        _pack_int(obj, out)
+    elif isinstance(obj, float):
+        out.append(0xCB)
+        out += struct.pack(">d", obj)
+    elif isinstance(obj, str):
+        data = obj.encode("utf-8")
+        n = len(data)
+        if n < 32:
+            out.append(0xA0 | n)
+        elif n < 0x100:
+            out += struct.pack(">BB", 0xD9, n)
+        elif n < 0x10000:
+            out += struct.pack(">BH", 0xDA, n)
+        else:
+            out += struct.pack(">BI", 0xDB, n)
+        out += data
+    elif isinstance(obj, (bytes, bytearray, memoryview)):
+        n = len(obj)
+        if n < 0x100:
+            out += struct.pack(">BB", 0xC4, n)
+        elif n < 0x10000:
+            out += struct.pack(">BH", 0xC5, n)
+        else:
+            out += struct.pack(">BI", 0xC6, n)
+        out += obj
+    elif isinstance(obj, (list, tuple)):
+        _pack_header(len(obj), 0x90, 0xDC, out)
+        for item in obj:
+            _pack(item, out, depth + 1)
+    elif isinstance(obj, dict):
+        _pack_header(len(obj), 0x80, 0xDE, out)
+        for key, value in obj.items():
+            _pack(key, out, depth + 1)
+            _pack(value, out, depth + 1)
+    else:
+        _pack(to_builtin(obj), out, depth + 1)
+
+
+def _pack_int(value: int, out: bytearray):
+    if 0 <= value < 0x80:
+        out.append(value)
+    elif -32 <= value < 0:
+        out.append(value & 0xFF)
+    elif value >= 0:
+        for code, fmt, limit in ((0xCC, ">BB", 0x100), (0xCD, ">BH", 0x10000),
+                                 (0xCE, ">BI", 0x100000000), (0xCF, ">BQ", 0x10000000000000000)):
+            if value < limit:
+                out += struct.pack(fmt, code, value)
+                return
+        raise OverflowError("Integer value out of range")
+    else:
+        for code, fmt, limit in ((0xD0, ">Bb", 0x80), (0xD1, ">Bh", 0x8000),
+                                 (0xD2, ">Bi", 0x80000000), (0xD3, ">Bq", 0x8000000000000000)):
+            if value >= -limit:
+                out += struct.pack(fmt, code, value)
+                return
+        raise OverflowError("Integer value out of range")
+
+
+def _pack_header(n: int, fix: int, code: int, out: bytearray):
+    """Array/map length: fix form below 16, then 16- and 32-bit lengths."""
+    if n < 16:
+        out.append(fix | n)
+    elif n < 0x10000:
+        out += struct.pack(">BH", code, n)
+    else:
+        out += struct.pack(">BI", code + 1, n)
+
+
+# Fixed-size formats: type code → (struct format, size)
+_FIXED = {
+    0xCA: (">f", 4), 0xCB: (">d", 8),
+    0xCC: (">B", 1), 0xCD: (">H", 2), 0xCE: (">I", 4), 0xCF: (">Q", 8),
+    0xD0: (">b", 1), 0xD1: (">h", 2), 0xD2: (">i", 4), 0xD3: (">q", 8),
+}
+# Length-prefixed formats: type code → (kind, length format, length size)
+_SIZED = {
+    0xD9: ("str", ">B", 1), 0xDA: ("str", ">H", 2), 0xDB: ("str", ">I", 4),
+    0xC4: ("bin", ">B", 1), 0xC5: ("bin", ">H", 2), 0xC6: ("bin", ">I", 4),
+    0xDC: ("array", ">H", 2), 0xDD: ("array", ">I", 4),
+    0xDE: ("map", ">H", 2), 0xDF: ("map", ">I", 4),
+}
+
+
+def msgpack_loads(data: bytes):
+    """Pure-Python MessagePack decoder (arrays become lists, maps dicts)."""
+    data = memoryview(data)
+    obj, pos = _unpack(data, 0)
+    if pos != len(data):
+        raise ValueError(f"Extra data after MessagePack object at byte {pos}")
+    return obj
+
+
+def _unpack(data: memoryview, pos: int):
+    code = data[pos]
+    pos += 1
+    if code < 0x80:
+        return code, pos
+    if code >= 0xE0:
+        return code - 0x100, pos
+    if code < 0x90:
+        return _unpack_map(data, pos, code & 0x0F)
+    if code < 0xA0:
+        return _unpack_array(data, pos, code & 0x0F)
+    if code < 0xC0:
+        n = code & 0x1F
+        return str(data[pos:pos + n], "utf-8"), pos + n
+    if code == 0xC0:
+        return None, pos
+    if code in (0xC2, 0xC3):
+        return code == 0xC3, pos
+    if code in _FIXED:
+        fmt, size = _FIXED[code]
+        return struct.unpack_from(fmt, data, pos)[0], pos + size
+    if code in _SIZED:
+        kind, fmt, size = _SIZED[code]
+        n = struct.unpack_from(fmt, data, pos)[0]
+        pos += size
+        if kind == "str":
+            return str(data[pos:pos + n], "utf-8"), pos + n
+        if kind == "bin":
+            return bytes(data[pos:pos + n]), pos + n
+        if kind == "array":
+            return _unpack_array(data, pos, n)
+        return _unpack_map(data, pos, n)
+    raise ValueError(f"Unsupported MessagePack type 0x{code:02x}")
+
+
+def _unpack_array(data: memoryview, pos: int, n: int):
+    items = []
+    for _ in range(n):
+        item, pos = _unpack(data, pos)
+        items.append(item)
+    return items, pos
+
+
+def _unpack_map(data: memoryview, pos: int, n: int):
+    items = {}
+    for _ in range(n):
+        key, pos = _unpack(data, pos)
+        items[key], pos = _unpack(data, pos)
+    return items, pos
+
+
+def _msgpack_serializer() -> Serializer:
+    try:
+        import msgpack
+    except ImportError:
+        return Serializer("msgpack", "msgpack", True, msgpack_dumps, msgpack_loads, "python")
+
+    def dumps(obj, pretty: bool = False) -> bytes:
+        return msgpack.packb(obj, default=to_builtin, use_bin_type=True)
+
+    def loads(data: bytes):
+        return msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+    return Serializer("msgpack", "msgpack", True, dumps, loads, "msgpack")
+
+
+# --- Registry -----------------------------------------------------------
+
+# Built-in formats, resolved (and their optional backends imported) on first use
+_FACTORIES = {"json": _json_serializer, "msgpack": _msgpack_serializer}
+_registry: dict[str, Serializer] = {}
+_registry_lock = threading.Lock()
+
+
+def register(serializer: Serializer):
+    """Add (or replace) a format."""
+    with _registry_lock:
+        _registry[serializer.name] = serializer
+
+
+def get(name: str) -> Serializer:
+    """The serializer of format ``name``."""
+    with _registry_lock:
+        if name not in _registry:
+            if name not in _FACTORIES:
+                raise ValueError(f"Unknown serialization format: {name}")
+            _registry[name] = _FACTORIES[name]()
+            logger.debug(f"Serializing {name} with {_registry[name].backend}")
+        return _registry[name]
+
+
+def formats() -> list[str]:
+    with _registry_lock:
+        return sorted(set(_FACTORIES) | set(_registry))
+
+
+def dumps(obj, fmt: str = "json", pretty: bool = False) -> bytes:
+    return get(fmt).dumps(obj, pretty=pretty)
+
+
+def loads(data: bytes, fmt: str = "json"):
+    return get(fmt).loads(data)
@@ -0,0 +1,57 @@
+import threading
+from .rate_limit import RateLimitScheduler
+
+
+def token_label(index: int) -> str:
+    """
+    Label of the pool's ``index``-th token in stats and report metadata.
+    Reports get published, so it carries no part of the token itself.
+    """
+    return f"token{index + 1}"
+
+
+class TokenPool:
+    """
+    Several GitHub tokens used as one quota.
+
+    Each token has its own ``RateLimitScheduler`` tracking that token's live
+    quota. Every request is routed to the token with the most headroom
+    (remaining requests, fewest issued as tie-break), so a throttled or
+    drained token is skipped while others still have quota and throughput
+    grows with the number of tokens.
+
+    Drop-in replacement for a single scheduler in ``RateLimitAdapter``:
+    ``acquire`` returns the token the request must be sent with.
+    """
+
+    def __init__(self, tokens: list[str], **scheduler_options):
+        if not tokens:
+            raise ValueError("TokenPool needs at least one token")
+        self.tokens = list(dict.fromkeys(tokens))
+        self.schedulers = {t: RateLimitScheduler(**scheduler_options) for t in self.tokens}
+        self.issued = {t: 0 for t in self.tokens}
+        self.max_retries = self.schedulers[self.tokens[0]].max_retries
+        self._lock = threading.Lock()
+
+    resource_for = staticmethod(RateLimitScheduler.resource_for)
+
+    def acquire(self, resource: str = "core") -> str:
+        """Pick the token with the most headroom and wait for its bucket."""
+        with self._lock:
+            token = max(self.tokens, key=lambda t: (self.schedulers[t].headroom(resource),
+                                                    -self.issued[t]))
+            self.issued[token] += 1
+        self.schedulers[token].acquire(resource)
+        return token
+
+    def observe(self, resource: str, status: int, headers, body: bytes = b"",
+                attempt: int = 0, token: str | None = None) -> bool:
+        return self.schedulers[token].observe(resource, status, headers, body, attempt)
+
+    def stats(self) -> dict:
+        """Per-token quota and usage, for the report metadata."""
+        with self._lock:
+            return {
+                token_label(i): {"requests": self.issued[t], **self.schedulers[t].stats()}
+                for i, t in enumerate(self.tokens)
+            }
@@ -0,0 +1,55 @@
+import os
+import tempfile
+import time
+import unittest
+import numpy as np
+from src.seo_protocol import analytics
+from src.seo_protocol.monitor import Monitor
+
+class TestAnalytics(unittest.TestCase):
+
+    def test_forward_fill_and_rolling_mean(self):
+        values = np.array([[np.nan, 1.0, np.nan, 3.0],
+                           [2.0, np.nan, np.nan, 5.0]])
+        filled = analytics.forward_fill(values)
+        self.assertTrue(np.isnan(filled[0, 0]))
+        self.assertEqual(filled[0, 1:].tolist(), [1.0, 1.0, 3.0])
+        self.assertEqual(filled[1].tolist(), [2.0, 2.0, 2.0, 5.0])
+        self.assertEqual(analytics.rolling_mean(np.array([1.0, np.nan, 3.0, 5.0]), 2).tolist(),
+                         [1.0, 1.0, 3.0, 4.0])
+
+    def test_velocity_forecast_and_spike_over_fleet(self):
+        steady = np.arange(30, dtype=float) * 2          # +2 stars/day
+        spiky = steady.copy()
+        spiky[25:] += 60                                 # sudden jump on day 25
+        flat = np.full(30, 10.0)
+        results = analytics.compute({"stars": np.vstack([steady, spiky, flat])})
+
+        stars = results["stars"]
+        np.testing.assert_allclose(stars["velocity"], [2.0, 2.0 + 60 / 7, 0.0])
+        np.testing.assert_allclose(stars["forecast"][0], 58 + 2 * np.arange(1, 8))
+        self.assertEqual(np.flatnonzero(stars["anomalies"][1]).tolist(), [25])
+        self.assertFalse(stars["anomalies"][[0, 2]].any())
+
+        ts = 1_700_000_000 + analytics.DAY * np.arange(30)
+        trends = analytics.trends_for(ts, results, index=1)
+        self.assertEqual(len(trends["stars"]["anomalies"]), 1)
+        self.assertGreater(trends["stars"]["anomalies"][0]["zscore"], 3)
+
+    def test_repo_trends_from_monitor(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            monitor = Monitor(os.path.join(tmp, "monitor.db"))
+            now = int(time.time())
+            with monitor.session():
+                for day in range(10):
+                    monitor.save_many([("username/repo", {"stars": 100 + 5 * day, "forks": 3}, 60.0)],
+                                      ts=now - (9 - day) * analytics.DAY)
+            trends = analytics.repo_trends(monitor, "username/repo", days_back=10)
+            monitor.close()
+
+        self.assertEqual(trends["stars"]["velocity_per_day"], 5.0)
+        self.assertEqual(trends["forks"]["velocity_per_day"], 0.0)
+        self.assertEqual(trends["score"]["forecast"][-1], 60.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import base64
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from src.seo_protocol.chart_cache import ChartCache, chart_digest
+from src.seo_protocol.charter import Charter
+
+class TestChartCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.directory = os.path.join(self.tmp.name, "charts")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_hit_miss_and_lru_eviction(self):
+        cache = ChartCache(self.directory, max_bytes=250)
+        self.assertIsNone(cache.get("aa11", "png"))
+        cache.put("aa11", "png", b"a" * 100)
+        cache.put("bb22", "png", b"b" * 100)
+        self.assertEqual(cache.get("aa11", "png"), b"a" * 100)  # aa11 is now the most recent
+
+        cache.put("cc33", "png", b"c" * 100)
+
+        self.assertIsNone(cache.get("bb22", "png"))
+        self.assertEqual(cache.get("cc33", "png"), b"c" * 100)
+        self.assertEqual(cache.stats(), {"hits": 2, "misses": 2, "hit_rate": 0.5,
+                                         "bytes_saved": 200, "evictions": 1, "stored_bytes": 200})
+
+        # A new instance picks up what is on disk
+        reopened = ChartCache(self.directory, max_bytes=250)
+        self.assertEqual(reopened.get("aa11", "png"), b"a" * 100)
+        self.assertEqual(reopened.stats()["stored_bytes"], 200)
+
+    def test_digest_depends_on_series_and_params(self):
+        base = chart_digest([(0, 1), (3600, 2)], {"fmt": "png"})
+        self.assertEqual(base, chart_digest([(0, 1), (3600, 2)], {"fmt": "png"}))
+        self.assertNotEqual(base, chart_digest([(0, 1), (3600, 3)], {"fmt": "png"}))
+        self.assertNotEqual(base, chart_digest([(0, 1), (3600, 2)], {"fmt": "svg"}))
+
+    def test_charter_renders_unchanged_history_once(self):
+        cache = ChartCache(self.directory)
+        charter = Charter(cache=cache)
+        history = [{"ts": 1_700_000_000 + d * 86400, "stars": d * 3} for d in range(10)]
+        # Seconds within the same hour do not change the chart
+        rerun = [{**row, "ts": row["ts"] + 60} for row in history]
+
+        first = charter.generate_stars_trend_chart(history)
+        with patch.object(Charter, "_render_png", side_effect=AssertionError("rendered again")):
+            second = charter.generate_stars_trend_chart(rerun)
+            batch = charter.render_many({"a/one": history, "a/two": rerun}, max_workers=2)
+
+        self.assertEqual(first, second)
+        self.assertEqual(batch, {"a/one": first, "a/two": first})
+        self.assertTrue(base64.b64decode(first).startswith(b"\x89PNG"))
+        self.assertEqual(cache.stats()["hits"], 3)
+
+if __name__ == '__main__':
+    unittest.main()
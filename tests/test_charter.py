@@ -1,6 +1,8 @@
 # tests/test_charter.py
+import base64
 import unittest
-from src.seo_protocol.charter import Charter
+from unittest.mock import patch
+from src.seo_protocol.charter import Charter, sparkline_svg
 
 class TestCharter(unittest.TestCase):
 
@@ -19,5 +21,52 @@ class TestCharter(unittest.TestCase):
         
         self.assertIsNotNone(chart_base64)
 
+    def test_figure_is_reused_between_charts(self):
+        charter = Charter()
+        first = [{"ts": 1_700_000_000 + d * 86400, "stars": d} for d in range(10)]
+        second = [{"ts": 1_700_000_000 + d * 86400, "stars": 100 - d} for d in range(30)]
+
+        a = charter.generate_stars_trend_chart(first)
+        figure = Charter._local.figure
+        b = charter.generate_stars_trend_chart(second)
+
+        self.assertIs(Charter._local.figure, figure)
+        self.assertNotEqual(a, b)
+        self.assertTrue(base64.b64decode(b).startswith(b"\x89PNG"))
+
+    def test_svg_sparkline_and_batch(self):
+        history = [{"date": f"2025-01-0{d}", "stars": s} for d, s in ((1, 5), (2, 9), (3, 7))]
+        svg = base64.b64decode(Charter("svg").generate_stars_trend_chart(history)).decode()
+
+        self.assertTrue(svg.startswith("<svg"))
+        self.assertIn('points="3.0,45.0 120.0,3.0 237.0,24.0"', svg)
+        self.assertEqual(sparkline_svg([1]), "")
+
+        charts = Charter().render_many({"a/one": history, "a/two": history[:1]}, max_workers=2)
+        self.assertEqual(set(charts), {"a/one", "a/two"})
+        self.assertTrue(base64.b64decode(charts["a/one"]).startswith(b"\x89PNG"))
+        self.assertIsNone(charts["a/two"])
+
+    def test_render_many_shares_a_pool(self):
+        charter = Charter()
+        histories = {f"a/repo{i}": [{"ts": 1_700_000_000 + d * 86400, "stars": d * i} for d in range(5)]
+                     for i in range(1, 4)}
+        with charter.render_pool(max_workers=2) as pool:
+            first = charter.render_many(dict(list(histories.items())[:2]), pool=pool)
+            second = charter.render_many(histories, pool=pool)
+
+        self.assertEqual(set(second), set(histories))
+        self.assertEqual(first["a/repo1"], second["a/repo1"])
+        self.assertEqual(second["a/repo3"], charter.generate_stars_trend_chart(histories["a/repo3"]))
+        with Charter("svg").render_pool() as pool:
+            self.assertIsNone(pool)
+
+    def test_render_many_without_pool_spawns_one(self):
+        history = [{"ts": 1_700_000_000 + d * 86400, "stars": d} for d in range(5)]
+        with patch.object(Charter, "render_pool", autospec=True, side_effect=Charter.render_pool) as render_pool:
+            charts = Charter().render_many({"a/one": history}, max_workers=2)
+        render_pool.assert_called_once()
+        self.assertTrue(base64.b64decode(charts["a/one"]).startswith(b"\x89PNG"))
+
 if __name__ == '__main__':
     unittest.main()
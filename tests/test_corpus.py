@@ -0,0 +1,94 @@
+import os
+import tempfile
+import unittest
+from src.seo_protocol.corpus import KeywordCorpus, document_terms, score_percentile
+from src.seo_protocol.monitor import Monitor
+
+DOCS = {
+    "a/wallet": {"ethereum": 2, "wallet": 3, "solidity": 1},
+    "b/wallet-ui": {"ethereum": 1, "wallet": 2, "react": 2, "web3": 1},
+    "c/signer": {"ethereum": 1, "wallet": 1, "web3": 2, "hardware": 1},
+    "d/plots": {"python": 3, "charts": 2, "matplotlib": 1},
+    "e/dashboards": {"python": 1, "charts": 1, "dashboard": 2},
+}
+
+
+class TestKeywordCorpus(unittest.TestCase):
+
+    def setUp(self):
+        self.corpus = KeywordCorpus(neighbors=3, min_support=2)
+        for repo, terms in DOCS.items():
+            self.corpus.add(repo, terms)
+
+    def test_similar(self):
+        similar = self.corpus.similar("a/wallet", k=2)
+        self.assertEqual({repo for repo, _ in similar}, {"b/wallet-ui", "c/signer"})
+        self.assertTrue(all(0 < score <= 1 for _, score in similar))
+        self.assertEqual(self.corpus.similar("unknown/repo"), [])
+
+    def test_suggest_ranks_terms_shared_by_neighbours(self):
+        # web3 is used by two neighbours; react and hardware by one each
+        self.assertEqual(self.corpus.suggest("a/wallet"), ["web3"])
+        self.assertNotIn("python", self.corpus.suggest("a/wallet", terms={"wallet": 1}))
+
+    def test_suggest_needs_enough_neighbours(self):
+        corpus = KeywordCorpus(min_support=2)
+        corpus.add("a/wallet", DOCS["a/wallet"])
+        corpus.add("b/wallet-ui", DOCS["b/wallet-ui"])
+        self.assertEqual(corpus.suggest("a/wallet"), [])
+
+    def test_replace_and_remove(self):
+        self.corpus.add("a/wallet", {"python": 1, "charts": 1})
+        self.assertEqual(len(self.corpus), 5)
+        self.assertNotIn("a/wallet", self.corpus._postings["ethereum"])
+        self.assertEqual(self.corpus.similar("a/wallet", k=1)[0][0], "d/plots")
+
+        self.corpus.remove("a/wallet")
+        self.corpus.remove("d/plots")
+        self.assertNotIn("a/wallet", self.corpus)
+        self.assertNotIn("matplotlib", self.corpus._postings)
+        self.assertEqual(self.corpus.stats(), {"documents": 3, "terms": 8, "queries": 0})
+
+    def test_cohort(self):
+        scores = {"a/wallet": 40.0, "b/wallet-ui": 70.0, "c/signer": 40.0, "d/plots": 90.0}
+        for repo, score in scores.items():
+            self.corpus.add(repo, DOCS[repo], score)
+
+        cohort = self.corpus.cohort("a/wallet", k=5, peers=1)
+        self.assertEqual(cohort["size"], 2)             # e/dashboards has no score, d/plots shares no term
+        self.assertEqual(cohort["percentile"], 25.0)
+        self.assertEqual(cohort["rank"], 2)
+        self.assertEqual(cohort["median"], 55.0)
+        self.assertEqual(len(cohort["peers"]), 1)
+        self.assertIn(cohort["peers"][0]["repo"], {"b/wallet-ui", "c/signer"})
+
+        self.assertIsNone(self.corpus.cohort("e/dashboards"))
+        self.corpus.add("e/dashboards", DOCS["e/dashboards"], 10.0)
+        self.assertEqual(self.corpus.cohort("e/dashboards")["percentile"], 0.0)
+
+    def test_score_percentile(self):
+        self.assertEqual(score_percentile(50, [10, 50, 90, 95]), 37.5)
+        self.assertEqual(score_percentile(100, [10, 50]), 100.0)
+        self.assertEqual(score_percentile(50, []), 0.0)
+
+    def test_document_terms(self):
+        terms = document_terms(["wallet", "ethereum", "wallet"], {"terms": {"wallet": 4, "ledger": 2}})
+        self.assertEqual(terms, {"wallet": 6, "ethereum": 1, "ledger": 2})
+        self.assertEqual(document_terms(["wallet"], None), {"wallet": 1})
+
+    def test_persisted_in_monitor(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            monitor = Monitor(os.path.join(tmp, "monitor.db"))
+            for repo, terms in DOCS.items():
+                monitor.save_corpus_document(repo, terms, 50.0)
+            monitor.save_corpus_document("a/wallet", {"ethereum": 1, "wallet": 1}, 20.0)
+            loaded = KeywordCorpus.from_monitor(monitor, neighbors=3)
+            monitor.close()
+        self.assertEqual(len(loaded), 5)
+        self.assertEqual(loaded._docs["a/wallet"], {"ethereum": 1, "wallet": 1})
+        self.assertEqual(loaded.suggest("a/wallet"), ["web3"])
+        self.assertEqual(loaded.cohort("a/wallet")["percentile"], 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,8 @@
 # tests/test_github_api.py
 import unittest
 from unittest.mock import patch, MagicMock
-from src.seo_protocol.github_api import GitHubAPI
+from src.seo_protocol.github_api import CountCache, GitHubAPI, SharedGitHubClient
+import threading
 import json
 import os
 
@@ -27,18 +28,23 @@ class TestGitHubAPI(unittest.TestCase):
         mock_repo.stargazers_count = 100
         mock_repo.forks_count = 20
         mock_repo.watchers_count = 50
-        mock_repo.get_contributors.return_value = ['user1', 'user2', 'user3']
-        mock_repo.get_commits.return_value.totalCount = 300
+        mock_repo.url = 'https://api.github.com/repos/username/repo'
+        last_pages = {'contributors': 3, 'commits': 300}
+        def list_first_page(verb, url, parameters=None):
+            listing = url.rsplit('/', 1)[1]
+            link = f'<{url}?per_page=1&page={last_pages[listing]}>; rel="last"'
+            return {'link': link}, [{}]
+        mock_repo.requester.requestJsonAndCheck.side_effect = list_first_page
         mock_repo.open_issues_count = 5
-        mock_repo.get_views.return_value.total_count = 1500
-        mock_repo.get_clones.return_value.total_count = 1200
+        mock_repo.get_views_traffic.return_value.count = 1500
+        mock_repo.get_clones_traffic.return_value.count = 1200
         mock_repo.description = "Blockchain project"
         mock_repo.get_topics.return_value = ["blockchain", "ethereum"]
 
         MockGithub.return_value.get_repo.return_value = mock_repo
 
         # Initialize GitHubAPI with the token
-        api = GitHubAPI(self.github_token, 'username/repo')
+        api = GitHubAPI(self.github_token, 'username/repo', counts=CountCache())
         metrics = api.fetch_metrics()
 
         # Check if the metrics match the mock data
@@ -71,5 +77,53 @@ class TestGitHubAPI(unittest.TestCase):
         self.assertIn('ethereum', keywords)
         self.assertIn('nft', suggested)
 
+
+class TestCounting(unittest.TestCase):
+
+    @patch('src.seo_protocol.github_api.Github')
+    def test_count_items_reads_link_header_once(self, MockGithub):
+        mock_repo = MockGithub.return_value.get_repo.return_value
+        mock_repo.full_name = 'username/repo'
+        mock_repo.url = 'https://api.github.com/repos/username/repo'
+        mock_repo.pushed_at = '2025-03-01'
+        link = '<https://api.github.com/repositories/1/contributors?per_page=1&page=12345>; rel="last"'
+        mock_repo.requester.requestJsonAndCheck.return_value = ({'link': link}, [{}])
+
+        api = GitHubAPI('dummy_token', 'username/repo', counts=CountCache())
+        self.assertEqual(api.count_items('contributors'), 12345)
+        self.assertEqual(api.count_items('contributors'), 12345)
+        mock_repo.requester.requestJsonAndCheck.assert_called_once_with(
+            'GET', f'{mock_repo.url}/contributors', parameters={'per_page': 1})
+
+        # A new push invalidates the cached count
+        mock_repo.pushed_at = '2025-03-02'
+        api.count_items('contributors')
+        self.assertEqual(mock_repo.requester.requestJsonAndCheck.call_count, 2)
+
+    @patch('src.seo_protocol.github_api.Github')
+    def test_count_items_without_link_header(self, MockGithub):
+        mock_repo = MockGithub.return_value.get_repo.return_value
+        mock_repo.requester.requestJsonAndCheck.return_value = ({}, [{'login': 'user1'}])
+
+        api = GitHubAPI('dummy_token', 'username/repo', counts=CountCache())
+        self.assertEqual(api.count_items('contributors', pushed_at='2025-03-01'), 1)
+
+class TestSharedGitHubClient(unittest.TestCase):
+
+    def test_one_client_per_thread_sharing_session(self):
+        shared = SharedGitHubClient('dummy_token')
+        main_client = shared.get()
+        self.assertIs(shared.get(), main_client)
+
+        other = []
+        thread = threading.Thread(target=lambda: other.append(shared.get()))
+        thread.start()
+        thread.join()
+        self.assertIsNot(other[0], main_client)
+
+        # Connections opened by any thread's client reuse the shared session
+        cnx = main_client.requester._Requester__connectionClass('api.github.com')
+        self.assertIs(cnx.session, shared.session)
+
 if __name__ == '__main__':
     unittest.main()
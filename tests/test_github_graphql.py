@@ -0,0 +1,100 @@
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from src.seo_protocol.github_graphql import GraphQLMetricsFetcher, graphql_url
+
+def repo_node(name, stars):
+    return {
+        "nameWithOwner": name,
+        "description": "Solidity toolkit",
+        "pushedAt": "2025-03-01T00:00:00Z",
+        "stargazerCount": stars,
+        "forkCount": 7,
+        "issues": {"totalCount": 3},
+        "pullRequests": {"totalCount": 2},
+        "licenseInfo": {"spdxId": "MIT"},
+        "repositoryTopics": {"nodes": [{"topic": {"name": "solidity"}}]},
+        "defaultBranchRef": {"target": {"history": {"totalCount": 420}}},
+        "readme_md": {"oid": "abc123"},
+        "readme_lower": None,
+        "readme_rst": None,
+        "readme_plain": None,
+    }
+
+class StubGraphQLHandler(BaseHTTPRequestHandler):
+    """Answers every aliased repository field; repos named 'missing' resolve to null."""
+    requests_seen = []
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        self.requests_seen.append(body)
+        variables = body["variables"]
+        data = {}
+        for key, owner in variables.items():
+            if not key.startswith("o"):
+                continue
+            i = key[1:]
+            name = variables[f"n{i}"]
+            data[f"r{i}"] = None if name == "missing" else repo_node(f"{owner}/{name}", 100 + int(i))
+
+        payload = json.dumps({"data": data}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+class BrokenGraphQLHandler(StubGraphQLHandler):
+    def do_POST(self):
+        self.send_error(502)
+
+class TestGraphQLMetricsFetcher(unittest.TestCase):
+
+    def start_server(self, handler):
+        server = HTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return f"http://127.0.0.1:{server.server_port}/graphql"
+
+    def setUp(self):
+        StubGraphQLHandler.requests_seen = []
+        self.endpoint = self.start_server(StubGraphQLHandler)
+
+    def test_fetch_batches_repos_into_single_requests(self):
+        fetcher = GraphQLMetricsFetcher('dummy_token', self.endpoint, batch_size=2)
+        results = fetcher.fetch(['username/repo', 'username/other', 'username/missing'])
+
+        self.assertEqual(len(StubGraphQLHandler.requests_seen), 2)
+        self.assertIsNone(results['username/missing'])
+
+        record = results['username/repo']
+        self.assertEqual(record['metrics'], {
+            'stars': 100,
+            'forks': 7,
+            'watchers': 100,
+            'commits': 420,
+            'issues': 5,
+            'has_readme': True,
+            'has_license': True,
+        })
+        self.assertEqual(record['topics'], ['solidity'])
+        self.assertEqual(record['pushed_at'], '2025-03-01T00:00:00Z')
+        self.assertEqual(record['readme_sha'], 'abc123')
+        self.assertEqual(results['username/other']['metrics']['stars'], 101)
+
+    def test_failed_endpoint_falls_back_to_rest(self):
+        fetcher = GraphQLMetricsFetcher('dummy_token', self.start_server(BrokenGraphQLHandler))
+        results = fetcher.fetch(['username/repo'])
+        self.assertEqual(results, {'username/repo': None})
+
+    def test_endpoint_follows_rest_base_url(self):
+        self.assertEqual(graphql_url("https://api.github.com"), "https://api.github.com/graphql")
+        self.assertEqual(graphql_url("https://ghe.example.com/api/v3/"), "https://ghe.example.com/api/graphql")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+import requests
+from src.seo_protocol.http_cache import CachingAdapter, ResponseCache
+
+class ETagHandler(BaseHTTPRequestHandler):
+    """Serves a JSON body per path with an ETag and honours If-None-Match."""
+    statuses = []
+
+    def do_GET(self):
+        body = json.dumps({"path": self.path, "stargazers_count": 100}).encode()
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        if self.headers.get("If-None-Match") == etag:
+            self.statuses.append(304)
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("X-RateLimit-Remaining", "4999")
+            self.end_headers()
+            return
+        self.statuses.append(200)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_header("X-RateLimit-Remaining", "4998")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+class TestResponseCache(unittest.TestCase):
+
+    def setUp(self):
+        ETagHandler.statuses = []
+        server = HTTPServer(("127.0.0.1", 0), ETagHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        self.base_url = f"http://127.0.0.1:{server.server_port}"
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.db_path = os.path.join(tmp.name, "http_cache.db")
+
+    def session_with(self, cache):
+        session = requests.Session()
+        session.mount("http://", CachingAdapter(cache))
+        return session
+
+    def test_not_modified_is_served_from_disk(self):
+        cache = ResponseCache(self.db_path)
+        first = self.session_with(cache).get(f"{self.base_url}/repos/username/repo")
+        cache.close()
+
+        # A new cache instance (next hourly run) revalidates instead of refetching
+        cache = ResponseCache(self.db_path)
+        second = self.session_with(cache).get(f"{self.base_url}/repos/username/repo")
+
+        self.assertEqual(ETagHandler.statuses, [200, 304])
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.json(), first.json())
+        self.assertEqual(second.headers["X-RateLimit-Remaining"], "4999")
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 0))
+        self.assertEqual(stats["bytes_saved"], len(first.content))
+
+    def test_lru_eviction_respects_size_limit(self):
+        cache = ResponseCache(self.db_path, max_bytes=90)
+        session = self.session_with(cache)
+        for path in ("/a", "/b", "/a", "/c"):
+            session.get(f"{self.base_url}{path}")
+
+        stats = cache.stats()
+        self.assertLessEqual(stats["stored_bytes"], 90)
+        self.assertGreater(stats["evictions"], 0)
+        # '/a' was used more recently than '/b', so '/b' went first
+        self.assertIsNotNone(cache.get(f"{self.base_url}/a|*/*"))
+        self.assertIsNone(cache.get(f"{self.base_url}/b|*/*"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from src.seo_protocol.keywords import (ENGLISH_STOPWORDS, KeywordExtractor, TrendIndex, load_tokenizer,
+                                       load_trend_index, simple_tokenize)
+
+class TestKeywords(unittest.TestCase):
+
+    def test_simple_tokenize(self):
+        tokens = simple_tokenize("a solidity smart-contract toolkit, for web3!")
+        self.assertEqual(tokens, ["a", "solidity", "smart-contract", "toolkit", ",", "for", "web3", "!"])
+
+    def test_simple_mode_uses_bundled_stopwords(self):
+        tokenize, stop_words = load_tokenizer("simple")
+        self.assertIs(tokenize, simple_tokenize)
+        self.assertIs(stop_words, ENGLISH_STOPWORDS)
+        self.assertIs(load_tokenizer("simple")[1], stop_words)
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            load_tokenizer("spacy")
+
+    def test_import_does_not_load_nltk(self):
+        code = ("import sys; import src.seo_protocol.github_api; "
+                "print('nltk' in sys.modules)")
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        self.assertEqual(out.stdout.strip(), "False")
+
+class TestTrendIndex(unittest.TestCase):
+
+    def test_overlapping_phrases(self):
+        index = TrendIndex(["proof of stake", "stake", "Stake Pool", "zero-knowledge"])
+        self.assertEqual(index.find("a proof of stake pool".split()), {"proof of stake", "stake", "stake pool"})
+        self.assertEqual(index.find(["zero", "knowledge"]), {"zero-knowledge"})
+        self.assertEqual(index.find(["proof", "of", "work"]), set())
+
+    def test_extractor_matches_hyphenated_and_spaced_terms(self):
+        extractor = KeywordExtractor("simple", TrendIndex(["smart-contract", "layer2", "zero knowledge", "defi"]))
+        keywords, suggested = extractor.extract("A Smart contract kit with zero-knowledge proofs", ["layer2"])
+
+        self.assertEqual(keywords, ["smart", "contract", "kit", "zero-knowledge", "proofs", "layer2"])
+        self.assertEqual(suggested, ["defi"])
+        batch = list(extractor.extract_many([("smart-contract audits", None), (None, ["defi"])]))
+        self.assertEqual(batch[0], (["smart-contract", "audits"], ["layer2", "zero knowledge", "defi"]))
+        self.assertEqual(batch[1][1], ["smart-contract", "layer2", "zero knowledge"])
+
+        # Suggestions follow vocabulary order
+        limited = KeywordExtractor("simple", extractor.trends, max_suggestions=2)
+        self.assertEqual(limited.extract("layer2 rollups", None)[1], ["smart-contract", "zero knowledge"])
+
+    def test_vocabulary_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "trends.txt")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("# comment\nRust\n\nwasm  # inline comment\nrust\n")
+            index = load_trend_index(path)
+            self.assertIs(load_trend_index(path), index)
+        self.assertEqual(index.all_terms, {"rust", "wasm"})
+        self.assertNotEqual(index.digest, load_trend_index().digest)
+        self.assertIn("smart-contract", load_trend_index().all_terms)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Two JSON-only pipeline runs (so there is history to chart) with a stubbed analyzer
+JSON_RUN = """
+from unittest.mock import MagicMock
+from src.seo_protocol import SEOProtocol
+
+analyzer = MagicMock()
+analyzer.analyze.return_value = {'metrics': {'stars': 10}, 'score': 12.0,
+                                 'keywords': ['solidity'], 'suggested_keywords': ['defi']}
+protocol = SEOProtocol('username/repo', 'dummy_token', analyzer=analyzer, http_cache_path=None)
+protocol.run_pipeline('json')
+protocol.run_pipeline('json')
+"""
+
+HEAVY_MODULES = ("matplotlib", "jinja2", "googleapiclient", "oauth2client", "nltk")
+
+class TestLazyImports(unittest.TestCase):
+
+    def test_json_run_skips_heavy_dependencies(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            result = subprocess.run(
+                [sys.executable, "-X", "importtime", "-c", JSON_RUN],
+                cwd=tmp, capture_output=True, text=True,
+                env={**os.environ, "PYTHONPATH": ROOT},
+            )
+            self.assertEqual(result.returncode, 0, result.stderr[-2000:])
+            self.assertTrue(os.path.exists(os.path.join(tmp, "seo_report_username_repo.json")))
+
+        imported = {line.split("|")[-1].strip().split(".")[0]
+                    for line in result.stderr.splitlines() if line.startswith("import time:")}
+        self.assertIn("src", imported)
+        for module in HEAVY_MODULES:
+            self.assertNotIn(module, imported)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,13 @@
 # tests/test_monitor.py
-import unittest
+import json
+import os
 import sqlite3
+import tempfile
+import threading
+import time
+import unittest
 from datetime import datetime, timedelta
+from src.seo_protocol.metrics_codec import DEFAULT_LAYOUT, layout_version, pack
 from src.seo_protocol.monitor import Monitor
 
 class TestMonitor(unittest.TestCase):
@@ -45,5 +51,204 @@ class TestMonitor(unittest.TestCase):
 
         self.assertGreater(len(historical_data), 0)
 
+    def test_session_commits_once_and_rolls_back_on_error(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "monitor.db")
+            monitor = Monitor(db_path=path)
+            metrics = {'stars': 50, 'forks': 10}
+
+            with monitor.session():
+                monitor.save_current_metrics("username/a", metrics, 70.5)
+                monitor.save_current_metrics("username/b", metrics, 70.5)
+            with self.assertRaises(RuntimeError):
+                with monitor.session():
+                    monitor.save_current_metrics("username/c", metrics, 70.5)
+                    raise RuntimeError("abort batch")
+
+            conn = sqlite3.connect(path)
+            repos = [row[0] for row in conn.execute("SELECT repo FROM metrics ORDER BY repo")]
+            journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+            conn.close()
+            monitor.close()
+
+            self.assertEqual(repos, ["username/a", "username/b"])
+            self.assertEqual(journal_mode, "wal")
+
+    def test_save_many_consumes_generator_in_chunks(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            monitor = Monitor(db_path=os.path.join(tmp, "monitor.db"))
+            snapshots = ((f"username/repo{i}", {'stars': i, 'forks': 1}, float(i)) for i in range(25))
+
+            written = monitor.save_many(snapshots, chunk_size=10)
+            history = monitor.get_historical_data("username/repo7", days_back=1)
+            monitor.close()
+
+            self.assertEqual(written, 25)
+            self.assertEqual(len(history), 1)
+            self.assertEqual(history[0]['stars'], 7)
+            self.assertEqual(history[0]['score'], 7.0)
+
+    def test_migrates_text_date_schema(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "old.db")
+            conn = sqlite3.connect(path)
+            conn.execute("""
+                CREATE TABLE metrics (
+                    repo TEXT NOT NULL, date TEXT NOT NULL, stars INTEGER,
+                    forks INTEGER, score REAL, PRIMARY KEY (repo, date)
+                )
+            """)
+            yesterday = datetime.utcnow() - timedelta(days=1)
+            rows = [("username/repo", (yesterday + timedelta(minutes=m)).isoformat(), 40 + m, 10, 60.0)
+                    for m in range(3)]
+            conn.executemany("INSERT INTO metrics VALUES (?, ?, ?, ?, ?)", rows)
+            conn.commit()
+            conn.close()
+
+            monitor = Monitor(db_path=path)
+            history = monitor.get_historical_data("username/repo", days_back=7, resolution=60)
+            monitor.close()
+
+            self.assertEqual([h['stars'] for h in history], [40, 41, 42])
+            self.assertEqual(history[0]['date'], rows[0][1].split('.')[0])
+
+    def test_upgrades_tables_of_older_databases(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "v2.db")
+            Monitor(db_path=path).close()
+            conn = sqlite3.connect(path)
+            conn.execute("DROP TABLE corpus_documents")
+            # corpus_documents as created before scores were stored
+            conn.execute("CREATE TABLE corpus_documents (repo TEXT PRIMARY KEY, terms TEXT NOT NULL, "
+                         "updated TEXT NOT NULL)")
+            conn.execute("INSERT INTO corpus_documents VALUES ('username/old', '{\"defi\": 1}', '')")
+            conn.execute("PRAGMA user_version = 2")
+            conn.commit()
+            conn.close()
+            monitor = Monitor(db_path=path)
+            monitor.save_corpus_document("username/repo", {"wallet": 2}, 61.5)
+
+            self.assertEqual(list(monitor.iter_corpus_documents()),
+                             [("username/old", {"defi": 1}, None), ("username/repo", {"wallet": 2}, 61.5)])
+            monitor.close()
+
+    def test_history_reads_coarsest_rollup(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            monitor = Monitor(db_path=os.path.join(tmp, "monitor.db"))
+            now = int(time.time())
+            start = now - now % 86400 - 3 * 86400
+            with monitor.session():
+                for h in range(72):
+                    monitor.save_many([("username/repo", {'stars': h, 'forks': 1}, 50.0 + h % 2)],
+                                      ts=start + h * 3600)
+
+            raw = monitor.get_historical_data("username/repo", days_back=7, resolution=60)
+            hourly = monitor.get_historical_data("username/repo", days_back=7, resolution=3600)
+            daily = monitor.get_historical_data("username/repo", days_back=7, resolution=86400)
+            year = monitor.get_historical_data("username/repo", days_back=365, resolution=60)
+            deleted = monitor.compact()
+            monitor.close()
+
+            self.assertEqual(len(raw), 72)
+            self.assertEqual(len(hourly), 72)
+            self.assertEqual([(d['stars'], d['score']) for d in daily],
+                             [(23, 50.5), (47, 50.5), (71, 50.5)])
+            # Raw and hourly rows are not kept for a year: read the daily rollup
+            self.assertEqual(len(year), 3)
+            self.assertEqual(deleted, {"raw": 0, "hourly": 0, "daily": 0})
+
+    def test_full_metrics_vector_and_layout_evolution(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "monitor.db")
+            monitor = Monitor(db_path=path)
+            metrics = {'stars': 120, 'forks': 7, 'watchers': 120, 'contributors': 4,
+                       'commits': 980, 'issues': 3, 'views_last_14d': 45000,
+                       'clones_last_14d': 0, 'has_readme': True, 'has_license': False}
+            monitor.save_many([("username/repo", metrics, 61.5)], ts=int(time.time()) - 60)
+            # A metric the layout does not know yet adds a new layout version
+            monitor.save_current_metrics("username/repo", {**metrics, 'releases': 2}, 62.0)
+            history = monitor.get_historical_data("username/repo", days_back=1, resolution=1)
+            monitor.close()
+
+            # Older snapshots still decode with the layout they were written with
+            self.assertEqual({k: history[0][k] for k in metrics}, metrics)
+            self.assertNotIn('releases', history[0])
+            self.assertEqual(history[1]['releases'], 2)
+            self.assertIs(history[1]['has_readme'], True)
+            conn = sqlite3.connect(path)
+            versions = [v for v, in conn.execute("SELECT version FROM metric_layouts ORDER BY version")]
+            conn.close()
+            self.assertEqual(versions, [1, 2])
+
+    def test_layout_versions_beyond_one_byte(self):
+        layout = DEFAULT_LAYOUT + (("discussions", "int"),)
+        blob = pack({'stars': 5, 'forks': 1, 'discussions': 3}, 300, layout)
+        self.assertEqual(layout_version(blob), 300)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "monitor.db")
+            monitor = Monitor(db_path=path)
+            monitor.save_current_metrics("username/repo", {'stars': 5, 'forks': 1}, 50.0)
+            # Layout 300 written by another process; its first byte alone reads as 172
+            monitor._layouts = {1: DEFAULT_LAYOUT, 172: DEFAULT_LAYOUT}
+            conn = sqlite3.connect(path)
+            conn.execute("INSERT INTO metric_layouts (version, fields) VALUES (300, ?)", (json.dumps(layout),))
+            conn.execute("UPDATE metrics SET packed = ?", (blob,))
+            conn.commit()
+            conn.close()
+
+            history = monitor.get_historical_data("username/repo", days_back=1, resolution=1)
+            monitor.close()
+
+            self.assertEqual(history[0]['discussions'], 3)
+
+    def test_streaming_and_columnar_history(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            monitor = Monitor(db_path=os.path.join(tmp, "monitor.db"))
+            start = int(time.time()) - 3600
+            with monitor.session():
+                for i in range(25):
+                    metrics = {'stars': i, 'forks': 1, **({'watchers': i * 2} if i % 2 else {})}
+                    monitor.save_many([("username/repo", metrics, 40.0 + i)], ts=start + i * 60)
+
+            rows = list(monitor.iter_history("username/repo", days_back=1, resolution=1, chunk_size=4))
+            columns = monitor.get_history_columns("username/repo", days_back=1, resolution=1,
+                                                  metrics=("stars", "score", "watchers"))
+            monitor.close()
+
+            self.assertEqual(len(rows), 25)
+            self.assertEqual((rows[3].ts, rows[3].stars, rows[3].score), (start + 180, 3, 43.0))
+            self.assertEqual(columns['ts'].tolist(), [r.ts for r in rows])
+            self.assertEqual(columns['stars'].tolist(), list(range(25)))
+            self.assertEqual(columns['watchers'][1], 2.0)
+            self.assertTrue(columns['watchers'][2] != columns['watchers'][2])  # NaN: not recorded
+
+    def test_connection_per_thread(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            monitor = Monitor(db_path=os.path.join(tmp, "monitor.db"))
+            seen = []
+            worker = threading.Thread(target=lambda: seen.append(monitor._connection()))
+            worker.start()
+            worker.join()
+
+            self.assertIs(monitor._connection(), monitor._connection())
+            self.assertIsNot(seen[0], monitor._connection())
+            monitor.close()
+            self.assertEqual(monitor._connections, [])
+            monitor.save_current_metrics("username/repo", {'stars': 1, 'forks': 1}, 10.0)  # reopens
+            monitor.close()
+
+    def test_recreated_database_is_initialized_again(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "monitor.db")
+            Monitor(db_path=path).close()
+            for suffix in ("", "-wal", "-shm"):
+                if os.path.exists(path + suffix):
+                    os.remove(path + suffix)
+
+            monitor = Monitor(db_path=path)
+            monitor.save_current_metrics("username/repo", {'stars': 1, 'forks': 1}, 10.0)
+            self.assertEqual(len(monitor.get_historical_data("username/repo", days_back=1)), 1)
+            monitor.close()
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,61 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from src.seo_protocol import analytics, protocol
+from src.seo_protocol.charter import Charter
+from src.seo_protocol.protocol import SEOProtocol
+
+
+def analyzed(repo_names):
+    for i, repo_name in enumerate(repo_names):
+        if repo_name.endswith("broken"):
+            yield repo_name, {"error": "not found"}
+        else:
+            yield repo_name, {'metrics': {'stars': 10 + i, 'forks': 1}, 'score': 40.0 + i,
+                              'keywords': ['solidity'], 'suggested_keywords': ['defi']}
+
+
+class TestRunBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.tmp.name)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def test_charts_and_trends_are_computed_per_group(self):
+        repos = [f"username/repo{i}" for i in range(5)] + ["username/broken"]
+        runner = SEOProtocol(None, "dummy_token", http_cache_path=None, chart_format="svg", chart_cache_dir=None)
+        render_many = Charter.render_many
+        calls = []
+
+        def spy(charter, histories, max_workers=None, pool=None):
+            calls.append((list(histories), pool))
+            return render_many(charter, histories, max_workers, pool)
+
+        with patch.object(protocol, "CHART_BATCH", 2), \
+                patch.object(protocol.SEOAnalyzer, "analyze_many", side_effect=lambda token, names, *a, **kw: analyzed(names)), \
+                patch.object(Charter, "render_many", spy), \
+                patch.object(analytics, "fleet_trends", wraps=analytics.fleet_trends) as fleet_trends, \
+                patch.object(analytics, "repo_trends") as repo_trends, \
+                patch.object(runner.monitor, "compact", wraps=runner.monitor.compact) as compact:
+            written = runner.run_batch(repos, output_format="md")
+            runner.run_batch(repos[:1], output_format="json")
+
+        self.assertEqual(calls, [(repos[0:2], None), (repos[2:4], None), (repos[4:5], None)])
+        # Trends are computed for each group at once, not per repository
+        self.assertEqual([c.args[1] for c in fleet_trends.call_args_list],
+                         [repos[0:2], repos[2:4], repos[4:5], repos[:1]])
+        repo_trends.assert_not_called()
+        self.assertEqual(compact.call_count, 2)                 # retention is applied after every run
+        self.assertEqual(runner.monitor._connections, [])     # the batch's connections are closed
+        self.assertIsNone(written["username/broken"])
+        self.assertTrue(os.path.exists(written["username/repo4"]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+import requests
+from src.seo_protocol.rate_limit import RateLimitAdapter, RateLimitScheduler
+
+class SecondaryLimitHandler(BaseHTTPRequestHandler):
+    """Rejects the first request with a secondary rate limit, then succeeds."""
+    calls = 0
+
+    def do_GET(self):
+        type(self).calls += 1
+        if self.calls == 1:
+            body = b'{"message": "You have exceeded a secondary rate limit."}'
+            self.send_response(403)
+            self.send_header("Retry-After", "0")
+        else:
+            body = b'{"stargazers_count": 100}'
+            self.send_response(200)
+            self.send_header("X-RateLimit-Remaining", "4999")
+            self.send_header("X-RateLimit-Reset", str(int(time.time()) + 3600))
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+class TestRateLimitScheduler(unittest.TestCase):
+
+    def test_exhausted_quota_blocks_until_reset(self):
+        scheduler = RateLimitScheduler()
+        reset = time.time() + 0.3
+        scheduler.observe("core", 200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(reset)})
+
+        start = time.time()
+        scheduler.acquire("core")
+        self.assertGreaterEqual(time.time(), reset)
+        self.assertLess(time.time() - start, 2)
+
+    def test_pacing_follows_remaining_quota(self):
+        scheduler = RateLimitScheduler(burst=1)
+        # 20 requests left for the next second → roughly one every 50ms
+        scheduler.observe("core", 200, {"X-RateLimit-Remaining": "20",
+                                        "X-RateLimit-Reset": str(time.time() + 1)})
+        start = time.time()
+        for _ in range(5):
+            scheduler.acquire("core")
+        elapsed = time.time() - start
+        self.assertGreater(elapsed, 0.15)
+        self.assertLess(elapsed, 1.0)
+
+    def test_small_batch_with_plenty_of_quota_is_not_paced(self):
+        scheduler = RateLimitScheduler()
+        scheduler.observe("core", 200, {"X-RateLimit-Remaining": "4000",
+                                        "X-RateLimit-Reset": str(time.time() + 3600)})
+        start = time.time()
+        for _ in range(200):
+            scheduler.acquire("core")
+        self.assertLess(time.time() - start, 0.1)
+        self.assertEqual(scheduler.stats()["core_remaining"], 3800)
+
+    def test_paced_after_secondary_limit(self):
+        scheduler = RateLimitScheduler(requests_per_hour=36000, burst=1)   # 10/s while cautious
+        scheduler.observe("core", 403, {"Retry-After": "0"}, b"secondary rate limit")
+        scheduler.acquire("core")       # waits out the jittered pause
+        start = time.time()
+        for _ in range(3):
+            scheduler.acquire("core")
+        self.assertGreater(time.time() - start, 0.15)
+
+    def test_graphql_has_its_own_bucket(self):
+        self.assertEqual(RateLimitScheduler.resource_for("https://api.github.com/graphql"), "graphql")
+        self.assertEqual(RateLimitScheduler.resource_for("https://api.github.com/repos/a/b"), "core")
+
+    def test_adapter_retries_secondary_rate_limit(self):
+        SecondaryLimitHandler.calls = 0
+        server = HTTPServer(("127.0.0.1", 0), SecondaryLimitHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        scheduler = RateLimitScheduler()
+        session = requests.Session()
+        session.mount("http://", RateLimitAdapter(scheduler))
+        response = session.get(f"http://127.0.0.1:{server.server_port}/repos/username/repo")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(SecondaryLimitHandler.calls, 2)
+        self.assertEqual(scheduler.stats(), {"throttle_waits": 1, "core_remaining": 4999})
+
+if __name__ == '__main__':
+    unittest.main()
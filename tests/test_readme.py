@@ -0,0 +1,128 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+from src.seo_protocol.github_api import GitHubAPI
+from src.seo_protocol.monitor import Monitor
+from src.seo_protocol.readme import analyze_readme, keywords_key
+from src.seo_protocol.seo_booster import SEOBooster
+
+README = """\
+# Solkit [![Build](https://img.shields.io/badge/build-passing-green.svg)](https://ci.example.com)
+
+A Solidity toolkit for smart-contract auditing. See the [docs](https://docs.example.com).
+
+Installation
+------------
+
+```bash
+pip install solkit  # solidity in a code block is not counted
+```
+
+## Usage
+
+- scan contracts
+- report findings
+
+| Option | Meaning |
+| ------ | ------- |
+| -v     | verbose |
+
+![screenshot](docs/screen.png)
+"""
+
+
+class TestReadme(unittest.TestCase):
+
+    def test_analyze_readme(self):
+        stats = analyze_readme(README.splitlines(keepends=True), ["solidity", "Auditing", "defi"])
+        self.assertEqual(stats["headings"], {"h1": 1, "h2": 2, "h3": 0})
+        self.assertEqual(stats["code_blocks"], 1)
+        self.assertEqual(stats["badges"], 1)
+        self.assertEqual(stats["images"], 1)
+        self.assertEqual(stats["links"], 2)
+        self.assertEqual(stats["list_items"], 2)
+        self.assertEqual(stats["tables"], 1)
+        self.assertEqual(stats["keyword_hits"], {"auditing": 1, "defi": 0, "solidity": 1})
+        self.assertGreater(stats["keyword_density"], 0)
+        self.assertEqual(stats["terms"]["toolkit"], 1)
+        self.assertNotIn("the", stats["terms"])
+        self.assertNotIn("pip", stats["terms"])         # only in the code block
+
+    def test_keywords_key_ignores_order_and_case(self):
+        self.assertEqual(keywords_key(["Web3", "defi"]), keywords_key(["defi", "web3"]))
+        self.assertNotEqual(keywords_key(["defi"]), keywords_key(["web3"]))
+
+
+class TestReadmeCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.monitor = Monitor(os.path.join(self.tmp.name, "monitor.db"))
+        self.repo = MagicMock()
+        self.repo.get_readme.return_value = MagicMock(sha="sha1", decoded_content=README.encode("utf-8"))
+        client = MagicMock()
+        client.get_repo.return_value = self.repo
+        self.make_api = lambda: GitHubAPI("token", "user/solkit", client=client, lazy=True)
+
+    def tearDown(self):
+        self.monitor.close()
+        self.tmp.cleanup()
+
+    def test_unchanged_sha_is_not_downloaded_again(self):
+        first = self.make_api().readme_stats(["solidity"], sha="sha1", cache=self.monitor)
+        self.assertEqual(self.repo.get_readme.call_count, 1)
+
+        second = self.make_api().readme_stats(["solidity"], sha="sha1", cache=self.monitor)
+        self.assertEqual(second, first)
+        self.assertEqual(self.repo.get_readme.call_count, 1)
+        self.assertEqual(self.monitor.readme_cache_stats(), {"reused": 1, "parsed": 1})
+
+        # New keywords are counted on the cached blob's next parse
+        self.make_api().readme_stats(["defi"], sha="sha1", cache=self.monitor)
+        self.assertEqual(self.repo.get_readme.call_count, 2)
+
+    def test_cache_table_added_to_older_databases(self):
+        path = os.path.join(self.tmp.name, "v2.db")
+        Monitor(path).close()
+        conn = sqlite3.connect(path)
+        conn.execute("DROP TABLE readme_cache")            # as created before README statistics
+        conn.execute("PRAGMA user_version = 2")
+        conn.commit()
+        conn.close()
+        monitor = Monitor(path)
+        self.make_api().readme_stats(["solidity"], sha="sha1", cache=monitor)
+        self.make_api().readme_stats(["solidity"], sha="sha1", cache=monitor)
+        self.assertEqual(monitor.readme_cache_stats(), {"reused": 1, "parsed": 1})
+        monitor.close()
+
+    def test_missing_readme(self):
+        from github import UnknownObjectException
+        self.repo.get_readme.side_effect = UnknownObjectException(404, {}, {})
+        api = self.make_api()
+        self.assertIsNone(api.readme_stats(["solidity"], cache=self.monitor))
+        self.assertIsNone(api.readme())
+
+
+class TestReadmeSuggestions(unittest.TestCase):
+
+    def test_suggestions_name_what_is_missing(self):
+        stats = analyze_readme(["Solkit", "", "Some text about contracts."], ["solidity"])
+        tips = SEOBooster._readme_suggestions(stats, ["solidity"])
+        joined = "\n".join(tips)
+        self.assertIn("H1 title", joined)
+        self.assertIn("code example", joined)
+        self.assertIn("badges", joined)
+        self.assertIn("solidity never appear", joined)
+
+    def test_complete_readme(self):
+        stats = {"words": 800, "headings": {"h1": 1, "h2": 5, "h3": 2}, "code_blocks": 3,
+                 "badges": 2, "links": 10, "keyword_density": 0.02, "keyword_hits": {"solidity": 16}}
+        tips = SEOBooster._readme_suggestions(stats, ["solidity"])
+        self.assertEqual(len(tips), 1)
+        self.assertIn("looks complete", tips[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
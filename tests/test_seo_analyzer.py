@@ -1,6 +1,6 @@
 # tests/test_seo_analyzer.py
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 from src.seo_protocol.seo_analyzer import SEOAnalyzer
 
 class TestSEOAnalyzer(unittest.TestCase):
@@ -27,6 +27,30 @@ class TestSEOAnalyzer(unittest.TestCase):
         # Check if the score is calculated correctly
         self.assertEqual(score, 71.2)
 
+    @patch('src.seo_protocol.seo_analyzer.GitHubAPI')
+    def test_compute_visibility_scores_matches_scalar(self, MockAPI):
+        import numpy as np
+        rng = np.random.default_rng(7)
+        rows = 2000
+        table = {name: rng.integers(0, 3000, rows) for name in
+                 ('stars', 'forks', 'watchers', 'commits', 'issues',
+                  'views_last_14d', 'clones_last_14d', 'contributors')}
+        table['keyword_count'] = rng.integers(0, 15, rows)
+        table['has_readme'] = rng.random(rows) < 0.5
+        table['has_license'] = rng.random(rows) < 0.5
+        weights = {'engagement': 0.4, 'structure': 0.1}
+
+        analyzer = SEOAnalyzer('dummy_token', 'username/repo')
+        scores = SEOAnalyzer.compute_visibility_scores(table, weights)
+        for i in range(rows):
+            metrics = {name: table[name][i].item() for name in table}
+            keywords = ['kw'] * metrics['keyword_count']
+            self.assertEqual(scores[i], analyzer.compute_visibility_score(metrics, keywords, weights))
+
+        # Missing columns count as zero
+        partial = SEOAnalyzer.compute_visibility_scores({'stars': np.array([300]), 'has_readme': np.array([True])})
+        self.assertEqual(partial.tolist(), [3.05])
+
     def test_analyze(self):
         # Mock the GitHubAPI object
         mock_api = MagicMock()
@@ -42,7 +66,7 @@ class TestSEOAnalyzer(unittest.TestCase):
             'has_readme': True,
             'has_license': True
         }
-        mock_api.extract_keywords.return_value = (['blockchain', 'ethereum', 'solidity'], {'defi'})
+        mock_api.extract_keywords.return_value = (['blockchain', 'ethereum', 'solidity'], ['defi'])
 
         analyzer = SEOAnalyzer('dummy_token', 'username/repo')
         result = analyzer.analyze()
@@ -52,5 +76,83 @@ class TestSEOAnalyzer(unittest.TestCase):
         self.assertIn('keywords', result)
         self.assertIn('suggested_keywords', result)
 
+    @patch('src.seo_protocol.seo_analyzer.GitHubAPI')
+    def test_analyze_with_prefetched_graphql_record(self, MockAPI):
+        mock_api = MockAPI.return_value
+        mock_api.fetch_metrics.return_value = {'stars': 100}
+        mock_api.extract_keywords.return_value = (['solidity'], ['defi'])
+        prefetched = {'metrics': {'stars': 100}, 'description': 'Solidity toolkit',
+                      'topics': ['solidity'], 'pushed_at': '2025-03-01T00:00:00Z'}
+
+        analyzer = SEOAnalyzer('dummy_token', 'username/repo', lazy=True)
+        analyzer.analyze(prefetched)
+
+        mock_api.fetch_metrics.assert_called_once_with(known={'stars': 100},
+                                                       pushed_at='2025-03-01T00:00:00Z')
+        mock_api.extract_keywords.assert_called_once_with('Solidity toolkit', ['solidity'])
+
+    @patch('src.seo_protocol.seo_analyzer.GitHubAPI')
+    def test_incremental_analyze_reuses_unchanged_result(self, MockAPI):
+        import os
+        import tempfile
+        from src.seo_protocol.monitor import Monitor
+
+        mock_api = MockAPI.return_value
+        mock_api.tokenizer = 'simple'
+        mock_api.fetch_metrics.return_value = {'stars': 100, 'forks': 5}
+        mock_api.repo.description = 'Solidity toolkit'
+        mock_api.repo.get_topics.return_value = ['solidity']
+        mock_api.extract_keywords.return_value = (['solidity', 'toolkit'], ['defi'])
+
+        with tempfile.TemporaryDirectory() as tmp:
+            monitor = Monitor(os.path.join(tmp, 'monitor.db'))
+            analyzer = SEOAnalyzer('dummy_token', 'username/repo')
+
+            first = analyzer.analyze(monitor=monitor)
+            second = analyzer.analyze(monitor=monitor)
+            self.assertEqual(first, second)
+            mock_api.extract_keywords.assert_called_once_with('Solidity toolkit', ['solidity'])
+
+            # Any changed input invalidates the stored result
+            mock_api.fetch_metrics.return_value = {'stars': 101, 'forks': 5}
+            third = analyzer.analyze(monitor=monitor)
+            self.assertEqual(mock_api.extract_keywords.call_count, 2)
+            self.assertEqual(third['metrics']['stars'], 101)
+            self.assertEqual(monitor.analysis_stats(), {'reused': 1, 'recomputed': 2})
+
+    @patch('src.seo_protocol.seo_analyzer.SharedGitHubClient')
+    @patch('src.seo_protocol.seo_analyzer.GitHubAPI')
+    def test_analyze_many(self, MockAPI, MockShared):
+        def make_api(token, repo_name, client=None, lazy=False, trends=None):
+            if repo_name == 'username/missing':
+                raise ValueError(f"Invalid repository or token: {repo_name}")
+            api = MagicMock()
+            api.fetch_metrics.return_value = {'stars': len(repo_name)}
+            api.extract_keywords.return_value = (['blockchain'], ['defi'])
+            return api
+        MockAPI.side_effect = make_api
+
+        names = [f'username/repo{i}' for i in range(10)] + ['username/missing']
+        results = dict(SEOAnalyzer.analyze_many('dummy_token', iter(names), max_workers=3,
+                                                    use_graphql=False))
+
+        self.assertEqual(set(results), set(names))
+        self.assertEqual(results['username/repo1']['metrics'], {'stars': 14})
+        self.assertIn('error', results['username/missing'])
+        MockShared.assert_called_once()
+
+    @patch('src.seo_protocol.seo_analyzer.GraphQLMetricsFetcher')
+    @patch('src.seo_protocol.seo_analyzer.GitHubAPI')
+    def test_analyze_many_queries_graphql_of_the_client_host(self, MockAPI, MockFetcher):
+        MockAPI.return_value.fetch_metrics.return_value = {'stars': 1}
+        MockAPI.return_value.extract_keywords.return_value = (['blockchain'], ['defi'])
+        MockFetcher.return_value.batch_size = 50
+        MockFetcher.return_value.fetch.return_value = {'username/repo': None}
+        client = MagicMock(token='dummy_token', base_url='https://ghe.example.com/api/v3')
+
+        list(SEOAnalyzer.analyze_many('dummy_token', ['username/repo'], client=client))
+
+        self.assertEqual(MockFetcher.call_args.args[1], 'https://ghe.example.com/api/graphql')
+
 if __name__ == '__main__':
     unittest.main()
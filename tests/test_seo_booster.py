@@ -1,12 +1,13 @@
 # tests/test_seo_booster.py
+import sys
 import unittest
 from src.seo_protocol.seo_booster import SEOBooster
 from unittest.mock import patch
 
 class TestSEOBooster(unittest.TestCase):
 
-    @patch('src.seo_protocol.seo_booster.ServiceAccountCredentials')
-    @patch('src.seo_protocol.seo_booster.build')
+    @patch('oauth2client.service_account.ServiceAccountCredentials')
+    @patch('googleapiclient.discovery.build')
     def test_get_improvement_suggestions(self, MockBuild, MockCredentials):
         """Test the improvement suggestions generated by the SEOBooster class."""
         booster = SEOBooster('https://github.com/username/repo', google_service_json=None)
@@ -24,8 +25,21 @@ class TestSEOBooster(unittest.TestCase):
         self.assertIn("Make README more discoverable", suggestions[2])
         self.assertIn("Consider adding trending keywords: defi, nft", suggestions[4])
 
-    @patch('src.seo_protocol.seo_booster.ServiceAccountCredentials')
-    @patch('src.seo_protocol.seo_booster.build')
+    def test_cohort_suggestion(self):
+        booster = SEOBooster('https://github.com/username/repo', google_service_json=None)
+        peers = [{"repo": f"peer/{i}", "similarity": 0.5, "score": 50.0 + i} for i in range(5)]
+        low = {"size": 20, "percentile": 10.0, "rank": 19, "median": 55.0, "peers": peers}
+
+        suggestions = booster.get_improvement_suggestions(['solidity'], [], 60, cohort=low)
+        self.assertIn("10th percentile of 20, median 55.0) → compare with peer/4 (54.0), peer/3 (53.0)",
+                      suggestions[-1])
+
+        for cohort in ({**low, "percentile": 60.0}, {**low, "size": 3}, None):
+            suggestions = booster.get_improvement_suggestions(['solidity'], [], 60, cohort=cohort)
+            self.assertFalse(any("similar repositories" in s for s in suggestions))
+
+    @patch('oauth2client.service_account.ServiceAccountCredentials')
+    @patch('googleapiclient.discovery.build')
     def test_try_submit_urls_to_google(self, MockBuild, MockCredentials):
         """Test submitting the repo URL to Google Indexing API (mocked)."""
         booster = SEOBooster('https://github.com/username/repo', google_service_json=None)
@@ -41,5 +55,31 @@ class TestSEOBooster(unittest.TestCase):
         # Ensure the Google API is called
         MockBuild.return_value.urlNotifications.return_value.publish.return_value.execute.assert_called_once()
 
+    def test_submission_skipped_without_google_client(self):
+        booster = SEOBooster('https://github.com/username/repo', google_service_json='service.json')
+        with patch.dict(sys.modules, {'googleapiclient.discovery': None}), \
+                self.assertLogs('src.seo_protocol.seo_booster', 'WARNING') as logs:
+            booster.try_submit_urls_to_google()
+        self.assertIn("Google API client not installed", logs.output[0])
+
+    def test_suggestions_use_trends(self):
+        booster = SEOBooster('https://github.com/username/repo')
+        trends = {
+            'stars': {'velocity_per_day': 0.0, 'anomalies': [{'date': '2025-05-02', 'zscore': 4.2}]},
+            'score': {'velocity_per_day': -1.5, 'forecast': [58.0, 52.0, 47.5], 'anomalies': []},
+        }
+
+        suggestions = booster.get_improvement_suggestions(['solidity'], ['defi'], 60, 50.0, trends)
+
+        self.assertIn("forecast to fall to 47.5 (< 50.0) within 3 days", suggestions[5])
+        self.assertIn("Consider adding trending keywords: defi", suggestions[6])
+        self.assertIn("Star growth has stalled", suggestions[7])
+        self.assertNotIn("ALERT", suggestions[7])
+        self.assertIn("Unusual jump in stars on 2025-05-02", suggestions[8])
+
+        declining = booster.get_improvement_suggestions(['solidity'], ['defi'], 60, 50.0,
+                                                        {'stars': {'velocity_per_day': -0.5, 'anomalies': []}})
+        self.assertTrue(any(s.startswith("**ALERT** Stars are declining (-0.50/day") for s in declining))
+
 if __name__ == '__main__':
     unittest.main()
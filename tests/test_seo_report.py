@@ -106,3 +106,118 @@ class SEOReport:
             suggestions=data['suggestions'],
             chart=chart_base64
         )
+
+
+import os
+import tempfile
+import unittest
+from src.seo_protocol import seo_report
+
+REPORT_DATA = {"repo": "owner/repo", "score": 42.5, "metrics": {"stars": 10, "has_readme": True},
+               "suggestions": ["ALERT: low score", "Add topics"], "metadata": {"http_cache": {"hits": 3}}}
+
+class TestStreamingReport(unittest.TestCase):
+
+    def test_stream_matches_generate(self):
+        report = seo_report.SEOReport()
+        for fmt in ("md", "html", "json"):
+            chunks = list(report.generate_stream(REPORT_DATA, fmt, "QUJD"))
+            if fmt != "json":  # encoded in one piece
+                self.assertGreater(len(chunks), 1)
+            self.assertEqual("".join(chunks), report.generate(REPORT_DATA, fmt, "QUJD"))
+
+        html = report.generate(REPORT_DATA, "html", "QUJD", "image/svg+xml")
+        self.assertIn('<li class="alert">ALERT: low score</li>', html)
+        self.assertIn("data:image/svg+xml;base64,QUJD", html)
+
+    def test_template_compiled_once(self):
+        first = seo_report.SEOReport()._template("report.html")
+        self.assertIs(seo_report.SEOReport()._template("report.html"), first)
+
+    def test_write_and_bytecode_cache(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            report = seo_report.SEOReport(bytecode_cache_dir=os.path.join(tmp, "bytecode"))
+            path = os.path.join(tmp, "report.html")
+            report.write(path, REPORT_DATA, "html")
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(f.read(), report.generate(REPORT_DATA, "html"))
+            self.assertTrue(os.listdir(os.path.join(tmp, "bytecode")))
+
+            report.write(path, {"repo": "owner/repo"}, "md")  # missing keys
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(f.read(), seo_report.SEOReport.ERROR_REPORT)
+            self.assertEqual(sorted(os.listdir(tmp)), ["bytecode", "report.html"])  # no .tmp left
+
+    def test_peer_comparison_section(self):
+        cohort = {"size": 12, "percentile": 75.0, "rank": 4, "median": 38.0,
+                  "peers": [{"repo": "owner/peer", "similarity": 0.81, "score": 51.0}]}
+        report = seo_report.SEOReport()
+        for fmt in ("md", "html"):
+            text = report.generate({**REPORT_DATA, "cohort": cohort}, fmt)
+            self.assertIn("Peer Comparison", text)
+            self.assertIn("Score percentile 75 among 12 similar repositories (rank 4, median score 38.0)", text)
+            self.assertIn("owner/peer: score 51.0, similarity 0.81", text)
+            self.assertNotIn("Peer Comparison", report.generate(REPORT_DATA, fmt))
+
+class TestFleetReport(unittest.TestCase):
+
+    def rows(self, count):
+        for i in range(count):
+            data = {**REPORT_DATA, "repo": f"owner/repo{i}", "score": float(i),
+                    "suggestions": ["ALERT: low score"] * (i % 2) + ["Add topics", "Add a license", "More"],
+                    "cohort": {"percentile": 50.0 * i} if i else None}
+            history = [{"stars": 5, "score": 0.0}, {"stars": 10, "score": float(i)}]
+            yield seo_report.fleet_row(data, history)
+
+    def test_fleet_row(self):
+        row = next(self.rows(1))
+        self.assertEqual(row["stars_delta"], 5)
+        self.assertEqual(row["score_delta"], 0.0)
+        self.assertEqual(len(row["suggestions"]), 3)
+        self.assertEqual(row["stars_series"], [5, 10])
+        self.assertIsNone(row["percentile"])
+
+    def test_html_pages_stream_rows(self):
+        consumed = []
+
+        def tracked(rows):
+            for row in rows:
+                consumed.append(row["repo"])
+                yield row
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "fleet.html")
+            paths = seo_report.SEOReport().write_fleet(tracked(self.rows(5)), path, page_size=2)
+
+            self.assertEqual([os.path.basename(p) for p in paths], ["fleet.html", "fleet_2.html", "fleet_3.html"])
+            with open(paths[0], encoding="utf-8") as f:
+                first = f.read()
+            with open(paths[2], encoding="utf-8") as f:
+                last = f.read()
+        self.assertEqual(len(consumed), 5)
+        self.assertIn('href="fleet_2.html"', first)
+        self.assertIn("owner/repo1", first)
+        self.assertNotIn("owner/repo2", first)
+        self.assertNotIn("Fleet Summary", first)
+        self.assertIn('href="fleet_2.html">← Previous', last)
+        self.assertIn("Repositories 5–5 of 5", last)
+        self.assertIn("Average score: 2.0", last)
+        self.assertIn("Repositories with alerts: 2", last)
+        self.assertIn("<svg", last)
+
+    def test_markdown_and_jsonl(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            md, jsonl = os.path.join(tmp, "fleet.md"), os.path.join(tmp, "fleet.jsonl")
+            seo_report.SEOReport().write_fleet(self.rows(3), md, "md")
+            seo_report.SEOReport().write_fleet(self.rows(3), jsonl, "jsonl")
+            with open(md, encoding="utf-8") as f:
+                table = f.read()
+            with open(jsonl, encoding="utf-8") as f:
+                lines = [json.loads(line) for line in f]
+
+        self.assertIn("| owner/repo2 | 2.0 | +2.0 | 100 | 10 | +5 | ▁█ |", table)
+        self.assertIn("| owner/repo0 | 0.0 | +0.0 | – | 10 | +5 | ▁█ |", table)
+        self.assertIn("- Stars gained: +15", table)
+        self.assertEqual([line["repo"] for line in lines], ["owner/repo0", "owner/repo1", "owner/repo2"])
+        with self.assertRaises(ValueError):
+            seo_report.SEOReport().write_fleet([], "fleet.pdf", "pdf")
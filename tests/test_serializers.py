@@ -0,0 +1,65 @@
+import unittest
+from datetime import date, datetime, timezone
+from unittest.mock import patch
+import numpy as np
+from src.seo_protocol import serializers
+from src.seo_protocol.seo_report import SEOReport
+
+RESULT = {
+    "repo": "owner/repo",
+    "score": 61.25,
+    "keywords": ["solidity", "defi"],
+    "suggested": {"web3", "ai", "blockchain"},
+    "scanned_at": datetime(2025, 3, 1, 12, 30, tzinfo=timezone.utc),
+    "day": date(2025, 3, 1),
+    "velocity": np.float64(1.5),
+    "forecast": np.array([10, 11]),
+    "metrics": {"stars": 120, "forks": -1, "big": 2 ** 40, "has_readme": True, "license": None},
+    "text": "naïve — ünïcode " * 5,
+}
+
+EXPECTED = {**RESULT, "suggested": ["ai", "blockchain", "web3"], "scanned_at": "2025-03-01T12:30:00+00:00",
+            "day": "2025-03-01", "velocity": 1.5, "forecast": [10, 11]}
+
+class TestSerializers(unittest.TestCase):
+
+    def test_round_trip_every_format(self):
+        for fmt in ("json", "msgpack"):
+            with self.subTest(fmt=fmt):
+                self.assertEqual(serializers.loads(serializers.dumps(RESULT, fmt), fmt), EXPECTED)
+
+    def test_backends_agree_with_fallbacks(self):
+        for pretty in (False, True):
+            self.assertEqual(serializers.dumps(RESULT, "json", pretty),
+                             serializers._stdlib_json_dumps(RESULT, pretty))
+        packed = serializers.dumps(RESULT, "msgpack")
+        self.assertEqual(serializers.msgpack_dumps(RESULT), packed)
+        self.assertEqual(serializers.msgpack_loads(packed), EXPECTED)
+
+        values = [0, 127, 128, -32, -33, 2 ** 16, -2 ** 31 - 1, 2 ** 64 - 1, -2 ** 63, 0.1,
+                  "x" * 31, "x" * 32, "x" * 70000, b"\x00" * 300, list(range(16)), {str(i): i for i in range(16)}]
+        for value in values:
+            self.assertEqual(serializers.msgpack_loads(serializers.msgpack_dumps(value)), value)
+
+    def test_fallbacks_without_optional_packages(self):
+        with patch.dict("sys.modules", {"orjson": None, "msgpack": None}):
+            self.assertEqual(serializers._json_serializer().backend, "json")
+            self.assertEqual(serializers._msgpack_serializer().backend, "python")
+
+    def test_register_and_unknown_format(self):
+        serializers.register(serializers.Serializer("repr", "txt", False, lambda obj, pretty=False: repr(obj).encode(),
+                                                    lambda data: data.decode(), "repr"))
+        self.addCleanup(serializers._registry.pop, "repr")
+        self.assertIn("repr", serializers.formats())
+        self.assertEqual(serializers.dumps([1], "repr"), b"[1]")
+        with self.assertRaises(ValueError):
+            serializers.get("yaml")
+
+    def test_report_formats(self):
+        report = SEOReport()
+        text = report.generate(RESULT, "json")
+        self.assertIn('"suggested": [\n    "ai",', text)
+        self.assertEqual(serializers.loads(report.generate(RESULT, "msgpack"), "msgpack"), EXPECTED)
+
+if __name__ == '__main__':
+    unittest.main()
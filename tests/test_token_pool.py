@@ -0,0 +1,68 @@
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+import requests
+from src.seo_protocol.rate_limit import RateLimitAdapter
+from src.seo_protocol.token_pool import TokenPool
+
+QUOTAS = {"Bearer token-aaaa-1111": 100, "Bearer token-bbbb-2222": 4000}
+
+class QuotaHandler(BaseHTTPRequestHandler):
+    """Reports a per-token remaining quota and records which token was used."""
+    seen = []
+
+    def do_GET(self):
+        auth = self.headers.get("Authorization")
+        self.seen.append(auth)
+        QUOTAS[auth] -= 1
+        self.send_response(200)
+        self.send_header("X-RateLimit-Remaining", str(QUOTAS[auth]))
+        self.send_header("X-RateLimit-Reset", str(int(time.time()) + 3600))
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, *args):
+        pass
+
+class TestTokenPool(unittest.TestCase):
+
+    def test_picks_token_with_most_headroom(self):
+        pool = TokenPool(["token-a", "token-b"])
+        reset = str(time.time() + 3600)
+        pool.observe("core", 200, {"X-RateLimit-Remaining": "10", "X-RateLimit-Reset": reset}, token="token-a")
+        pool.observe("core", 200, {"X-RateLimit-Remaining": "4000", "X-RateLimit-Reset": reset}, token="token-b")
+        self.assertEqual(pool.acquire("core"), "token-b")
+
+        # A throttled token is skipped even if it reported more quota
+        pool.observe("core", 403, {"Retry-After": "60"}, token="token-b")
+        self.assertEqual(pool.acquire("core"), "token-a")
+
+    def test_unknown_tokens_are_used_round_robin(self):
+        pool = TokenPool(["token-a", "token-b", "token-c"])
+        picked = [pool.acquire("core") for _ in range(6)]
+        self.assertEqual(sorted(picked), ["token-a", "token-a", "token-b", "token-b", "token-c", "token-c"])
+
+    def test_adapter_sends_each_request_with_pooled_token(self):
+        QuotaHandler.seen = []
+        server = HTTPServer(("127.0.0.1", 0), QuotaHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        pool = TokenPool(["token-aaaa-1111", "token-bbbb-2222"], burst=50)
+        session = requests.Session()
+        session.mount("http://", RateLimitAdapter(pool))
+        for _ in range(20):
+            session.get(f"http://127.0.0.1:{server.server_port}/repos/username/repo")
+
+        # After the first response of each token, the one with more quota takes the load
+        self.assertEqual(QuotaHandler.seen.count("Bearer token-aaaa-1111"), 1)
+        stats = pool.stats()
+        self.assertEqual(stats["token2"]["requests"], 19)
+        self.assertEqual(stats["token2"]["core_remaining"], 3981)
+        self.assertNotIn("2222", str(stats))                   # stats end up in published reports
+
+if __name__ == '__main__':
+    unittest.main()